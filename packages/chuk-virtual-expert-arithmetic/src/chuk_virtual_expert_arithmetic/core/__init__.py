@@ -20,6 +20,7 @@ from chuk_virtual_expert_arithmetic.core.constraints import ConstraintValidator
 from chuk_virtual_expert_arithmetic.core.contracts import (
     ContractValidationError,
     ContractValidator,
+    get_contract_validator,
 )
 from chuk_virtual_expert_arithmetic.core.domains import DomainSampler
 from chuk_virtual_expert_arithmetic.core.expression import (
@@ -70,6 +71,7 @@ __all__ = [
     # Contracts
     "ContractValidator",
     "ContractValidationError",
+    "get_contract_validator",
     # Transforms
     "TransformRegistry",
     "TransformError",
@@ -10,7 +10,11 @@ Usage:
 from __future__ import annotations
 
 import json
+from collections import ChainMap
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 
@@ -20,6 +24,18 @@ class CompositionError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _read_mixin(path: Path, mtime_ns: int) -> Mapping[str, Any]:
+    """Read a mixin file once per process.
+
+    Keyed on the file's modification time so an edited mixin is re-read.
+    The result is shared by every composer, so its top level is read-only.
+    """
+    with open(path) as f:
+        data: dict[str, Any] = json.load(f)
+    return MappingProxyType(data)
+
+
 class SchemaComposer:
     """Composes schemas by resolving inheritance and mixins.
 
@@ -85,6 +101,59 @@ class SchemaComposer:
 
         return result
 
+    def compose_lazy(self, schema: dict[str, Any]) -> ChainMap[str, Any]:
+        """Compose a schema as a layered view instead of a merged copy.
+
+        Returns a ChainMap over the schema's own values, its mixins and
+        its base, in priority order. Keys holding dicts in several layers
+        become nested ChainMaps, so lookups follow the same deep-merge
+        rules as compose() without copying any layer. Top-level writes go
+        to a fresh front dict; nested values are shared with the cached
+        mixins and bases, as in compose(), and must not be mutated.
+        The view can be passed straight to SchemaSpec(**view).
+
+        Args:
+            schema: Raw schema dict
+
+        Returns:
+            Read-through view equal in content to compose(schema)
+        """
+        original = {k: v for k, v in schema.items() if k not in ("extends", "mixins")}
+        layers: list[MutableMapping[str, Any]] = [original]
+
+        # Highest priority first: later mixins override earlier ones
+        for mixin_name in reversed(schema.get("mixins", [])):
+            layers.append(self._load_mixin(mixin_name))
+        if "extends" in schema:
+            layers.append(self._load_base(schema["extends"]))
+
+        return self._chain(layers)
+
+    @classmethod
+    def _chain(cls, layers: list[MutableMapping[str, Any]]) -> ChainMap[str, Any]:
+        """Layer mappings (highest priority first) with deep-merge lookup.
+
+        A key's dicts are chained together from the top layer down until a
+        layer holds a non-dict value for it, which hides everything below,
+        just as _merge_dicts() replaces a dict with a non-dict override.
+        """
+        stacked: dict[str, list[MutableMapping[str, Any]]] = {}
+        hidden: set[str] = set()
+
+        for layer in layers:
+            for key, value in layer.items():
+                if key in hidden:
+                    continue
+                if isinstance(value, dict):
+                    stacked.setdefault(key, []).append(value)
+                else:
+                    hidden.add(key)
+
+        front: dict[str, Any] = {
+            key: cls._chain(dicts) for key, dicts in stacked.items() if len(dicts) > 1
+        }
+        return ChainMap(front, *layers)
+
     def _load_mixin(self, name: str) -> dict[str, Any]:
         """Load a mixin by name."""
         if name in self._mixin_cache:
@@ -92,12 +161,15 @@ class SchemaComposer:
 
         # Try mixins directory
         path = self._schema_dir / "mixins" / f"{name}.json"
-        if path.exists():
-            mixin = self._read_json(path)
-            self._mixin_cache[name] = mixin
-            return mixin
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            raise CompositionError(f"Mixin not found: {name}") from None
 
-        raise CompositionError(f"Mixin not found: {name}")
+        # Shallow copy: merging never mutates its inputs
+        mixin = dict(_read_mixin(path, mtime_ns))
+        self._mixin_cache[name] = mixin
+        return mixin
 
     def _load_base(self, name: str) -> dict[str, Any]:
         """Load a base schema by name."""
@@ -136,27 +208,32 @@ class SchemaComposer:
 
         Override values take precedence. Dicts are deep merged.
         """
-        result = dict(base)
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                # Deep merge dicts
-                result[key] = self._merge_dicts(result[key], value)
-            else:
-                # Override with new value
-                result[key] = value
-
-        return result
+        return self._merge_dicts(base, override)
 
     def _merge_dicts(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-        """Deep merge two dicts."""
-        result = dict(base)
+        """Deep merge two dicts.
 
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_dicts(result[key], value)
-            else:
-                result[key] = value
+        Walks nested dicts with an explicit stack rather than recursion.
+        Only dicts present on both sides are copied; every other override
+        value is assigned as-is, and levels without nested dicts are merged
+        with a single update().
+        """
+        result = dict(base)
+        stack = [(result, override)]
+
+        while stack:
+            target, source = stack.pop()
+            # Dicts on both sides, captured before update() overwrites them
+            nested = [
+                (key, target[key], value)
+                for key, value in source.items()
+                if isinstance(value, dict) and isinstance(target.get(key), dict)
+            ]
+            target.update(source)
+            for key, existing, value in nested:
+                merged = dict(existing)
+                target[key] = merged
+                stack.append((merged, value))
 
         return result
 
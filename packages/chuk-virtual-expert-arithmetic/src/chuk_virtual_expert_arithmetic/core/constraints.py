@@ -10,14 +10,27 @@ Usage:
 
 from __future__ import annotations
 
+import keyword
 import logging
+import math
+import sys
 from collections.abc import Callable
 from typing import Any
 
-from chuk_virtual_expert_arithmetic.core.expression import ExpressionError, SafeEvaluator
+from chuk_virtual_expert_arithmetic.core.expr_cache import analyze
+from chuk_virtual_expert_arithmetic.core.expression import (
+    CompiledExpression,
+    ExpressionError,
+    SafeEvaluator,
+)
 
 logger = logging.getLogger(__name__)
 
+# Lowered constraint: (expression, compiled function or None, min, max, is bare name).
+# Bare names are read straight from the variables and carry no function;
+# any other entry without a function failed to parse.
+_PlanEntry = tuple[str, CompiledExpression | None, Any, Any, bool]
+
 
 class ConstraintValidator:
     """Validates and enforces constraints on generated variables.
@@ -44,7 +57,7 @@ class ConstraintValidator:
         self,
         constraints: dict[str, dict[str, Any]],
         variables: dict[str, Any],
-    ) -> tuple[bool, list[str]]:
+    ) -> tuple[bool, tuple[str, ...]]:
         """Check if all constraints are satisfied.
 
         Args:
@@ -52,37 +65,71 @@ class ConstraintValidator:
             variables: Current variable values
 
         Returns:
-            Tuple of (all_satisfied, list of violated constraint expressions)
+            Tuple of (all_satisfied, tuple of violated constraint expressions)
         """
-        violated = []
+        if not constraints:
+            return True, ()
 
-        for expr, bounds in constraints.items():
-            try:
-                value = self._evaluator.evaluate(expr, variables)
-                min_val = bounds.get("min", float("-inf"))
-                max_val = bounds.get("max", float("inf"))
+        return self._check_plan(self._lower(constraints), variables)
 
-                if not (min_val <= value <= max_val):
-                    violated.append(expr)
+    def check_batch(
+        self,
+        constraints: dict[str, dict[str, Any]],
+        rows: list[dict[str, Any]],
+    ) -> tuple[list[bool], bytearray]:
+        """Check many variable sets against the same constraints.
 
-            except ExpressionError:
-                # Expression error = constraint violated
-                violated.append(expr)
+        Expressions are parsed once for the whole batch. Violations are
+        reported as a flat row-major mask rather than a list per row:
+        ``mask[i * len(constraints) + j]`` is 1 when row i violates the
+        j-th constraint (in dict order).
+
+        Args:
+            constraints: Dict of expression -> {"min": ..., "max": ...}
+            rows: Variable values to check, one dict per row
 
-        return len(violated) == 0, violated
+        Returns:
+            Tuple of (per-row satisfied flags, violation mask)
+        """
+        plan = self._lower(constraints)
+        width = len(plan)
+        satisfied = [True] * len(rows)
+        mask = bytearray(len(rows) * width)
+        violates = self._violates  # bound once, not per cell
+
+        for i, variables in enumerate(rows):
+            offset = i * width
+            for j, entry in enumerate(plan):
+                if violates(entry, variables):
+                    mask[offset + j] = 1
+                    satisfied[i] = False
+
+        return satisfied, mask
 
     def apply(
         self,
         constraints: dict[str, dict[str, Any]],
         variables: dict[str, Any],
         regenerate: Callable[[], dict[str, Any]],
+        regenerate_vars: Callable[[frozenset[str]], dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Apply constraints, regenerating variables if needed.
 
+        The variables dict is checked as-is: it is never copied or wrapped,
+        so the evaluator reads a plain dict on every attempt.
+
+        When regenerate_vars is given, a failed attempt only redraws the
+        variables referenced by the violated constraints and keeps the rest,
+        instead of rejecting the whole assignment. Only pass it when those
+        variables are independent of the others (no derived values).
+
         Args:
             constraints: Dict of expression -> bounds
             variables: Initial variable values
-            regenerate: Function to call to regenerate variables
+            regenerate: Function returning a complete, fresh variables dict;
+                its result replaces the previous attempt's values wholesale
+            regenerate_vars: Optional function returning fresh values for
+                just the given variable names
 
         Returns:
             Variables that satisfy all constraints (or best effort after max_attempts)
@@ -90,25 +137,121 @@ class ConstraintValidator:
         if not constraints:
             return variables
 
+        # Parse expressions and resolve bounds once, not once per attempt
+        plan = self._lower(constraints)
+
         for _attempt in range(self._max_attempts):
-            satisfied, violated = self.check(constraints, variables)
+            satisfied, violated = self._check_plan(plan, variables)
             if satisfied:
                 return variables
 
-            # Regenerate and try again
-            variables = regenerate()
-
-        # Log warning and return best effort
-        _, still_violated = self.check(constraints, variables)
-        if still_violated:
-            logger.warning(
-                "Constraint validation failed after %d attempts. "
-                "Violated constraints: %s. Returning best effort.",
-                self._max_attempts,
-                still_violated,
-            )
+            if regenerate_vars is not None and (names := self._referenced_vars(violated)):
+                # Redraw only what the violated constraints depend on
+                variables = {**variables, **regenerate_vars(names)}
+            else:
+                # Regenerate and try again
+                variables = regenerate()
+
+        # Log warning and return best effort; the re-check only feeds the
+        # log message, so skip it entirely when warnings are disabled
+        if logger.isEnabledFor(logging.WARNING):
+            _, still_violated = self._check_plan(plan, variables)
+            if still_violated:
+                logger.warning(
+                    "Constraint validation failed after %d attempts. "
+                    "Violated constraints: %s. Returning best effort.",
+                    self._max_attempts,
+                    still_violated,
+                )
         return variables
 
+    @staticmethod
+    def _referenced_vars(violated: tuple[str, ...]) -> frozenset[str] | None:
+        """Collect the variables referenced by violated constraints.
+
+        Returns None when any violated expression cannot be parsed, since
+        its variables are unknown and only a full regeneration can help.
+        """
+        names: set[str] = set()
+        for expr in violated:
+            try:
+                names |= analyze(expr).free_vars
+            except SyntaxError:
+                return None
+        return frozenset(names)
+
+    def _lower(self, constraints: dict[str, dict[str, Any]]) -> list[_PlanEntry]:
+        """Lower a constraints dict into (expr, function, min, max, is_name) tuples.
+
+        Expressions are compiled to cached callables by the evaluator, so
+        checking them never re-parses or re-walks the AST. Expressions that
+        fail to parse get no function and always violate.
+        """
+        plan: list[_PlanEntry] = []
+
+        for expr, bounds in constraints.items():
+            function: CompiledExpression | None = None
+            is_name = expr.isidentifier() and not keyword.iskeyword(expr)
+            if not is_name:
+                try:
+                    function = self._evaluator.compile_function(expr)
+                except ExpressionError:
+                    pass
+            plan.append(
+                (
+                    sys.intern(expr),
+                    function,
+                    bounds.get("min", -math.inf),
+                    bounds.get("max", math.inf),
+                    is_name,
+                )
+            )
+
+        return plan
+
+    def _check_plan(
+        self,
+        plan: list[_PlanEntry],
+        variables: dict[str, Any],
+    ) -> tuple[bool, tuple[str, ...]]:
+        """Check a lowered constraint plan against variable values.
+
+        The violated list is only allocated once something fails; the
+        satisfied case returns the shared empty tuple.
+        """
+        violates = self._violates  # bound once, not per constraint
+        violated: list[str] | None = None
+
+        for entry in plan:
+            if violates(entry, variables):
+                if violated is None:
+                    violated = []
+                violated.append(entry[0])
+
+        if violated is None:
+            return True, ()
+        return False, tuple(violated)
+
+    def _violates(self, entry: _PlanEntry, variables: dict[str, Any]) -> bool:
+        """Check whether variables violate a single lowered constraint."""
+        expr, function, min_val, max_val, is_name = entry
+
+        if is_name:
+            # Bare variable name: read it directly; a missing one is violated
+            if expr not in variables:
+                return True
+            value = variables[expr]
+        elif function is None:
+            return True
+        else:
+            try:
+                value = function(variables)
+            except ExpressionError:
+                # Expression error = constraint violated
+                return True
+
+        return not (min_val <= value <= max_val)
+
     def validate_expressions(
         self,
         constraints: dict[str, dict[str, Any]],
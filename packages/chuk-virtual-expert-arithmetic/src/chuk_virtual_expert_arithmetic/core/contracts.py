@@ -13,6 +13,36 @@ import re
 from typing import Any
 
 from chuk_virtual_expert_arithmetic.models.schema_spec import SchemaSpec
+from chuk_virtual_expert_arithmetic.vocab import get_vocab
+
+# Template variables auto-generated by each vocab type
+_VOCAB_TYPE_DERIVED: dict[str, tuple[str, ...]] = {
+    "person_with_pronouns": (
+        "name",
+        "subject",
+        "subj",
+        "his_her",
+        "him_her",
+        "reflexive",
+        "verb_s",
+        "has_have",
+        "does_do",
+        "is_are",
+        "was_were",
+    ),
+}
+
+# Vocab key prefix for each derived type; the rest of the key is the variable suffix
+_VOCAB_TYPE_BASE: dict[str, str] = {
+    "person_with_pronouns": "person",
+}
+
+# Precomputed derived-variable sets for the common suffixes ("person", "person1".."person9")
+_VOCAB_TYPE_DERIVED_BY_SUFFIX: dict[tuple[str, str], frozenset[str]] = {
+    (vocab_type, suffix): frozenset(var + suffix for var in derived)
+    for vocab_type, derived in _VOCAB_TYPE_DERIVED.items()
+    for suffix in ("", *(str(i) for i in range(1, 10)))
+}
 
 
 class ContractValidationError(Exception):
@@ -40,6 +70,13 @@ class ContractValidator:
             vocab: Vocab instance to look up patterns
         """
         self._vocab = vocab
+        # (pattern, variant) -> required template vars, stored only for pairs
+        # that resolved to templates so validate_schema still reports misses.
+        # Reset by validate_all
+        self._pattern_req_cache: dict[tuple[str, str | None], frozenset[str]] = {}
+        # id(schema) -> (schema, provided vars); the schema is kept so its id
+        # cannot be reused while cached. Reset by validate_all
+        self._provided_cache: dict[int, tuple[SchemaSpec, frozenset[str]]] = {}
 
     def validate_schema(self, schema: SchemaSpec) -> list[str]:
         """Validate a schema against its pattern contract.
@@ -55,23 +92,29 @@ class ContractValidator:
         if not schema.pattern:
             return errors  # No pattern = no contract
 
-        # Get pattern data
-        pattern_data = self._vocab.get(f"patterns.{schema.pattern}")
-        if not pattern_data:
-            errors.append(f"Pattern '{schema.pattern}' not found")
-            return errors
-
-        # Get templates for the variant
-        templates = self._get_templates(pattern_data, schema.variant)
-        if not templates:
-            if schema.variant:
-                errors.append(f"Variant '{schema.variant}' not found in pattern '{schema.pattern}'")
-            else:
-                errors.append(f"No templates found in pattern '{schema.pattern}'")
-            return errors
-
-        # Extract required variables from all templates
-        required_vars = self._extract_template_vars(templates)
+        cache_key = (schema.pattern, schema.variant)
+        required_vars = self._pattern_req_cache.get(cache_key)
+        if required_vars is None:
+            # Get pattern data
+            pattern_data = self._vocab.get(f"patterns.{schema.pattern}")
+            if not pattern_data:
+                errors.append(f"Pattern '{schema.pattern}' not found")
+                return errors
+
+            # Get templates for the variant
+            templates = self._get_templates(pattern_data, schema.variant)
+            if not templates:
+                if schema.variant:
+                    errors.append(
+                        f"Variant '{schema.variant}' not found in pattern '{schema.pattern}'"
+                    )
+                else:
+                    errors.append(f"No templates found in pattern '{schema.pattern}'")
+                return errors
+
+            # Extract required variables from all templates
+            required_vars = self._extract_template_vars(templates)
+            self._pattern_req_cache[cache_key] = required_vars
 
         # Get provided variables from schema
         provided_vars = self._get_provided_vars(schema)
@@ -96,6 +139,9 @@ class ContractValidator:
             Dict of schema name -> list of errors (only includes schemas with errors)
         """
         all_errors: dict[str, list[str]] = {}
+        # Patterns and schemas may have changed since the last sweep
+        self._pattern_req_cache.clear()
+        self._provided_cache.clear()
 
         for name, schema in schemas.items():
             errors = self.validate_schema(schema)
@@ -106,40 +152,58 @@ class ContractValidator:
 
     def _get_templates(self, pattern_data: Any, variant: str | None) -> list[str]:
         """Extract template strings from pattern data."""
-        templates: list[str] = []
-
         if isinstance(pattern_data, list):
-            templates = [t for t in pattern_data if isinstance(t, str)]
-        elif isinstance(pattern_data, dict):
+            return [t for t in pattern_data if isinstance(t, str)]
+
+        if isinstance(pattern_data, dict):
             if "templates" in pattern_data:
-                raw_templates = pattern_data["templates"]
-            elif variant and variant in pattern_data:
-                raw_templates = pattern_data[variant]
-            else:
-                raw_templates = []
-
-            if isinstance(raw_templates, list):
-                for t in raw_templates:
-                    if isinstance(t, str):
-                        templates.append(t)
-                    elif isinstance(t, dict) and "text" in t:
-                        # Weighted template format
-                        templates.append(t["text"])
-
-        return templates
-
-    def _extract_template_vars(self, templates: list[str]) -> set[str]:
-        """Extract all template variable names from templates."""
+                return self._template_texts(pattern_data["templates"])
+            if variant and variant in pattern_data:
+                return self._template_texts(pattern_data[variant])
+
+        return []
+
+    @staticmethod
+    def _template_texts(raw_templates: Any) -> list[str]:
+        """Extract text from a list of plain or weighted templates."""
+        if not isinstance(raw_templates, list):
+            return []
+
+        # Plain strings, or {"text": ..., "weight": ...} weighted templates
+        return [
+            t if isinstance(t, str) else t["text"]
+            for t in raw_templates
+            if isinstance(t, str) or (isinstance(t, dict) and "text" in t)
+        ]
+
+    def _extract_template_vars(self, templates: list[str]) -> frozenset[str]:
+        """Extract all template variable names from templates.
+
+        Returned frozen so results can be cached and shared safely.
+        """
         variables: set[str] = set()
 
         for template in templates:
             matches = self.TEMPLATE_VAR_PATTERN.findall(template)
             variables.update(matches)
 
-        return variables
+        return frozenset(variables)
+
+    def _get_provided_vars(self, schema: SchemaSpec) -> frozenset[str]:
+        """Get all variable names provided by the schema.
+
+        Cached per schema object until the next validate_all().
+        """
+        cached = self._provided_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        provided = self._compute_provided_vars(schema)
+        self._provided_cache[id(schema)] = (schema, provided)
+        return provided
 
-    def _get_provided_vars(self, schema: SchemaSpec) -> set[str]:
-        """Get all variable names provided by the schema."""
+    def _compute_provided_vars(self, schema: SchemaSpec) -> frozenset[str]:
+        """Collect the variable names a schema provides."""
         provided: set[str] = set()
 
         # From template_vars
@@ -150,38 +214,21 @@ class ContractValidator:
         if schema.variables:
             provided.update(schema.variables.keys())
 
-        # Auto-generated from person vocab
+        # Auto-generated from typed vocab (person_with_pronouns, ...)
         if schema.vocab:
             for name, spec in schema.vocab.items():
-                if spec.type == "person_with_pronouns":
-                    # These are auto-generated
-                    if name == "person":
-                        provided.update(
-                            [
-                                "name", "subject", "subj", "his_her",
-                                "him_her", "reflexive", "verb_s",
-                                "has_have", "does_do", "is_are", "was_were",
-                            ]
-                        )
-                    else:
-                        # personN variants
-                        suffix = name[6:] if name.startswith("person") else ""
-                        if suffix:
-                            provided.update(
-                                [
-                                    f"name{suffix}",
-                                    f"subject{suffix}",
-                                    f"subj{suffix}",
-                                    f"his_her{suffix}",
-                                    f"him_her{suffix}",
-                                    f"reflexive{suffix}",
-                                    f"verb_s{suffix}",
-                                    f"has_have{suffix}",
-                                    f"does_do{suffix}",
-                                    f"is_are{suffix}",
-                                    f"was_were{suffix}",
-                                ]
-                            )
+                vocab_type = spec.type or ""
+                derived = _VOCAB_TYPE_DERIVED.get(vocab_type)
+                if derived:
+                    # "person" -> name, "person2" -> name2, etc.
+                    base = _VOCAB_TYPE_BASE[vocab_type]
+                    if name.startswith(base):
+                        suffix = name[len(base) :]
+                        precomputed = _VOCAB_TYPE_DERIVED_BY_SUFFIX.get((vocab_type, suffix))
+                        if precomputed is not None:
+                            provided |= precomputed
+                        else:
+                            provided.update(var + suffix for var in derived)
 
                 # Path-based vocab items are added by name
                 if spec.path:
@@ -194,9 +241,11 @@ class ContractValidator:
         if schema.variables and "multiplier" in schema.variables:
             provided.update(["mult_word", "growth_word"])
 
-        return provided
+        return frozenset(provided)
 
-    def get_pattern_requirements(self, pattern_name: str, variant: str | None = None) -> set[str]:
+    def get_pattern_requirements(
+        self, pattern_name: str, variant: str | None = None
+    ) -> frozenset[str]:
         """Get all template variables required by a pattern.
 
         Args:
@@ -204,11 +253,72 @@ class ContractValidator:
             variant: Optional variant name
 
         Returns:
-            Set of required variable names
+            Frozen set of required variable names
         """
+        if variant:
+            return self._get_variant_requirements(pattern_name, variant)
+        return self._get_default_requirements(pattern_name)
+
+    def _get_default_requirements(self, pattern_name: str) -> frozenset[str]:
+        """Requirements for a pattern's default templates (no variant)."""
+        cache_key = (pattern_name, None)
+        cached = self._pattern_req_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        pattern_data = self._vocab.get(f"patterns.{pattern_name}")
+        if not pattern_data:
+            return frozenset()
+
+        if isinstance(pattern_data, dict):
+            templates = self._template_texts(pattern_data.get("templates"))
+        else:
+            templates = self._get_templates(pattern_data, None)
+
+        required = self._extract_template_vars(templates)
+        if templates:
+            self._pattern_req_cache[cache_key] = required
+        return required
+
+    def _get_variant_requirements(self, pattern_name: str, variant: str) -> frozenset[str]:
+        """Requirements for a named variant of a pattern."""
+        cache_key = (pattern_name, variant)
+        cached = self._pattern_req_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         pattern_data = self._vocab.get(f"patterns.{pattern_name}")
         if not pattern_data:
-            return set()
+            return frozenset()
 
         templates = self._get_templates(pattern_data, variant)
-        return self._extract_template_vars(templates)
+        required = self._extract_template_vars(templates)
+        if templates:
+            self._pattern_req_cache[cache_key] = required
+        return required
+
+
+# Shared validators, one per vocab; each holds its vocab, so ids stay unique
+_validators: dict[int, ContractValidator] = {}
+
+
+def get_contract_validator(vocab: Any | None = None) -> ContractValidator:
+    """Get the shared validator for a vocab.
+
+    Reusing one validator per vocab lets its pattern-requirement cache
+    carry over between callers instead of being rebuilt per instance.
+
+    Args:
+        vocab: Vocab instance to validate against (defaults to get_vocab())
+
+    Returns:
+        The ContractValidator for that vocab
+    """
+    if vocab is None:
+        vocab = get_vocab()
+
+    validator = _validators.get(id(vocab))
+    if validator is None or validator._vocab is not vocab:
+        validator = ContractValidator(vocab)
+        _validators[id(vocab)] = validator
+    return validator
@@ -14,11 +14,51 @@ Usage:
 from __future__ import annotations
 
 import random
+from dataclasses import dataclass
 from typing import Any
 
 from chuk_virtual_expert_arithmetic.core.transforms import pluralize, singularize
 
 
+@dataclass(frozen=True)
+class _DomainTable:
+    """Per-domain lookup table built once and reused by every sample."""
+
+    agent_templates: dict[str, Any]
+    agent_types: tuple[str, ...]
+    items: tuple[tuple[str, str], ...]  # (singular, plural)
+    verb: str
+    verb_plural: str
+    time_units: tuple[tuple[str, str], ...]  # (singular, plural)
+
+    @classmethod
+    def build(cls, domain: dict[str, Any]) -> _DomainTable:
+        """Resolve a raw domain dict into draw-ready tuples."""
+        items: list[tuple[str, str]] = []
+        for item in domain.get("items", []):
+            if isinstance(item, dict):
+                # New format: {"singular": "brick", "plural": "bricks"}
+                singular = item.get("singular", "item")
+                items.append((singular, item.get("plural", pluralize(singular))))
+            else:
+                # Legacy format: just a string (assumed plural)
+                items.append((singularize(item), item))
+
+        agent_templates = domain.get("agent_templates", {})
+        verbs = domain.get("verbs", {})
+        return cls(
+            agent_templates=agent_templates,
+            agent_types=tuple(agent_templates),
+            items=tuple(items),
+            verb=verbs.get("singular", "processes"),
+            verb_plural=verbs.get("plural", "process"),
+            time_units=tuple(
+                (t.get("singular", "hour"), t.get("plural", "hours"))
+                for t in domain.get("time_units", [])
+            ),
+        )
+
+
 class DomainSampler:
     """Samples vocabulary from domain bundles for semantic coherence.
 
@@ -36,6 +76,7 @@ class DomainSampler:
         """
         self._vocab = vocab
         self._rng = random.Random(seed)
+        self._tables: dict[str, _DomainTable | None] = {}
 
     def sample(self, domain_name: str) -> dict[str, Any]:
         """Sample a complete vocabulary context from a domain.
@@ -53,18 +94,23 @@ class DomainSampler:
             - time_unit: Time unit if applicable
             - domain: The domain name
         """
-        domain = self._vocab.get(f"domains.{domain_name}")
-        if not domain:
+        table = self._table(domain_name)
+        if table is None:
             return self._default_context()
 
         context: dict[str, Any] = {"domain": domain_name}
+        rng = self._rng
 
         # Sample agents (two for pair-based schemas like combined_rate)
-        agent_templates = domain.get("agent_templates", {})
+        agent_templates = table.agent_templates
         if agent_templates:
-            agent_type = self._rng.choice(list(agent_templates.keys()))
-            context["agent"] = self._sample_agent(agent_templates[agent_type])
-            context["agent2"] = self._sample_agent(agent_templates[agent_type])
+            agent_type = rng.choice(table.agent_types)
+            pair = self._sample_agent_pair(agent_templates[agent_type])
+            if pair is not None:
+                context["agent"], context["agent2"] = pair
+            else:
+                context["agent"] = self._sample_agent(agent_templates[agent_type])
+                context["agent2"] = self._sample_agent(agent_templates[agent_type])
             # Ensure agent2 is different from agent if possible
             for _ in range(5):
                 if context["agent2"] != context["agent"]:
@@ -72,7 +118,7 @@ class DomainSampler:
                 context["agent2"] = self._sample_agent(agent_templates[agent_type])
             # If still the same, try other agent types
             if context["agent2"] == context["agent"]:
-                other_types = [t for t in agent_templates if t != agent_type]
+                other_types = [t for t in table.agent_types if t != agent_type]
                 for alt_type in other_types:
                     candidate = self._sample_agent(agent_templates[alt_type])
                     if candidate != context["agent"]:
@@ -86,36 +132,32 @@ class DomainSampler:
             context["agent2"] = person2["name"]
             context["agent_type"] = "person"
 
-        # Sample item (supports both string and {singular, plural} formats)
-        items = domain.get("items", [])
-        if items:
-            item = self._rng.choice(items)
-            if isinstance(item, dict):
-                # New format: {"singular": "brick", "plural": "bricks"}
-                context["item"] = item.get("singular", "item")
-                context["item_plural"] = item.get("plural", pluralize(context["item"]))
-            else:
-                # Legacy format: just a string (assumed plural)
-                context["item"] = singularize(item)
-                context["item_plural"] = item
+        # Sample item; singular/plural forms were resolved when the table was built
+        if table.items:
+            context["item"], context["item_plural"] = rng.choice(table.items)
         else:
             context["item"] = "item"
             context["item_plural"] = "items"
 
-        # Get verbs
-        verbs = domain.get("verbs", {})
-        context["verb"] = verbs.get("singular", "processes")
-        context["verb_plural"] = verbs.get("plural", "process")
+        context["verb"] = table.verb
+        context["verb_plural"] = table.verb_plural
 
         # Sample time unit if available
-        time_units = domain.get("time_units", [])
-        if time_units:
-            time_unit = self._rng.choice(time_units)
-            context["time_unit"] = time_unit.get("singular", "hour")
-            context["time_unit_plural"] = time_unit.get("plural", "hours")
+        if table.time_units:
+            context["time_unit"], context["time_unit_plural"] = rng.choice(table.time_units)
 
         return context
 
+    def _table(self, domain_name: str) -> _DomainTable | None:
+        """Get the lookup table for a domain, building it on first use.
+
+        Returns None for unknown or empty domains.
+        """
+        if domain_name not in self._tables:
+            domain = self._vocab.get(f"domains.{domain_name}")
+            self._tables[domain_name] = _DomainTable.build(domain) if domain else None
+        return self._tables[domain_name]
+
     def _sample_agent(self, template: dict[str, Any]) -> str:
         """Sample an agent from a template."""
         pattern: str = str(template.get("pattern", "${name}"))
@@ -136,6 +178,30 @@ class DomainSampler:
 
         return pattern
 
+    def _sample_agent_pair(self, template: dict[str, Any]) -> tuple[str, str] | None:
+        """Sample two agents from a template with one draw without replacement.
+
+        Returns None when the template has no pool to draw two values from,
+        so the caller falls back to sampling agents one at a time.
+        """
+        pattern: str = str(template.get("pattern", "${name}"))
+
+        if "numbers" in template:
+            placeholder, pool = "${number}", template["numbers"]
+        elif "letters" in template:
+            placeholder, pool = "${letter}", template["letters"]
+        elif "source" in template:
+            placeholder, pool = "${name}", self._vocab.get(template["source"])
+        else:
+            return None
+
+        if not isinstance(pool, (list, tuple)) or len(pool) < 2:
+            return None
+        first, second = self._rng.sample(pool, 2)
+        if str(first) == str(second) or (placeholder == "${name}" and not (first and second)):
+            return None
+        return pattern.replace(placeholder, str(first)), pattern.replace(placeholder, str(second))
+
     def _default_context(self) -> dict[str, Any]:
         """Return a default context when domain not found."""
         person = self._vocab.person_with_pronouns()
@@ -0,0 +1,66 @@
+"""Shared parse cache for arithmetic expressions.
+
+Constraint checks, derived-variable computation and expression validation
+all work on the same small set of expression strings. Parsing each source
+once and sharing the result avoids repeated ast.parse calls.
+
+Usage:
+    info = analyze("a + b * 2")
+    info.node       # parsed expression body
+    info.free_vars  # frozenset({"a", "b"})
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class ExprInfo:
+    """Parse result for a single expression source string."""
+
+    node: ast.expr
+    free_vars: frozenset[str]
+
+
+@lru_cache(maxsize=4096)
+def analyze(source: str) -> ExprInfo:
+    """Parse an expression and collect the variable names it references.
+
+    Results are cached by source string; the returned node must not be mutated.
+
+    Args:
+        source: The expression to parse
+
+    Returns:
+        ExprInfo with the parsed body and its free variables
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+    """
+    node = ast.parse(source.strip(), mode="eval").body
+    return ExprInfo(node=node, free_vars=frozenset(collect_variables(node)))
+
+
+def collect_variables(node: ast.AST) -> set[str]:
+    """Extract all variable names referenced in an expression."""
+    variables: set[str] = set()
+
+    if isinstance(node, ast.Name):
+        variables.add(node.id)
+    elif isinstance(node, ast.BinOp):
+        variables.update(collect_variables(node.left))
+        variables.update(collect_variables(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        variables.update(collect_variables(node.operand))
+    elif isinstance(node, ast.Compare):
+        variables.update(collect_variables(node.left))
+        for comp in node.comparators:
+            variables.update(collect_variables(comp))
+    elif isinstance(node, ast.BoolOp):
+        for value in node.values:
+            variables.update(collect_variables(value))
+
+    return variables
@@ -13,8 +13,11 @@ from __future__ import annotations
 
 import ast
 import operator
+from collections.abc import Callable
 from typing import Any
 
+from chuk_virtual_expert_arithmetic.core.expr_cache import analyze, collect_variables
+
 
 class ExpressionError(Exception):
     """Raised when expression evaluation fails."""
@@ -22,6 +25,10 @@ class ExpressionError(Exception):
     pass
 
 
+# An expression compiled to a callable taking the variable context
+CompiledExpression = Callable[[dict[str, Any]], Any]
+
+
 class SafeEvaluator:
     """Evaluate arithmetic expressions safely without eval().
 
@@ -81,6 +88,7 @@ class SafeEvaluator:
             allow_comparisons: Whether to allow comparison operators (<, >, ==, etc.)
         """
         self._allow_comparisons = allow_comparisons
+        self._function_cache: dict[str, CompiledExpression] = {}
 
     def evaluate(self, expr: str, context: dict[str, Any] | None = None) -> float | int | bool:
         """Safely evaluate an arithmetic expression.
@@ -95,20 +103,176 @@ class SafeEvaluator:
         Raises:
             ExpressionError: If the expression is invalid or uses unsupported operations
         """
+        return self.evaluate_compiled(self.compile(expr), context, expr)
+
+    def compile(self, expr: str) -> ast.expr:
+        """Parse an expression once so it can be evaluated repeatedly.
+
+        Args:
+            expr: The expression to parse
+
+        Returns:
+            The parsed expression body, suitable for evaluate_compiled()
+
+        Raises:
+            ExpressionError: If the expression cannot be parsed
+        """
+        try:
+            return analyze(expr).node
+        except SyntaxError as e:
+            raise ExpressionError(f"Invalid expression syntax: {expr}") from e
+        except Exception as e:
+            raise ExpressionError(f"Error evaluating expression '{expr}': {e}") from e
+
+    def evaluate_compiled(
+        self,
+        node: ast.expr,
+        context: dict[str, Any] | None = None,
+        expr: str = "",
+    ) -> float | int | bool:
+        """Evaluate an expression previously parsed with compile().
+
+        Args:
+            node: Parsed expression body from compile()
+            context: Variable bindings
+            expr: Original source, used in error messages
+
+        Returns:
+            The result of the expression
+
+        Raises:
+            ExpressionError: If evaluation fails
+        """
         if context is None:
             context = {}
 
         try:
-            tree = ast.parse(expr.strip(), mode="eval")
-            result: float | int | bool = self._eval_node(tree.body, context)
+            result: float | int | bool = self._eval_node(node, context)
             return result
-        except SyntaxError as e:
-            raise ExpressionError(f"Invalid expression syntax: {expr}") from e
         except ExpressionError:
             raise
         except Exception as e:
             raise ExpressionError(f"Error evaluating expression '{expr}': {e}") from e
 
+    # Bound on compile_function()'s cache; expressions come from schemas,
+    # so this is only reached by callers generating expressions on the fly
+    FUNCTION_CACHE_SIZE = 4096
+
+    def compile_function(self, expr: str) -> CompiledExpression:
+        """Compile an expression into a reusable callable.
+
+        The AST is walked once to build a tree of closures, so repeated
+        evaluation skips the per-node type dispatch of evaluate(). The
+        callable raises ExpressionError in exactly the cases evaluate()
+        does. Results are cached per expression string.
+
+        Args:
+            expr: The expression to compile
+
+        Returns:
+            Callable taking a context dict and returning the expression value
+
+        Raises:
+            ExpressionError: If the expression cannot be parsed
+        """
+        cached = self._function_cache.get(expr)
+        if cached is not None:
+            return cached
+
+        body = self._build(self.compile(expr))
+
+        def function(context: dict[str, Any]) -> Any:
+            try:
+                return body(context)
+            except ExpressionError:
+                raise
+            except Exception as e:
+                raise ExpressionError(f"Error evaluating expression '{expr}': {e}") from e
+
+        if len(self._function_cache) >= self.FUNCTION_CACHE_SIZE:
+            self._function_cache.clear()
+        self._function_cache[expr] = function
+        return function
+
+    def _build(self, node: ast.AST) -> CompiledExpression:
+        """Build a closure equivalent to _eval_node() for a parsed node.
+
+        Unsupported nodes become closures that raise when reached, so errors
+        surface at evaluation time just as they do in _eval_node().
+        """
+        if isinstance(node, ast.Constant):
+            value = node.value
+            if isinstance(value, (int, float, bool)):
+                return lambda context: value
+            return _raiser(f"Unsupported constant type: {type(value)}")
+
+        if isinstance(node, ast.Name):
+            return _name_lookup(node.id)
+
+        if isinstance(node, ast.BinOp):
+            bin_op_type = type(node.op)
+            if bin_op_type not in self.BINARY_OPS:
+                return _raiser(f"Unsupported binary operator: {bin_op_type.__name__}")
+
+            op_func = self.BINARY_OPS[bin_op_type]
+            left_fn = self._build(node.left)
+            right_fn = self._build(node.right)
+
+            def binary(context: dict[str, Any]) -> Any:
+                left = left_fn(context)
+                right = right_fn(context)
+                try:
+                    return op_func(left, right)
+                except ZeroDivisionError as e:
+                    raise ExpressionError("Division by zero") from e
+
+            return binary
+
+        if isinstance(node, ast.UnaryOp):
+            unary_op_type = type(node.op)
+            if unary_op_type not in self.UNARY_OPS:
+                return _raiser(f"Unsupported unary operator: {unary_op_type.__name__}")
+
+            unary_func = self.UNARY_OPS[unary_op_type]
+            operand_fn = self._build(node.operand)
+            return lambda context: unary_func(operand_fn(context))
+
+        if isinstance(node, ast.Compare):
+            if not self._allow_comparisons:
+                return _raiser("Comparisons not allowed")
+
+            first_fn = self._build(node.left)
+            steps: list[tuple[Any, CompiledExpression, str]] = [
+                (self.COMPARE_OPS.get(type(op)), self._build(comparator), type(op).__name__)
+                for op, comparator in zip(node.ops, node.comparators, strict=True)
+            ]
+
+            def compare(context: dict[str, Any]) -> bool:
+                left = first_fn(context)
+                for cmp_func, right_fn, op_name in steps:
+                    if cmp_func is None:
+                        raise ExpressionError(f"Unsupported comparison: {op_name}")
+                    right = right_fn(context)
+                    if not cmp_func(left, right):
+                        return False
+                    left = right
+                return True
+
+            return compare
+
+        if isinstance(node, ast.BoolOp):
+            value_fns = [self._build(v) for v in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda context: all(fn(context) for fn in value_fns)
+            if isinstance(node.op, ast.Or):
+                return lambda context: any(fn(context) for fn in value_fns)
+            return _raiser(f"Unsupported boolean operator: {type(node.op).__name__}")
+
+        if isinstance(node, ast.Expression):
+            return self._build(node.body)
+
+        return _raiser(f"Unsupported expression type: {type(node).__name__}")
+
     def _eval_node(self, node: ast.AST, context: dict[str, Any]) -> Any:
         """Recursively evaluate an AST node."""
         # Numeric literals
@@ -198,8 +362,7 @@ class SafeEvaluator:
         errors: list[str] = []
 
         try:
-            tree = ast.parse(expr.strip(), mode="eval")
-            referenced_vars = self._extract_variables(tree.body)
+            referenced_vars = analyze(expr).free_vars
 
             if available_vars is not None:
                 unknown = referenced_vars - available_vars
@@ -213,24 +376,27 @@ class SafeEvaluator:
 
     def _extract_variables(self, node: ast.AST) -> set[str]:
         """Extract all variable names referenced in an expression."""
-        variables: set[str] = set()
+        return collect_variables(node)
 
-        if isinstance(node, ast.Name):
-            variables.add(node.id)
-        elif isinstance(node, ast.BinOp):
-            variables.update(self._extract_variables(node.left))
-            variables.update(self._extract_variables(node.right))
-        elif isinstance(node, ast.UnaryOp):
-            variables.update(self._extract_variables(node.operand))
-        elif isinstance(node, ast.Compare):
-            variables.update(self._extract_variables(node.left))
-            for comp in node.comparators:
-                variables.update(self._extract_variables(comp))
-        elif isinstance(node, ast.BoolOp):
-            for value in node.values:
-                variables.update(self._extract_variables(value))
-
-        return variables
+
+def _name_lookup(name: str) -> CompiledExpression:
+    """Build a closure reading one variable from the context."""
+
+    def lookup(context: dict[str, Any]) -> Any:
+        if name not in context:
+            raise ExpressionError(f"Unknown variable: {name}")
+        return context[name]
+
+    return lookup
+
+
+def _raiser(message: str) -> CompiledExpression:
+    """Build a closure that raises ExpressionError when evaluated."""
+
+    def fail(context: dict[str, Any]) -> Any:
+        raise ExpressionError(message)
+
+    return fail
 
 
 # Module-level convenience instance
@@ -62,6 +62,9 @@ class SchemaLoader:
         self._composer: SchemaComposer | None = None
         self._cache: dict[str, SchemaSpec] = {}
         self._raw_cache: dict[str, dict[str, Any]] = {}
+        # get_all() results keyed by the validate flag, and schema_names
+        self._all_cache: dict[bool, dict[str, SchemaSpec]] = {}
+        self._names_cache: list[str] | None = None
 
     def _get_composer(self) -> SchemaComposer:
         """Lazy-load the composer to avoid circular imports."""
@@ -163,7 +166,14 @@ class SchemaLoader:
 
         Returns:
             Dict of schema name -> SchemaSpec
+
+        The directory is only scanned once per validate flag; later calls
+        return a copy of the cached result until clear_cache() is called.
         """
+        cached = self._all_cache.get(validate)
+        if cached is not None:
+            return dict(cached)
+
         schemas: dict[str, SchemaSpec] = {}
 
         if not self._schema_dir.exists():
@@ -192,7 +202,8 @@ class SchemaLoader:
                         except (SchemaLoadError, SchemaValidationError):
                             pass
 
-        return schemas
+        self._all_cache[validate] = schemas
+        return dict(schemas)
 
     def get_all_raw(self) -> dict[str, dict[str, Any]]:
         """Load all schemas as raw dicts without validation.
@@ -231,12 +242,16 @@ class SchemaLoader:
     @property
     def schema_names(self) -> list[str]:
         """List all available schema names."""
-        return list(self.get_all_raw().keys())
+        if self._names_cache is None:
+            self._names_cache = list(self.get_all_raw().keys())
+        return list(self._names_cache)
 
     def clear_cache(self) -> None:
         """Clear all cached schemas."""
         self._cache.clear()
         self._raw_cache.clear()
+        self._all_cache.clear()
+        self._names_cache = None
 
     def exists(self, name: str) -> bool:
         """Check if a schema exists.
@@ -10,6 +10,7 @@ Usage:
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 from chuk_virtual_expert_arithmetic.core.transforms import TransformError, TransformRegistry
@@ -17,6 +18,48 @@ from chuk_virtual_expert_arithmetic.core.transforms import TransformError, Trans
 logger = logging.getLogger(__name__)
 
 
+# Person shortcuts as (template var, person field, default, capitalize).
+# Numbered people (person1, person2, ...) get the first four.
+_PersonShortcut = tuple[str, str, Any, bool]
+_PERSON_SHORTCUTS: tuple[_PersonShortcut, ...] = (
+    ("name", "name", None, False),
+    ("subject", "subject", None, False),
+    ("subj", "subject", "", True),
+    ("his_her", "possessive", None, False),
+    ("him_her", "object", None, False),
+    ("reflexive", "reflexive", None, False),
+    ("verb_s", "verb_s", "s", False),
+)
+_NUMBERED_PERSON_SHORTCUTS = _PERSON_SHORTCUTS[:4]
+
+
+@lru_cache(maxsize=64)
+def _person_shortcuts(key: str) -> tuple[_PersonShortcut, ...]:
+    """Shortcut table for a person vocab key, with its suffix applied.
+
+    "person" -> name, subject, ...; "person2" -> name2, subject2, ...
+    """
+    if key == "person":
+        return _PERSON_SHORTCUTS
+    suffix = key[6:]  # "1", "2", etc.
+    return tuple(
+        (f"{var}{suffix}", field, default, capitalize)
+        for var, field, default, capitalize in _NUMBERED_PERSON_SHORTCUTS
+    )
+
+
+@lru_cache(maxsize=2048)
+def _parse_spec(spec: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a template spec into its dot path and its transform chain.
+
+    "person.name|capitalize" -> (("person", "name"), ("capitalize",))
+
+    Specs are reused for every generated problem, so each is parsed once.
+    """
+    base, *transforms = spec.split("|")
+    return tuple(base.split(".")), tuple(transforms)
+
+
 class TemplateResolver:
     """Resolves template variable specifications to values.
 
@@ -64,46 +107,54 @@ class TemplateResolver:
         Returns:
             Resolved value
         """
+        path, transforms = _parse_spec(spec)
+        value = self._lookup(path, variables, vocab_items)
+
         # Handle pipes (transformations)
-        if "|" in spec:
-            parts = spec.split("|")
-            value = self.resolve(parts[0], variables, vocab_items)
-            for transform in parts[1:]:
-                try:
-                    value = TransformRegistry.apply(value, transform)
-                except TransformError:
-                    # Unknown transform - log warning and return value unchanged
-                    logger.warning(
-                        "Unknown transform '%s' in spec '%s' - value unchanged",
-                        transform,
-                        spec,
-                    )
-            return value
+        for transform in transforms:
+            try:
+                value = TransformRegistry.apply(value, transform)
+            except TransformError:
+                # Unknown transform - log warning and return value unchanged
+                logger.warning(
+                    "Unknown transform '%s' in spec '%s' - value unchanged",
+                    transform,
+                    spec,
+                )
+        return value
+
+    def _lookup(
+        self,
+        path: tuple[str, ...],
+        variables: dict[str, Any],
+        vocab_items: dict[str, Any],
+    ) -> Any:
+        """Look up a parsed dot path in vocab items and variables."""
+        head = path[0]
+
+        if len(path) == 1:
+            # Direct lookup - check vocab and variables, else treat as literal
+            if head in vocab_items:
+                return vocab_items[head]
+            if head in variables:
+                return variables[head]
+
+            # Return spec as literal value if not found
+            return head
 
         # Handle dot notation
-        if "." in spec:
-            parts = spec.split(".")
-            obj = vocab_items.get(parts[0]) or variables.get(parts[0])
-
-            for part in parts[1:]:
-                if isinstance(obj, dict):
-                    obj = obj.get(part)
-                elif isinstance(obj, list) and part.isdigit():
-                    idx = int(part)
-                    obj = obj[idx] if idx < len(obj) else None
-                else:
-                    obj = None
-
-            return obj
-
-        # Direct lookup - check vocab and variables, else treat as literal
-        if spec in vocab_items:
-            return vocab_items[spec]
-        if spec in variables:
-            return variables[spec]
-
-        # Return spec as literal value if not found
-        return spec
+        obj = vocab_items.get(head) or variables.get(head)
+
+        for part in path[1:]:
+            if isinstance(obj, dict):
+                obj = obj.get(part)
+            elif isinstance(obj, list) and part.isdigit():
+                idx = int(part)
+                obj = obj[idx] if idx < len(obj) else None
+            else:
+                obj = None
+
+        return obj
 
     def build_template_vars(
         self,
@@ -167,23 +218,11 @@ class TemplateResolver:
                     template_vars[f"{key}_{k}"] = v
 
                 # Auto-add common pronoun shortcuts when 'person' is sampled
-                if "name" in value and "subject" in value:
+                if "name" in value and "subject" in value and key.startswith("person"):
                     # This is a person - add common shortcuts
-                    if key == "person":
-                        template_vars["name"] = value.get("name")
-                        template_vars["subject"] = value.get("subject")
-                        template_vars["subj"] = value.get("subject", "").capitalize()
-                        template_vars["his_her"] = value.get("possessive")
-                        template_vars["him_her"] = value.get("object")
-                        template_vars["reflexive"] = value.get("reflexive")
-                        template_vars["verb_s"] = value.get("verb_s", "s")
-                    elif key.startswith("person"):
-                        # person1, person2, etc.
-                        suffix = key[6:]  # "1", "2", etc.
-                        template_vars[f"name{suffix}"] = value.get("name")
-                        template_vars[f"subject{suffix}"] = value.get("subject")
-                        template_vars[f"subj{suffix}"] = value.get("subject", "").capitalize()
-                        template_vars[f"his_her{suffix}"] = value.get("possessive")
+                    for var, field, default, capitalize in _person_shortcuts(key):
+                        field_value: Any = value.get(field, default)
+                        template_vars[var] = field_value.capitalize() if capitalize else field_value
 
             elif isinstance(value, list):
                 # Handle sampled lists
@@ -111,6 +111,11 @@ class VocabSampler:
             return self._vocab.random(path)
 
         if exclude:
+            # Exclusion sets are tiny next to the pool, so a draw from the full
+            # pool usually succeeds and the filtered copy is only built on a hit
+            item = self._rng.choice(items)
+            if item not in exclude:
+                return item
             available = [item for item in items if item not in exclude]
             if available:
                 return self._rng.choice(available)
@@ -166,6 +166,12 @@ def does_do(value: Any) -> str:
     return "does" if value == "s" else "do"
 
 
+# Ordinal suffix for each value of n % 100 (10-20 are always "th")
+_ORDINAL_SUFFIXES: tuple[str, ...] = tuple(
+    "th" if 10 <= i <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(i % 10, "th") for i in range(100)
+)
+
+
 def ordinal(n: Any) -> str:
     """Convert number to ordinal (1st, 2nd, 3rd, etc.)."""
     try:
@@ -173,12 +179,7 @@ def ordinal(n: Any) -> str:
     except (ValueError, TypeError):
         return str(n)
 
-    if 10 <= n % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-
-    return f"{n}{suffix}"
+    return f"{n}{_ORDINAL_SUFFIXES[n % 100]}"
 
 
 # Register built-in transforms
@@ -11,13 +11,47 @@ from __future__ import annotations
 
 import logging
 import random
-from typing import Any
+from collections.abc import Collection, Sequence
+from typing import Any, overload
 
 from chuk_virtual_expert_arithmetic.models.schema_spec import VariableSpec
 
 logger = logging.getLogger(__name__)
 
 
+class _NonRoundRange(Sequence[int]):
+    """The integers in [start, stop] that are not multiples of 10.
+
+    Indexing is arithmetic (nine values per decade), so a pool of any size
+    can be sampled by random.choices() without being materialized.
+    """
+
+    def __init__(self, start: int, stop: int) -> None:
+        self._decade = start - start % 10
+        # Non-round values in [decade, start) that are skipped
+        self._skip = max(start % 10 - 1, 0)
+        self._len = max((stop - start + 1) - (stop // 10 - (start - 1) // 10), 0)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | Sequence[int]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("non-round range index out of range")
+        decades, offset = divmod(index + self._skip, 9)
+        return self._decade + decades * 10 + offset + 1
+
+
 class VariableGenerator:
     """Generates random values for problem variables.
 
@@ -39,15 +73,24 @@ class VariableGenerator:
         self._rng = random.Random(seed)
         self._seed = seed
 
-    def generate(self, specs: dict[str, VariableSpec]) -> dict[str, Any]:
+    def generate(
+        self,
+        specs: dict[str, VariableSpec],
+        only: Collection[str] | None = None,
+    ) -> dict[str, Any]:
         """Generate values for all variables.
 
         Args:
             specs: Dict of variable name -> VariableSpec
+            only: If given, generate just these variables, in spec order so
+                seeded draws stay reproducible (names without a spec are skipped)
 
         Returns:
             Dict of variable name -> generated value
         """
+        if only is not None:
+            return {name: self.generate_one(spec) for name, spec in specs.items() if name in only}
+
         variables = {}
         for name, spec in specs.items():
             variables[name] = self.generate_one(spec)
@@ -67,13 +110,72 @@ class VariableGenerator:
         elif spec.type == "float":
             return self._generate_float(spec)
         elif spec.type == "bool":
-            return self._rng.choice([True, False])
+            return bool(self._rng.getrandbits(1))
         elif spec.type == "choice":
             return self._generate_choice(spec)
         else:
             # Default to int
             return self._generate_int(spec)
 
+    def generate_batch(self, spec: VariableSpec, n: int) -> list[Any]:
+        """Generate n values for a single variable.
+
+        When every admissible value is equally likely (plain, avoid_round,
+        easy/medium/hard ints, bools and choices) all n values come from a
+        single random.choices call over the value pool, and multiple_of
+        rounding is applied to the drawn values in one pass. Int pools are
+        ranges or arithmetic views, so their size does not matter. Other
+        specs fall back to calling generate_one() n times.
+
+        Args:
+            spec: Variable specification
+            n: Number of values to generate
+
+        Returns:
+            List of n generated values
+        """
+        pool = self._batch_pool(spec)
+        if pool is None:
+            return [self.generate_one(spec) for _ in range(n)]
+
+        values = self._rng.choices(pool, k=n)
+        if not spec.multiple_of or spec.type in ("bool", "choice"):
+            return values
+
+        # Same rounding as _generate_int: down to a multiple, then up if below min
+        mult = spec.multiple_of
+        min_val = int(spec.min) if spec.min is not None else 1
+        return [r + mult if (r := (v // mult) * mult) < min_val else r for v in values]
+
+    def _batch_pool(self, spec: VariableSpec) -> Sequence[Any] | None:
+        """Values generate_one() draws uniformly from, or None if not applicable."""
+        if spec.type == "bool":
+            return (True, False)
+        if spec.type == "choice":
+            return spec.options or spec.values or None
+        if spec.type == "float":
+            return None
+
+        min_val = int(spec.min) if spec.min is not None else 1
+        max_val = int(spec.max) if spec.max is not None else 100
+
+        pool: Sequence[int] | None
+        if spec.difficulty == "easy":
+            pool = [v for v in (5, 10, 15, 20, 25, 30) if min_val <= v <= max_val]
+        elif spec.difficulty == "hard":
+            pool = self._non_round_pool(max(min_val, 50), max(max_val, 200))
+        elif spec.avoid_round and not spec.difficulty:
+            pool = self._non_round_pool(min_val, max_val)
+        else:
+            pool = range(min_val, max_val + 1)
+
+        return pool or None
+
+    @staticmethod
+    def _non_round_pool(min_val: int, max_val: int) -> _NonRoundRange | None:
+        """All non-multiples of 10 in range, or None if there are none."""
+        return _NonRoundRange(min_val, max_val) or None
+
     def _generate_int(self, spec: VariableSpec) -> int:
         """Generate an integer value.
 
@@ -13,6 +13,9 @@ Usage (schema-based - data-driven approach):
     examples = gen.generate_batch(n=50)  # Generate batch from all schemas
 """
 
+import random
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from chuk_virtual_expert.trace_example import TraceExample
@@ -179,8 +182,6 @@ class TraceGenerator:
             messy_vocab_prob: Probability of using diverse/unusual names and items
                              from the messy vocab layer (0-1). Default 0.2.
         """
-        import random
-
         self._rng = random.Random(seed)
         self._perturbation_level = perturbation_level
         self._schema_gen = SchemaGenerator(
@@ -204,12 +205,20 @@ class TraceGenerator:
 
     def _seeded_schema_generate(self, schemas: list[str], n: int) -> list[TraceExample]:
         """Generate from schemas with seeded random."""
-        import random
+        with self._seeded_global_random():
+            return self._schema_gen.generate_batch(schemas, n)
+
+    @contextmanager
+    def _seeded_global_random(self) -> Iterator[None]:
+        """Seed the module-level random from this generator for one block.
 
+        The composition generators and vocab sampling draw from the global random;
+        the caller's random state is restored on exit.
+        """
         state = random.getstate()
         random.seed(self._rng.randint(0, 2**32 - 1))
         try:
-            return self._schema_gen.generate_batch(schemas, n)
+            yield
         finally:
             random.setstate(state)
 
@@ -232,11 +241,7 @@ class TraceGenerator:
             long_chain_ratio: Fraction from long chain patterns (default 0.1)
             gap_closing_ratio: Fraction from gap-closing patterns (default 0.25)
         """
-        import random
-
-        state = random.getstate()
-        random.seed(self._rng.randint(0, 2**32 - 1))
-        try:
+        with self._seeded_global_random():
             n_long = max(1, int(n * long_chain_ratio))
             n_interleaved = max(1, int(n * interleaved_ratio))
             n_gap_closing = max(1, int(n * gap_closing_ratio))
@@ -250,8 +255,6 @@ class TraceGenerator:
 
             random.shuffle(examples)
             return examples
-        finally:
-            random.setstate(state)
 
     def generate_rate_equation(self, n: int = 10) -> list[TraceExample]:
         """Generate rate equation examples from schemas."""
@@ -267,23 +270,14 @@ class TraceGenerator:
 
     def generate_composition(self, n: int = 10) -> list[dict[str, Any]]:
         """Generate compositional (multi-expert) examples."""
-        import random as _random
-
-        state = _random.getstate()
-        _random.seed(self._rng.randint(0, 2**32 - 1))
-        try:
+        with self._seeded_global_random():
             return composition.generate(n)
-        finally:
-            _random.setstate(state)
 
     def generate_all(self, n_per_type: int = 10) -> list[TraceExample]:
         """Generate examples for all expert types (equal distribution)."""
-        examples: list[TraceExample] = []
-        examples.extend(self.generate_entity_track(n_per_type))
-        examples.extend(self.generate_arithmetic(n_per_type))
-        examples.extend(self.generate_rate_equation(n_per_type))
-        examples.extend(self.generate_comparison(n_per_type))
-        examples.extend(self.generate_percentage(n_per_type))
+        examples = [
+            example for generate in self._type_generators() for example in generate(n_per_type)
+        ]
         self._shuffle(examples)
         return examples
 
@@ -355,13 +349,19 @@ class TraceGenerator:
         self._shuffle(examples)
         return examples
 
-    def _shuffle(self, examples: list[Any]) -> None:
-        import random
+    def _type_generators(self) -> tuple[Callable[[int], list[TraceExample]], ...]:
+        """Per-expert-type generators, in the order generate_all() draws them."""
+        return (
+            self.generate_entity_track,
+            self.generate_arithmetic,
+            self.generate_rate_equation,
+            self.generate_comparison,
+            self.generate_percentage,
+        )
 
-        state = random.getstate()
-        random.seed(self._rng.randint(0, 2**32 - 1))
-        random.shuffle(examples)
-        random.setstate(state)
+    def _shuffle(self, examples: list[Any]) -> None:
+        with self._seeded_global_random():
+            random.shuffle(examples)
 
     def generate_from_schemas(
         self,
@@ -15,16 +15,13 @@ from typing import Any
 from chuk_virtual_expert_arithmetic.types import ExpertType
 from chuk_virtual_expert_arithmetic.vocab import get_vocab
 
-# Vocab singleton for random sampling
-_vocab = get_vocab()
-
 
 def generate_percent_off_plus_extra() -> dict[str, Any]:
     """X% off a price, plus extra cost (shipping/tax)."""
     price = random.randint(40, 200)
     percent = random.choice([10, 15, 20, 25, 30])
     extra = random.randint(5, 25)
-    item = _vocab.random("items.countable_singular")
+    item = get_vocab().random("items.countable_singular")
 
     sale_price = price * (100 - percent) / 100
     total = sale_price + extra
@@ -116,7 +113,7 @@ def generate_percent_of_then_multiply() -> dict[str, Any]:
     unit = whole * percent / 100
     total = unit * quantity
 
-    item = _vocab.random("items.countable_singular")
+    item = get_vocab().random("items.countable_singular")
     question = (
         f"A {item} is priced at {percent}% of ${whole}. You buy {quantity}. What's the total?"
     )
@@ -225,7 +222,7 @@ def generate_value_increase_profit() -> dict[str, Any]:
     new_value = original + increase
     profit = new_value - total_cost
 
-    name = _vocab.random("names.people")
+    name = get_vocab().random("names.people")
     question = (
         f"{name} buys a house for ${original} and puts in ${repairs} in repairs. "
         f"This increased the value of the house by {percent}%. How much profit did they make?"
@@ -290,8 +287,9 @@ def generate_paired_discount() -> dict[str, Any]:
     pairs = quantity // 2
     total = pairs * pair_cost
 
-    item = _vocab.random("items.countable_plural") or "items"
-    name = _vocab.random("names.people")
+    vocab = get_vocab()
+    item = vocab.random("items.countable_plural") or "items"
+    name = vocab.random("names.people")
 
     # Multiple template variations to improve robustness
     templates = [
@@ -378,7 +376,7 @@ def generate_interrupted_rate() -> dict[str, Any]:
     full_time = total_size / rate
     total_time = partial_time + delay + full_time
 
-    name = _vocab.random("names.people")
+    name = get_vocab().random("names.people")
 
     # Multiple templates with varied domains
     templates = [
@@ -495,9 +493,10 @@ def generate_consume_then_sell() -> dict[str, Any]:
     remaining = initial - consume1 - consume2
     revenue = remaining * price
 
-    name = _vocab.random("names.people")
+    vocab = get_vocab()
+    name = vocab.random("names.people")
     # Get poultry animal that produces eggs
-    farm_animal = _vocab.random("animals.farm_animals")
+    farm_animal = vocab.random("animals.farm_animals")
     animal = farm_animal.get("name", "chickens") if isinstance(farm_animal, dict) else "chickens"
 
     question = (
@@ -559,7 +558,7 @@ def generate_cost_increase_profit() -> dict[str, Any]:
     new_value = purchase * (100 + percent) / 100
     profit = new_value - total_cost
 
-    name = _vocab.random("names.people")
+    name = get_vocab().random("names.people")
     question = (
         f"{name} buys a house for ${purchase} and spends ${repairs} on repairs. "
         f"This increased the value of the house by {percent}%. How much profit did {name} make?"
@@ -626,7 +625,7 @@ def generate_discount_tax_total() -> dict[str, Any]:
     tax = discounted * tax_pct / 100
     final = discounted + tax
 
-    item = _vocab.random("items.countable_singular")
+    item = get_vocab().random("items.countable_singular")
     question = (
         f"A {item} originally costs ${original}. It's {discount_pct}% off. "
         f"Then {tax_pct}% tax is added. What's the final price?"
@@ -694,7 +693,7 @@ def generate_comparison_then_total() -> dict[str, Any]:
 
     item_a = random.choice(["shirt", "book", "toy"])
     item_b = random.choice(["jacket", "bag", "game"])
-    name = _vocab.random("names.people")
+    name = get_vocab().random("names.people")
 
     question = (
         f"A {item_a} costs ${price_a}. A {item_b} costs ${difference} more than the {item_a}. "
@@ -863,9 +862,8 @@ GENERATORS = [
 
 
 def generate(n: int = 40) -> list[dict[str, Any]]:
-    """Generate n compositional examples."""
-    examples = []
-    for _ in range(n):
-        gen = random.choice(GENERATORS)
-        examples.append(gen())
-    return examples
+    """Generate n compositional examples.
+
+    The pattern for every example is drawn up front in one random.choices call.
+    """
+    return [gen() for gen in random.choices(GENERATORS, k=n)]
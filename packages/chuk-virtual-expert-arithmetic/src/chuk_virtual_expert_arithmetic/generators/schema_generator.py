@@ -30,9 +30,14 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import math
 import random
 import re
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from chuk_virtual_expert.trace_example import TraceExample
@@ -53,16 +58,103 @@ from chuk_virtual_expert_arithmetic.core.domains import DomainSampler
 from chuk_virtual_expert_arithmetic.core.expression import ExpressionError, SafeEvaluator
 from chuk_virtual_expert_arithmetic.core.loader import SchemaLoader
 from chuk_virtual_expert_arithmetic.core.perturbation import TemplatePerturbator
-from chuk_virtual_expert_arithmetic.core.transforms import pluralize
+from chuk_virtual_expert_arithmetic.core.transforms import (
+    capitalize,
+    does_do,
+    has_have,
+    pluralize,
+)
 from chuk_virtual_expert_arithmetic.types import (
     DEFAULT_EXPERT,
+    GROWTH_WORDS,
     GSM8K_DEPTH_WEIGHTS,
+    MULTIPLIER_WORDS,
     WORD_NUMBERS,
     VocabPath,
 )
 from chuk_virtual_expert_arithmetic.vocab import get_vocab
 
 
+def _singularize(value: Any) -> str:
+    """Strip a trailing "ies", "es" or "s" (looser than transforms.singularize)."""
+    s = str(value)
+    if s.endswith("ies"):
+        return s[:-3] + "y"
+    elif s.endswith("es"):
+        return s[:-2]
+    elif s.endswith("s"):
+        return s[:-1]
+    return s
+
+
+def _with_article(value: Any) -> str:
+    """Prefix a/an using the vocab's article rules."""
+    return get_vocab().with_article(str(value))
+
+
+# Template transforms by name; unknown names leave the value unchanged
+_TRANSFORMS: MappingProxyType[str, Callable[[Any], Any]] = MappingProxyType(
+    {
+        "capitalize": capitalize,
+        "singularize": _singularize,
+        "pluralize": pluralize,
+        "with_article": _with_article,
+        "has_have": has_have,
+        "does_do": does_do,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _TemplateSpec:
+    """Parsed form of a template spec such as 'person.name|capitalize'."""
+
+    key: str
+    # (part, list index or None) for each dotted segment; None for a bare name
+    path: tuple[tuple[str, int | None], ...] | None
+    transforms: tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def _compile_template_spec(spec: str) -> _TemplateSpec:
+    """Split a template spec into lookup key, dotted path and transforms.
+
+    Transform names are interned so _TRANSFORMS lookups match its literal
+    keys by identity.
+    """
+    head, *names = spec.split("|")
+    transforms = tuple(map(sys.intern, names))
+    if "." not in head:
+        return _TemplateSpec(head, None, transforms)
+    key, *parts = head.split(".")
+    path = tuple((part, int(part) if part.isdigit() else None) for part in parts)
+    return _TemplateSpec(key, path, transforms)
+
+
+@cache
+def _composed_schemas() -> dict[str, dict[str, Any]]:
+    """Load and compose the packaged schemas once per process.
+
+    The result is shared by every SchemaGenerator and must not be mutated.
+    """
+    loader = SchemaLoader()
+    composed_schemas: dict[str, dict[str, Any]] = {}
+
+    for name, raw in loader.get_all_raw().items():
+        # Use loader to get composed schema (handles mixins/extends)
+        try:
+            # Load raw and compose if needed
+            if "extends" in raw or "mixins" in raw:
+                composed_schemas[name] = loader._get_composer().compose(raw)
+            else:
+                composed_schemas[name] = raw
+        except Exception:
+            # If composition fails, use raw
+            composed_schemas[name] = raw
+
+    return composed_schemas
+
+
 class SchemaGenerator:
     """Generates arithmetic problems from JSON schemas."""
 
@@ -90,8 +182,8 @@ class SchemaGenerator:
             seed: Random seed for reproducibility.
         """
         self._vocab = get_vocab()
-        self._loader = SchemaLoader()
         self._schemas = self._load_schemas()
+        self._schema_names = tuple(self._schemas)
         self._word_number_prob = word_number_prob
         self._perturbation_level = perturbation_level
         self._gsm8k_style_prob = gsm8k_style_prob
@@ -102,29 +194,13 @@ class SchemaGenerator:
         self._domain_sampler = DomainSampler(self._vocab, seed=seed)
 
     def _load_schemas(self) -> dict[str, dict[str, Any]]:
-        """Load all schemas using SchemaLoader (handles composition/mixins)."""
-        raw_schemas = self._loader.get_all_raw()
-        composed_schemas: dict[str, dict[str, Any]] = {}
-
-        for name, raw in raw_schemas.items():
-            # Use loader to get composed schema (handles mixins/extends)
-            try:
-                # Load raw and compose if needed
-                if "extends" in raw or "mixins" in raw:
-                    composed = self._loader._get_composer().compose(raw)
-                    composed_schemas[name] = composed
-                else:
-                    composed_schemas[name] = raw
-            except Exception:
-                # If composition fails, use raw
-                composed_schemas[name] = raw
-
-        return composed_schemas
+        """Load all schemas (composition/mixins resolved, cached per process)."""
+        return dict(_composed_schemas())
 
     @property
     def schema_names(self) -> list[str]:
         """List available schema names."""
-        return list(self._schemas.keys())
+        return list(self._schema_names)
 
     @property
     def perturbation_level(self) -> float:
@@ -198,7 +274,7 @@ class SchemaGenerator:
                         return self.generate(schema_name)
 
         # Fallback to random schema
-        return self.generate(self._rng.choice(self.schema_names))
+        return self.generate(self._rng.choice(self._schema_names))
 
     def generate_batch_gsm8k_distribution(self, n: int) -> list[TraceExample]:
         """Generate n problems with GSM-8K-like trace depth distribution.
@@ -281,10 +357,8 @@ class SchemaGenerator:
         # Auto-add multiplier word mapping if multiplier variable exists
         if "multiplier" in variables:
             mult = variables["multiplier"]
-            mult_words = {2: "twice", 3: "three times", 4: "four times", 5: "five times"}
-            growth_words = {2: "doubled", 3: "tripled", 4: "quadrupled", 5: "quintupled"}
-            template_vars["mult_word"] = mult_words.get(mult, f"{mult} times")
-            template_vars["growth_word"] = growth_words.get(mult, f"multiplied by {mult}")
+            template_vars["mult_word"] = MULTIPLIER_WORDS.get(mult, f"{mult} times")
+            template_vars["growth_word"] = GROWTH_WORDS.get(mult, f"multiplied by {mult}")
 
         # Add sampled vocab items
         for key, value in vocab_items.items():
@@ -366,26 +440,31 @@ class SchemaGenerator:
     ) -> list[TraceExample]:
         """Generate multiple problems.
 
+        The schema for every problem is drawn up front in one choices() call,
+        so repeated names in schema_names act as weights.
+
         Args:
             schema_names: List of schemas to use (None = all)
             n: Number of problems to generate
 
         Returns:
             List of TraceExamples
-        """
-        if schema_names is None:
-            schema_names = self.schema_names
 
-        examples = []
-        for _ in range(n):
-            schema_name = random.choice(schema_names)
-            examples.append(self.generate(schema_name))
+        Raises:
+            IndexError: If n > 0 and schema_names is empty
+        """
+        pool = self._schema_names if schema_names is None else schema_names
+        if n > 0 and not pool:
+            raise IndexError("generate_batch needs at least one schema name")
 
-        return examples
+        return [self.generate(name) for name in self._rng.choices(pool, k=n)]
 
     def _generate_variables(self, var_specs: dict[str, dict[str, Any]]) -> dict[str, Any]:
         """Generate random values for variables."""
         variables = {}
+        rng = self._rng
+        # randint(a, b) is randrange(a, b + 1); calling it directly saves a frame
+        randrange = rng.randrange
 
         for name, spec in var_specs.items():
             var_type = spec.get("type", "int")
@@ -393,31 +472,30 @@ class SchemaGenerator:
             if var_type == "int":
                 min_val = spec.get("min", 1)
                 max_val = spec.get("max", 100)
-                value = random.randint(min_val, max_val)
 
-                # Handle multiple_of constraint
                 if "multiple_of" in spec:
+                    # Draw directly from the multiples of mult in [min, max];
+                    # with none in range, use the first multiple above min
                     mult = spec["multiple_of"]
-                    value = (value // mult) * mult
-                    if value < min_val:
-                        value += mult
-
-                variables[name] = value
+                    lo = -(-min_val // mult)
+                    hi = max(lo, max_val // mult)
+                    variables[name] = mult * randrange(lo, hi + 1)
+                else:
+                    variables[name] = randrange(min_val, max_val + 1)
 
             elif var_type == "float":
                 min_val = spec.get("min", 0.0)
                 max_val = spec.get("max", 10.0)
                 precision = spec.get("precision", 2)
-                value = round(random.uniform(min_val, max_val), precision)
-                variables[name] = value
+                variables[name] = round(rng.uniform(min_val, max_val), precision)
 
             elif var_type == "bool":
-                variables[name] = random.choice([True, False])
+                variables[name] = rng.random() < 0.5
 
             elif var_type == "choice":
                 # Support both "options" and "values" for choice type
                 options = spec.get("options") or spec.get("values", [])
-                variables[name] = random.choice(options) if options else 0
+                variables[name] = rng.choice(options) if options else 0
 
         return variables
 
@@ -427,7 +505,8 @@ class SchemaGenerator:
         """Compute derived variables from expressions.
 
         Expressions are evaluated in order, so later expressions can
-        reference earlier derived values.
+        reference earlier derived values. Each expression is compiled once
+        per evaluator and reused across examples.
         """
         derived = {}
         # Create a combined context that includes both base variables and derived
@@ -435,8 +514,8 @@ class SchemaGenerator:
 
         for name, expr in derived_specs.items():
             try:
-                # Safe expression evaluation using AST parser
-                value = self._evaluator.evaluate(expr, context)
+                # Safe expression evaluation using the compiled AST closures
+                value = self._evaluator.compile_function(expr)(context)
                 derived[name] = value
                 # Add to context so later expressions can reference it
                 context[name] = value
@@ -455,21 +534,28 @@ class SchemaGenerator:
         """Apply constraints, regenerating if needed."""
         max_attempts = 10
 
+        # Compile expressions and resolve bounds once, outside the retry loop.
+        # Unparseable constraints are ignored, as are evaluation errors below.
+        plan = []
+        for expr, bounds in constraints.items():
+            try:
+                function = self._evaluator.compile_function(expr)
+            except ExpressionError:
+                continue
+            plan.append((function, bounds.get("min", -math.inf), bounds.get("max", math.inf)))
+
         for _ in range(max_attempts):
             all_satisfied = True
 
-            for expr, bounds in constraints.items():
+            for function, min_val, max_val in plan:
                 try:
-                    # Safe expression evaluation using AST parser
-                    value = self._evaluator.evaluate(expr, variables)
-                    min_val = bounds.get("min", float("-inf"))
-                    max_val = bounds.get("max", float("inf"))
-
-                    if not (min_val <= value <= max_val):
-                        all_satisfied = False
-                        break
+                    value = function(variables)
                 except ExpressionError:
-                    pass
+                    continue
+
+                if not (min_val <= value <= max_val):
+                    all_satisfied = False
+                    break
 
             if all_satisfied:
                 return variables
@@ -511,11 +597,14 @@ class SchemaGenerator:
             elif spec.get("type") == "choice":
                 # Handle choice type in vocab (e.g., growth_word, mult_word)
                 values = spec.get("values", [])
-                # Apply distinct_from exclusion
+                value = self._rng.choice(values) if values else ""
+                # Apply distinct_from exclusion; the filtered copy is only
+                # built when the first draw lands on an excluded value
                 exclude = self._get_exclude_values(spec, items)
-                if exclude:
-                    values = [v for v in values if v not in exclude]
-                items[name] = random.choice(values) if values else ""
+                if exclude and value in exclude:
+                    allowed = [v for v in values if v not in exclude]
+                    value = self._rng.choice(allowed) if allowed else ""
+                items[name] = value
             elif "path" in spec:
                 path = spec["path"]
                 if "sample" in spec:
@@ -565,6 +654,11 @@ class SchemaGenerator:
             return self._vocab.random(path)
 
         if exclude:
+            # Exclusion sets are tiny next to the pool, so a draw from the full
+            # pool usually succeeds and the filtered copy is only built on a hit
+            item = self._rng.choice(all_items)
+            if item not in exclude:
+                return item
             available = [item for item in all_items if item not in exclude]
             if available:
                 return self._rng.choice(available)
@@ -621,70 +715,43 @@ class SchemaGenerator:
         vocab_items: dict[str, Any],
     ) -> Any:
         """Resolve a template spec like 'person.name' or 'items|singularize'."""
-        # Handle pipes (transformations)
-        if "|" in spec:
-            parts = spec.split("|")
-            value = self._resolve_template_spec(parts[0], variables, vocab_items)
-            for transform in parts[1:]:
-                value = self._apply_transform(value, transform)
-            return value
-
-        # Handle dot notation
-        if "." in spec:
-            parts = spec.split(".")
-            obj = vocab_items.get(parts[0]) or variables.get(parts[0])
-
-            for part in parts[1:]:
-                if isinstance(obj, dict):
-                    obj = obj.get(part)
-                elif isinstance(obj, list) and part.isdigit():
-                    idx = int(part)
-                    obj = obj[idx] if idx < len(obj) else None
+        compiled = _compile_template_spec(spec)
+        key = compiled.key
+
+        if compiled.path is None:
+            # Direct lookup - check vocab and variables, else treat as literal
+            if key in vocab_items:
+                value = vocab_items[key]
+            elif key in variables:
+                value = variables[key]
+            else:
+                value = key
+        else:
+            # Dot notation: walk dict keys and list indices
+            value = vocab_items.get(key) or variables.get(key)
+            for part, idx in compiled.path:
+                if isinstance(value, dict):
+                    value = value.get(part)
+                elif isinstance(value, list) and idx is not None:
+                    value = value[idx] if idx < len(value) else None
                 else:
-                    obj = None
-
-            return obj
-
-        # Direct lookup - check vocab and variables, else treat as literal
-        if spec in vocab_items:
-            return vocab_items[spec]
-        if spec in variables:
-            return variables[spec]
-        # Return spec as literal value if not found
-        return spec
+                    value = None
+
+        # Same as chaining _apply_transform(), without a method call per transform
+        for transform in compiled.transforms:
+            if value is None:
+                break
+            fn = _TRANSFORMS.get(transform)
+            if fn is not None:
+                value = fn(value)
+        return value
 
     def _apply_transform(self, value: Any, transform: str) -> Any:
         """Apply a transformation to a value."""
         if value is None:
             return None
-
-        if transform == "capitalize":
-            return str(value).capitalize()
-        elif transform == "singularize":
-            s = str(value)
-            if s.endswith("ies"):
-                return s[:-3] + "y"
-            elif s.endswith("es"):
-                return s[:-2]
-            elif s.endswith("s"):
-                return s[:-1]
-            return s
-        elif transform == "pluralize":
-            s = str(value)
-            if s.endswith("s") or s.endswith("x") or s.endswith("ch") or s.endswith("sh"):
-                return s + "es"
-            elif s.endswith("y") and len(s) > 1 and s[-2] not in "aeiou":
-                return s[:-1] + "ies"
-            else:
-                return s + "s"
-        elif transform == "with_article":
-            return self._vocab.with_article(str(value))
-        elif transform == "has_have":
-            return "has" if value == "s" else "have"
-        elif transform == "does_do":
-            return "does" if value == "s" else "do"
-
-        return value
+        fn = _TRANSFORMS.get(transform)
+        return value if fn is None else fn(value)
 
     def _build_trace(
         self, trace_specs: list[dict[str, Any]], variables: dict[str, Any]
@@ -767,8 +834,8 @@ class SchemaGenerator:
     def _compute_answer(self, expr: str, variables: dict[str, Any]) -> float:
         """Compute answer from expression."""
         try:
-            # Safe expression evaluation using AST parser
-            result = self._evaluator.evaluate(expr, variables)
+            # Safe expression evaluation using the compiled AST closures
+            result = self._evaluator.compile_function(expr)(variables)
             return float(result)
         except ExpressionError:
             return 0.0
@@ -806,7 +873,7 @@ class SchemaGenerator:
                 return num_str
 
             # Random chance to convert
-            if random.random() < self._word_number_prob:
+            if self._rng.random() < self._word_number_prob:
                 return WORD_NUMBERS[num]
 
             return num_str
@@ -833,7 +900,7 @@ class SchemaGenerator:
         """
         # Select schema name if not provided
         if schema_name is None:
-            schema_name = self._rng.choice(self.schema_names)
+            schema_name = self._rng.choice(self._schema_names)
 
         # Run the synchronous generate in a thread pool to avoid blocking
         loop = asyncio.get_event_loop()
@@ -862,13 +929,10 @@ class SchemaGenerator:
                 return await self.generate_async(schema)
 
         # Determine schemas to use
-        if schema_names is None:
-            schema_names = self.schema_names
+        pool = self._schema_names if schema_names is None else schema_names
 
-        # Generate tasks
-        tasks = [
-            bounded_generate(self._rng.choice(schema_names)) for _ in range(n)
-        ]
+        # Draw every schema name at once, then create the tasks
+        tasks = [bounded_generate(name) for name in self._rng.choices(pool, k=n)]
 
         return await asyncio.gather(*tasks)
 
@@ -904,11 +968,11 @@ class SchemaGenerator:
             async with semaphore:
                 return await self.generate_async(schema)
 
-        tasks = []
-        for expert in experts:
-            schemas = schemas_by_expert[expert]
-            for _ in range(per_expert):
-                tasks.append(bounded_generate(self._rng.choice(schemas)))
+        tasks = [
+            bounded_generate(name)
+            for expert in experts
+            for name in self._rng.choices(schemas_by_expert[expert], k=per_expert)
+        ]
 
         return await asyncio.gather(*tasks)
 
@@ -928,11 +992,9 @@ class SchemaGenerator:
         Yields:
             Generated TraceExamples one at a time.
         """
-        if schema_names is None:
-            schema_names = self.schema_names
+        pool = self._schema_names if schema_names is None else schema_names
 
-        for _ in range(n):
-            schema = self._rng.choice(schema_names)
+        for schema in self._rng.choices(pool, k=n):
             yield await self.generate_async(schema)
 
 
@@ -35,7 +35,7 @@ class Action(Enum):
     QUERY = "query"  # Read final value (produces answer)
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """
     Immutable snapshot of all entity values.
@@ -74,7 +74,7 @@ class State:
         return cls(values={k: Decimal(str(v)) for k, v in d.items()})
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """
     A single step in a trace.
@@ -122,7 +122,7 @@ class Step:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Trace:
     """
     A complete trace of reasoning.
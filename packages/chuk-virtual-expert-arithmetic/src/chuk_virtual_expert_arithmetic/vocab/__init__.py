@@ -23,15 +23,90 @@ from __future__ import annotations
 
 import json
 import random
+import re
+import sys
+from functools import cache, lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
+# Genders drawn by person_with_pronouns() with cumulative 45/45/10 weights
+_GENDERS = ("male", "female", "neutral")
+_GENDER_CUM_WEIGHTS = tuple(accumulate((0.45, 0.45, 0.10)))
+
+# Returned by person_with_pronouns() when names or pronouns are missing
+_FALLBACK_PERSON: dict[str, Any] = {
+    "name": "Alex",
+    "subject": "they",
+    "object": "them",
+    "possessive": "their",
+    "reflexive": "themselves",
+    "verb_s": "",  # "they eat" not "they eats"
+}
+
+# First letters that take "an" in a_an()
+_VOWELS = frozenset("aeiouAEIOU")
+
+# ${var} placeholder in vocab templates
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+
+@lru_cache(maxsize=4096)
+def _split_template(template: str) -> tuple[str, ...]:
+    """Split a template into alternating literal text and placeholder names.
+
+    Even indices hold literal text and odd indices hold ${name} keys, so
+    filling a template is a join with no regex work after the first call.
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+@lru_cache(maxsize=2048)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated vocab path into its components."""
+    return tuple(path.split("."))
+
+
+def _intern_strings(root: dict[str, Any] | list[Any]) -> None:
+    """Intern every string value in a loaded JSON tree, in place.
+
+    The same names, colors and units recur across vocab files; interning
+    makes each one a single shared object.
+    """
+    stack: list[dict[str, Any] | list[Any]] = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    node[key] = sys.intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            for i, value in enumerate(node):
+                if isinstance(value, str):
+                    node[i] = sys.intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+
 
 class Vocab:
     """Vocabulary loader with random sampling and template substitution."""
 
     _instance: Vocab | None = None
     _cache: dict[str, Any] = {}
+    # id(templates) -> (templates, texts, cumulative weights); the list is kept
+    # so the id cannot be reused while the entry is alive
+    _cum_weights_cache: dict[int, tuple[list[Any], list[str], list[int]]] = {}
+    _CUM_WEIGHTS_CACHE_SIZE = 1024
+    # gender -> (pronouns dict, person prototype); checked by identity so
+    # replaced pronoun data is picked up
+    _person_protos: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+    # (id(colors), id(materials)) -> (colors, materials, "color material" phrases);
+    # the lists are kept for the same reason as above
+    _colored_cache: dict[tuple[int, int], tuple[list[Any], list[Any], tuple[str, ...]]] = {}
+    # One entry per (colors, materials) pair, i.e. per material type in use
+    _COLORED_CACHE_SIZE = 64
 
     def __new__(cls) -> Vocab:
         """Singleton pattern - only load vocab files once."""
@@ -93,6 +168,8 @@ class Vocab:
                     messy[key] = json.load(f)
             self._cache["messy"] = messy
 
+        _intern_strings(self._cache)
+
     def get(self, path: str) -> Any:
         """Get vocabulary by dot-separated path.
 
@@ -102,13 +179,11 @@ class Vocab:
         Returns:
             The vocabulary list or dict at that path
         """
-        parts = path.split(".")
         data: Any = self._cache
-        for part in parts:
-            if isinstance(data, dict):
-                data = data.get(part)
-            else:
+        for part in _split_path(path):
+            if not isinstance(data, dict):
                 return None
+            data = data.get(part)
             if data is None:
                 return None
         return data
@@ -145,6 +220,9 @@ class Vocab:
     def substitute(self, template: str, **kwargs: Any) -> str:
         """Substitute variables in a template string.
 
+        Each template is split into literal and placeholder parts once and
+        cached; placeholders with no matching keyword are left as-is.
+
         Args:
             template: String with ${var} placeholders
             **kwargs: Variables to substitute
@@ -156,10 +234,14 @@ class Vocab:
             vocab.substitute("sells at ${price} each", price=5)
             # Returns: "sells at 5 each"
         """
-        result = template
-        for key, value in kwargs.items():
-            result = result.replace(f"${{{key}}}", str(value))
-        return result
+        if not kwargs or "${" not in template:
+            return template
+
+        parts = list(_split_template(template))
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            parts[i] = str(kwargs[key]) if key in kwargs else f"${{{key}}}"
+        return "".join(parts)
 
     def pattern(self, pattern_name: str, variant: str | None = None, **kwargs: Any) -> str:
         """Get a random pattern template and substitute variables.
@@ -219,7 +301,50 @@ class Vocab:
         if not templates:
             return ""
 
-        # Extract texts and weights
+        # Use weighted random choice
+        texts, cum_weights = self._template_cum_weights(templates)
+        return random.choices(texts, cum_weights=cum_weights, k=1)[0]
+
+    def _select_weighted_templates(self, templates: list[Any] | Any, n: int) -> list[str]:
+        """Select n templates using weighted random choice in a single draw.
+
+        Args:
+            templates: List of templates (strings or weighted dicts)
+            n: Number of selections
+
+        Returns:
+            List of n selected template strings
+        """
+        if not isinstance(templates, list):
+            return [str(templates)] * n
+
+        if not templates:
+            return [""] * n
+
+        texts, cum_weights = self._template_cum_weights(templates)
+        return random.choices(texts, cum_weights=cum_weights, k=n)
+
+    def _template_cum_weights(self, templates: list[Any]) -> tuple[list[str], list[int]]:
+        """Return template texts and cumulative weights, cached per template list.
+
+        Vocab template lists are loaded once and never mutated, so the
+        running totals are computed on first use and reused by every draw.
+        """
+        cache = self._cum_weights_cache
+        cached = cache.get(id(templates))
+        if cached is not None and cached[0] is templates and len(cached[1]) == len(templates):
+            return cached[1], cached[2]
+
+        texts, weights = self._template_weights(templates)
+        cum_weights = list(accumulate(weights))
+        if len(cache) >= self._CUM_WEIGHTS_CACHE_SIZE:
+            cache.clear()
+        cache[id(templates)] = (templates, texts, cum_weights)
+        return texts, cum_weights
+
+    @staticmethod
+    def _template_weights(templates: list[Any]) -> tuple[list[str], list[int]]:
+        """Split templates into parallel lists of texts and weights."""
         texts: list[str] = []
         weights: list[int] = []
 
@@ -231,8 +356,7 @@ class Vocab:
                 texts.append(str(t))
                 weights.append(1)
 
-        # Use weighted random choice
-        return random.choices(texts, weights=weights, k=1)[0]
+        return texts, weights
 
     def random_pair(self, path: str) -> tuple[Any, Any]:
         """Get a random paired container (first, second).
@@ -252,23 +376,52 @@ class Vocab:
         """List all top-level vocab file names."""
         return list(self._cache.keys())
 
-    def list_paths(self, prefix: str = "") -> list[str]:
-        """List all available paths for a vocab file.
+    def list_paths(self, prefix: str = "", recursive: bool = False) -> list[str]:
+        """List the paths below a vocab file or nested section.
+
+        The loaded vocab is already a tree keyed on path components, so the
+        prefix is resolved with the same descent as get() and the children
+        of that node (or its whole subtree) are listed.
 
         Args:
-            prefix: Vocab file name (e.g., "names", "animals")
+            prefix: Vocab file name or dotted section path
+                (e.g., "names", "patterns.price_chain")
+            recursive: If True, list every nested path below the prefix
+                (or below the root when no prefix is given), not just
+                the direct children
 
         Returns:
             List of available paths
         """
+        if recursive:
+            root = self.get(prefix) if prefix else self._cache
+            return self._walk_paths(root, prefix) if isinstance(root, dict) else []
+
         if not prefix:
             return self.all_keys()
 
-        data = self._cache.get(prefix, {})
+        data = self.get(prefix)
         if isinstance(data, dict):
-            return [f"{prefix}.{k}" for k in data.keys()]
+            return [f"{prefix}.{k}" for k in data]
         return []
 
+    @staticmethod
+    def _walk_paths(root: dict[str, Any], prefix: str) -> list[str]:
+        """Collect every dotted path below root with an explicit stack.
+
+        Lists and other leaves are listed but not descended into.
+        """
+        paths: list[str] = []
+        stack = [(prefix, root)]
+        while stack:
+            base, node = stack.pop()
+            for key, value in node.items():
+                dotted = f"{base}.{key}" if base else key
+                paths.append(dotted)
+                if isinstance(value, dict):
+                    stack.append((dotted, value))
+        return paths
+
     # =========================================================================
     # COMPOSITION HELPERS
     # =========================================================================
@@ -282,9 +435,29 @@ class Vocab:
         Returns:
             String like "blue fiber", "red fabric", "green cotton"
         """
-        color = self.random("colors.basic")
-        material = self.random(f"materials.{material_type}")
-        return f"{color} {material}" if color and material else material or "material"
+        colors = self.get("colors.basic")
+        materials = self.get(f"materials.{material_type}")
+        if colors and materials and isinstance(colors, list) and isinstance(materials, list):
+            return random.choice(self._colored_materials(colors, materials))
+        return self.random(f"materials.{material_type}") or "material"
+
+    def _colored_materials(self, colors: list[Any], materials: list[Any]) -> tuple[str, ...]:
+        """Return every "color material" phrase, cached per pair of lists.
+
+        A uniform pick from the product is the same distribution as picking
+        a color and a material independently, with one draw instead of two.
+        """
+        cache = self._colored_cache
+        key = (id(colors), id(materials))
+        cached = cache.get(key)
+        if cached is not None and cached[0] is colors and cached[1] is materials:
+            return cached[2]
+
+        phrases = tuple(f"{c} {m}" for c in colors for m in materials)
+        if len(cache) >= self._COLORED_CACHE_SIZE:
+            cache.clear()
+        cache[key] = (colors, materials, phrases)
+        return phrases
 
     def labeled_container(self, use_words: bool = False) -> str:
         """Generate a labeled container.
@@ -390,30 +563,38 @@ class Vocab:
                       "possessive": "her", "reflexive": "herself", "verb_s": "s"}
         """
         # Randomly pick gender (weighted toward gendered for natural problem text)
-        gender = random.choices(["male", "female", "neutral"], weights=[0.45, 0.45, 0.10])[0]
+        gender = random.choices(_GENDERS, cum_weights=_GENDER_CUM_WEIGHTS)[0]
 
         name = self.random(f"names.{gender}")
         pronouns = self.get(f"names.pronouns.{gender}")
 
         if not name or not pronouns:
-            # Fallback
-            return {
-                "name": "Alex",
-                "subject": "they",
-                "object": "them",
-                "possessive": "their",
-                "reflexive": "themselves",
-                "verb_s": "",  # "they eat" not "they eats"
-            }
-
-        return {
-            "name": name,
+            return dict(_FALLBACK_PERSON)
+
+        person = self._person_prototype(gender, pronouns).copy()
+        person["name"] = name
+        return person
+
+    def _person_prototype(self, gender: str, pronouns: dict[str, Any]) -> dict[str, Any]:
+        """Return the pronoun fields for a gender, built once per pronouns dict.
+
+        Callers copy the prototype and fill in the name, which is cheaper
+        than building the six-key dict from scratch on every call.
+        """
+        cached = self._person_protos.get(gender)
+        if cached is not None and cached[0] is pronouns:
+            return cached[1]
+
+        prototype = {
+            "name": None,
             "subject": pronouns["subject"],
             "object": pronouns["object"],
             "possessive": pronouns["possessive"],
             "reflexive": pronouns.get("reflexive", "themselves"),
             "verb_s": "" if gender == "neutral" else "s",  # "she eats" vs "they eat"
         }
+        self._person_protos[gender] = (pronouns, prototype)
+        return prototype
 
     def activity_context(self) -> dict[str, Any]:
         """Get an activity with verb forms.
@@ -435,14 +616,9 @@ class Vocab:
         Returns:
             'an' if word starts with a vowel sound, 'a' otherwise
         """
-        if not word:
-            return "a"
         # Simple heuristic - check first letter
         # Note: This doesn't handle all edge cases (e.g., "hour", "university")
-        first_letter = word[0].lower()
-        if first_letter in "aeiou":
-            return "an"
-        return "a"
+        return "an" if word[:1] in _VOWELS else "a"
 
     def with_article(self, word: str) -> str:
         """Return word with appropriate indefinite article.
@@ -456,13 +632,11 @@ class Vocab:
         return f"{self.a_an(word)} {word}"
 
 
-# Convenience singleton
-_vocab: Vocab | None = None
-
-
+@cache
 def get_vocab() -> Vocab:
-    """Get the singleton Vocab instance."""
-    global _vocab
-    if _vocab is None:
-        _vocab = Vocab()
-    return _vocab
+    """Get the singleton Vocab instance.
+
+    Memoized, so calls after the first are a single cache hit and skip
+    Vocab.__new__ entirely.
+    """
+    return Vocab()
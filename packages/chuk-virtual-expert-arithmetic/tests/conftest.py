@@ -1,6 +1,15 @@
-"""Pytest configuration and fixtures for chuk-virtual-expert-arithmetic tests."""
+"""Pytest configuration and fixtures for chuk-virtual-expert-arithmetic tests.
+
+Session-scoped fixtures hold read-only shared objects, so each test
+process (including each pytest-xdist worker) loads vocab and schemas once.
+Tests that mutate caches should build their own instances instead.
+"""
+
+from typing import Any
 
 import pytest
+from chuk_virtual_expert.registry_v2 import ExpertRegistry
+from chuk_virtual_expert.trace_verifier import TraceVerifier
 
 from chuk_virtual_expert_arithmetic import (
     ArithmeticExpert,
@@ -9,6 +18,14 @@ from chuk_virtual_expert_arithmetic import (
     PercentageExpert,
     RateEquationExpert,
 )
+from chuk_virtual_expert_arithmetic.core import (
+    ContractValidator,
+    SchemaComposer,
+    SchemaLoader,
+    TemplateResolver,
+    get_contract_validator,
+)
+from chuk_virtual_expert_arithmetic.vocab import Vocab, get_vocab
 
 
 @pytest.fixture
@@ -39,3 +56,65 @@ def rate_equation_expert() -> RateEquationExpert:
 def comparison_expert() -> ComparisonExpert:
     """Create a ComparisonExpert instance for testing."""
     return ComparisonExpert()
+
+
+@pytest.fixture(scope="session")
+def shared_vocab() -> Vocab:
+    """Vocab shared by every test in the session."""
+    return get_vocab()
+
+
+@pytest.fixture(scope="session")
+def shared_loader() -> SchemaLoader:
+    """Loader shared by tests that only read schemas."""
+    return SchemaLoader()
+
+
+@pytest.fixture(scope="session")
+def shared_validator(shared_vocab: Vocab) -> ContractValidator:
+    """Contract validator shared by every test in the session."""
+    return get_contract_validator(shared_vocab)
+
+
+@pytest.fixture(scope="session")
+def shared_composer() -> SchemaComposer:
+    """Schema composer shared by every test in the session."""
+    return SchemaComposer()
+
+
+@pytest.fixture(scope="session")
+def shared_resolver() -> TemplateResolver:
+    """Template resolver shared by every test in the session."""
+    return TemplateResolver()
+
+
+@pytest.fixture(scope="session")
+def shared_verifier() -> TraceVerifier:
+    """Trace verifier over all five experts, shared by every test in the session."""
+    registry = ExpertRegistry()
+    registry.register(EntityTrackExpert())
+    registry.register(ArithmeticExpert())
+    registry.register(PercentageExpert())
+    registry.register(RateEquationExpert())
+    registry.register(ComparisonExpert())
+    return TraceVerifier(registry)
+
+
+@pytest.fixture(scope="session")
+def preloaded_schemas(shared_loader: SchemaLoader) -> dict[str, dict[str, Any]]:
+    """Raw schema dicts read from disk once per session."""
+    return shared_loader.get_all_raw()
+
+
+@pytest.fixture
+def in_memory_schemas(
+    monkeypatch: pytest.MonkeyPatch, preloaded_schemas: dict[str, dict[str, Any]]
+) -> None:
+    """Serve SchemaLoader._load_raw from the preloaded dicts instead of the filesystem."""
+    original = SchemaLoader._load_raw
+
+    def load_raw(self: SchemaLoader, name: str) -> dict[str, Any]:
+        raw = preloaded_schemas.get(name)
+        return raw if raw is not None else original(self, name)
+
+    monkeypatch.setattr(SchemaLoader, "_load_raw", load_raw)
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from chuk_virtual_expert_arithmetic.core.composer import CompositionError, SchemaComposer
+from chuk_virtual_expert_arithmetic.core.loader import SchemaLoader
+from chuk_virtual_expert_arithmetic.models import SchemaSpec
 
 
 class TestSchemaComposerInit:
@@ -85,6 +91,50 @@ class TestSchemaComposerLoadBase:
 
             assert loaded1 is loaded2
 
+    def test_mixin_file_read_once_across_composers(self) -> None:
+        """Test separate composers share one read of the same mixin file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            mixins_dir = schema_dir / "mixins"
+            mixins_dir.mkdir()
+            (mixins_dir / "shared_mixin.json").write_text(json.dumps({"name": "shared"}))
+
+            SchemaComposer(schema_dir=schema_dir)._load_mixin("shared_mixin")
+            with patch("builtins.open", side_effect=AssertionError("re-read")):
+                loaded = SchemaComposer(schema_dir=schema_dir)._load_mixin("shared_mixin")
+
+            assert loaded == {"name": "shared"}
+
+    def test_edited_mixin_is_reloaded(self) -> None:
+        """Test a mixin file changed on disk is read again after clear_cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            mixins_dir = schema_dir / "mixins"
+            mixins_dir.mkdir()
+            path = mixins_dir / "edited_mixin.json"
+            path.write_text(json.dumps({"name": "v1"}))
+
+            composer = SchemaComposer(schema_dir=schema_dir)
+            assert composer._load_mixin("edited_mixin")["name"] == "v1"
+
+            path.write_text(json.dumps({"name": "v2"}))
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+            composer.clear_cache()
+
+            assert composer._load_mixin("edited_mixin")["name"] == "v2"
+
+    def test_loaded_mixin_is_private_copy(self) -> None:
+        """Test mutating a loaded mixin does not leak into other composers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            mixins_dir = schema_dir / "mixins"
+            mixins_dir.mkdir()
+            (mixins_dir / "copy_mixin.json").write_text(json.dumps({"name": "orig"}))
+
+            SchemaComposer(schema_dir=schema_dir)._load_mixin("copy_mixin")["name"] = "changed"
+
+            assert SchemaComposer(schema_dir=schema_dir)._load_mixin("copy_mixin")["name"] == "orig"
+
 
 class TestSchemaComposerLoadMixin:
     """Tests for loading mixins."""
@@ -243,6 +293,78 @@ class TestSchemaComposerCompose:
             assert "b" in result["vocab"]
 
 
+def _materialize(value: Any) -> Any:
+    """Convert nested ChainMap views into plain dicts for comparison."""
+    if isinstance(value, Mapping):
+        return {k: _materialize(v) for k, v in value.items()}
+    return value
+
+
+class TestSchemaComposerComposeLazy:
+    """Tests for compose_lazy."""
+
+    def test_matches_compose_for_layered_schema(self) -> None:
+        """Test the lazy view equals compose() across base, mixins and overrides."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir)
+            (schema_dir / "mixins").mkdir()
+            (schema_dir / "bases").mkdir()
+
+            base = {"name": "base", "vocab": {"a": {"type": "choice"}}, "answer": "base"}
+            first = {"vocab": {"b": {"type": "choice"}}, "template_vars": {"x": "one"}}
+            second = {"template_vars": {"x": "two", "y": "two"}, "variables": ["not", "a", "dict"]}
+            (schema_dir / "bases" / "base.json").write_text(json.dumps(base))
+            (schema_dir / "mixins" / "first.json").write_text(json.dumps(first))
+            (schema_dir / "mixins" / "second.json").write_text(json.dumps(second))
+
+            composer = SchemaComposer(schema_dir=schema_dir)
+            schema = {
+                "name": "child",
+                "extends": "base",
+                "mixins": ["first", "second"],
+                "template_vars": {"y": "child"},
+                "variables": {"n": {"type": "int"}},
+            }
+
+            lazy = composer.compose_lazy(schema)
+
+            assert _materialize(lazy) == composer.compose(schema)
+            assert lazy["template_vars"]["x"] == "two"
+            assert lazy["template_vars"]["y"] == "child"
+            assert lazy["variables"] == {"n": {"type": "int"}}
+
+    def test_non_dict_override_hides_lower_dicts(self) -> None:
+        """Test a non-dict value stops deep merging of the layers beneath it."""
+        layers = [{"k": {"top": 1}}, {"k": "flat"}, {"k": {"bottom": 1}}]
+        view = SchemaComposer._chain(layers)  # type: ignore[arg-type]
+        assert _materialize(view) == {"k": {"top": 1}}
+
+    def test_writes_do_not_touch_layers(self) -> None:
+        """Test top-level writes land in the view's own front dict."""
+        composer = SchemaComposer()
+        schema = {"name": "test", "mixins": ["person_vocab"], "answer": "x"}
+        lazy = composer.compose_lazy(schema)
+        lazy["answer"] = "changed"
+        lazy["vocab"] = {}
+
+        assert schema["answer"] == "x"
+        assert composer._load_mixin("person_vocab")["vocab"]
+
+    def test_real_schemas_match_compose(self, shared_loader: SchemaLoader) -> None:
+        """Test every shipped composed schema builds the same SchemaSpec either way."""
+        composer = SchemaComposer()
+        composed = 0
+        for name in shared_loader.schema_names:
+            raw = shared_loader.load_raw(name)
+            if "extends" not in raw and "mixins" not in raw:
+                continue
+            lazy = composer.compose_lazy(raw)
+            assert _materialize(lazy) == composer.compose(raw)
+            assert SchemaSpec(**lazy) == SchemaSpec(**composer.compose(raw))
+            composed += 1
+        assert composed > 0
+
+
 class TestSchemaComposerMerge:
     """Tests for merge methods."""
 
@@ -292,6 +414,39 @@ class TestSchemaComposerMerge:
         assert result["level1"]["level2"]["a"] == 1
         assert result["level1"]["level2"]["b"] == 2
 
+    def test_merge_dicts_does_not_mutate_inputs(self, composer: SchemaComposer) -> None:
+        """Test merged levels are copies and lists are replaced, not merged."""
+        base = {"a": {"b": {"c": 1}, "items": [1, 2]}, "keep": {"k": 1}}
+        override = {"a": {"b": {"d": 2}, "items": [3]}, "new": {"n": 1}}
+
+        result = composer._merge_dicts(base, override)
+
+        assert result == {
+            "a": {"b": {"c": 1, "d": 2}, "items": [3]},
+            "keep": {"k": 1},
+            "new": {"n": 1},
+        }
+        assert base == {"a": {"b": {"c": 1}, "items": [1, 2]}, "keep": {"k": 1}}
+        assert override == {"a": {"b": {"d": 2}, "items": [3]}, "new": {"n": 1}}
+
+    def test_merge_dicts_deep_nesting(self, composer: SchemaComposer) -> None:
+        """Test merging nests deeper than the recursion limit."""
+        depth = 2000
+        base: dict = {}
+        override: dict = {}
+        b, o = base, override
+        for _ in range(depth):
+            b["x"] = {}
+            o["x"] = {}
+            b, o = b["x"], o["x"]
+        b["left"] = 1
+        o["right"] = 2
+
+        node = composer._merge_dicts(base, override)
+        for _ in range(depth):
+            node = node["x"]
+        assert node == {"left": 1, "right": 2}
+
 
 class TestSchemaComposerList:
     """Tests for list methods."""
@@ -48,7 +48,7 @@ class TestConstraintValidatorCheck:
         """Test checking empty constraints."""
         satisfied, violated = validator.check({}, {"a": 5})
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_satisfied_single_constraint(self, validator: ConstraintValidator) -> None:
         """Test checking single satisfied constraint."""
@@ -58,7 +58,7 @@ class TestConstraintValidatorCheck:
         satisfied, violated = validator.check(constraints, variables)
 
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_violated_min_constraint(self, validator: ConstraintValidator) -> None:
         """Test checking violated min constraint."""
@@ -92,7 +92,7 @@ class TestConstraintValidatorCheck:
         satisfied, violated = validator.check(constraints, variables)
 
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_complex_expression(self, validator: ConstraintValidator) -> None:
         """Test checking complex expression constraint."""
@@ -102,7 +102,7 @@ class TestConstraintValidatorCheck:
         satisfied, violated = validator.check(constraints, variables)
 
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_only_min_bound(self, validator: ConstraintValidator) -> None:
         """Test constraint with only min bound."""
@@ -112,7 +112,7 @@ class TestConstraintValidatorCheck:
         satisfied, violated = validator.check(constraints, variables)
 
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_only_max_bound(self, validator: ConstraintValidator) -> None:
         """Test constraint with only max bound."""
@@ -122,7 +122,7 @@ class TestConstraintValidatorCheck:
         satisfied, violated = validator.check(constraints, variables)
 
         assert satisfied is True
-        assert violated == []
+        assert violated == ()
 
     def test_check_exact_boundary_min(self, validator: ConstraintValidator) -> None:
         """Test constraint at exact min boundary."""
@@ -142,6 +142,28 @@ class TestConstraintValidatorCheck:
 
         assert satisfied is True
 
+    def test_check_bare_variable_skips_evaluator(self, validator: ConstraintValidator) -> None:
+        """Test a constraint on a bare variable name is read directly."""
+        calls = []
+        original = validator._evaluator.compile
+
+        def counting_compile(expr: str):
+            calls.append(expr)
+            return original(expr)
+
+        validator._evaluator.compile = counting_compile  # type: ignore[method-assign]
+        constraints = {"a": {"min": 0, "max": 10}, "a + 1": {"max": 5}}
+
+        satisfied, violated = validator.check(constraints, {"a": 7})
+
+        assert calls == ["a + 1"]
+        assert violated == ("a + 1",)
+
+    def test_check_keyword_constraint_is_parsed(self, validator: ConstraintValidator) -> None:
+        """Test keyword-like keys such as True still go through the evaluator."""
+        satisfied, violated = validator.check({"True": {"min": 1, "max": 1}}, {})
+        assert satisfied is True
+
     def test_check_expression_error(self, validator: ConstraintValidator) -> None:
         """Test constraint with expression error."""
         constraints = {"undefined_var": {"min": 0, "max": 10}}
@@ -162,6 +184,41 @@ class TestConstraintValidatorCheck:
         assert satisfied is True
 
 
+class TestConstraintValidatorCheckBatch:
+    """Tests for check_batch method."""
+
+    def test_check_batch_mask(self) -> None:
+        """Test per-row flags and the row-major violation mask."""
+        validator = ConstraintValidator()
+        constraints = {"a": {"min": 0, "max": 10}, "a + b": {"max": 15}}
+        rows = [{"a": 5, "b": 5}, {"a": 20, "b": 0}, {"a": 5, "b": 20}]
+
+        satisfied, mask = validator.check_batch(constraints, rows)
+
+        assert satisfied == [True, False, False]
+        assert mask == bytearray([0, 0, 1, 1, 0, 1])
+
+    def test_check_batch_matches_check(self) -> None:
+        """Test check_batch agrees with check row by row."""
+        validator = ConstraintValidator()
+        constraints = {"a": {"min": 2}, "undefined": {"min": 0}}
+        rows = [{"a": 1}, {"a": 3}]
+
+        satisfied, mask = validator.check_batch(constraints, rows)
+        keys = list(constraints)
+
+        for i, row in enumerate(rows):
+            ok, violated = validator.check(constraints, row)
+            assert satisfied[i] is ok
+            assert [keys[j] for j in range(len(keys)) if mask[i * len(keys) + j]] == list(violated)
+
+    def test_check_batch_empty(self) -> None:
+        """Test check_batch with no rows or no constraints."""
+        validator = ConstraintValidator()
+        assert validator.check_batch({"a": {"min": 0}}, []) == ([], bytearray())
+        assert validator.check_batch({}, [{"a": 1}]) == ([True], bytearray())
+
+
 class TestConstraintValidatorApply:
     """Tests for apply method."""
 
@@ -236,6 +293,64 @@ class TestConstraintValidatorApply:
         assert result["a"] == 10
         assert any("Constraint validation failed" in record.message for record in caplog.records)
 
+    def test_apply_parses_constraints_once(self, validator: ConstraintValidator) -> None:
+        """Test apply parses each expression once across all attempts."""
+        constraints = {"a + b": {"min": 100, "max": 200}}
+        calls = []
+        original = validator._evaluator.compile
+
+        def counting_compile(expr: str):
+            calls.append(expr)
+            return original(expr)
+
+        validator._evaluator.compile = counting_compile  # type: ignore[method-assign]
+        validator.apply(constraints, {"a": 1, "b": 1}, lambda: {"a": 1, "b": 1})
+
+        assert calls == ["a + b"]
+
+    def test_apply_unparseable_constraint_never_satisfied(
+        self, validator: ConstraintValidator
+    ) -> None:
+        """Test an unparseable constraint counts as violated on every attempt."""
+        attempts = [0]
+
+        def regenerate() -> dict:
+            attempts[0] += 1
+            return {"a": 1}
+
+        validator.apply({"a +": {"min": 0}}, {"a": 1}, regenerate)
+
+        assert attempts[0] == 5
+
+    def test_apply_skips_recheck_when_warnings_disabled(
+        self, validator: ConstraintValidator, caplog
+    ) -> None:
+        """Test the final best-effort check only runs when it would be logged."""
+        constraints = {"a": {"min": 100, "max": 200}}
+        checks = [0]
+        original = validator._check_plan
+
+        def counting_check(plan, variables):
+            checks[0] += 1
+            return original(plan, variables)
+
+        validator._check_plan = counting_check  # type: ignore[method-assign]
+
+        with caplog.at_level(logging.ERROR, logger="chuk_virtual_expert_arithmetic"):
+            validator.apply(constraints, {"a": 5}, lambda: {"a": 10})
+
+        assert checks[0] == 5
+        assert not caplog.records
+
+    def test_apply_does_not_copy_variables(self, validator: ConstraintValidator) -> None:
+        """Test apply returns the checked dict itself rather than a copy."""
+        constraints = {"a": {"min": 10, "max": 20}}
+        initial = {"a": 15}
+        assert validator.apply(constraints, initial, dict) is initial
+
+        regenerated = {"a": 12}
+        assert validator.apply(constraints, {"a": 0}, lambda: regenerated) is regenerated
+
     def test_apply_preserves_other_variables(self, validator: ConstraintValidator) -> None:
         """Test apply preserves variables not in constraint."""
         constraints = {"a": {"min": 10, "max": 20}}
@@ -250,6 +365,60 @@ class TestConstraintValidatorApply:
         assert result["b"] == 100
         assert result["c"] == "hello"
 
+    def test_apply_regenerates_only_violated_vars(self, validator: ConstraintValidator) -> None:
+        """Test regenerate_vars redraws just the variables in violated constraints."""
+        constraints = {"a": {"min": 10, "max": 20}, "b + c": {"max": 50}}
+        initial = {"a": 5, "b": 1, "c": 2, "d": 7}
+        requested: list[frozenset[str]] = []
+
+        def regenerate_vars(names: frozenset[str]) -> dict:
+            requested.append(names)
+            return {"a": 15}
+
+        def regenerate() -> dict:
+            raise AssertionError("full regeneration not expected")
+
+        result = validator.apply(constraints, initial, regenerate, regenerate_vars)
+
+        assert requested == [frozenset({"a"})]
+        assert result == {"a": 15, "b": 1, "c": 2, "d": 7}
+        assert initial["a"] == 5
+
+    def test_apply_regenerate_vars_covers_expression_vars(
+        self, validator: ConstraintValidator
+    ) -> None:
+        """Test every variable of a violated expression is redrawn."""
+        requested: list[frozenset[str]] = []
+
+        def regenerate_vars(names: frozenset[str]) -> dict:
+            requested.append(names)
+            return {"a": 1, "b": 1}
+
+        result = validator.apply(
+            {"a + b": {"max": 10}}, {"a": 20, "b": 5, "c": 0}, dict, regenerate_vars
+        )
+
+        assert requested == [frozenset({"a", "b"})]
+        assert result == {"a": 1, "b": 1, "c": 0}
+
+    def test_apply_unparseable_falls_back_to_full_regeneration(
+        self, validator: ConstraintValidator
+    ) -> None:
+        """Test an unparseable violated constraint triggers full regeneration."""
+        calls = {"full": 0, "partial": 0}
+
+        def regenerate() -> dict:
+            calls["full"] += 1
+            return {"a": 1}
+
+        def regenerate_vars(names: frozenset[str]) -> dict:
+            calls["partial"] += 1
+            return {}
+
+        validator.apply({"a +": {"min": 0}}, {"a": 1}, regenerate, regenerate_vars)
+
+        assert calls == {"full": 5, "partial": 0}
+
 
 class TestConstraintValidatorValidateExpressions:
     """Tests for validate_expressions method."""
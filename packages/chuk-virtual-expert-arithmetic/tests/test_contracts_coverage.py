@@ -4,25 +4,29 @@ from __future__ import annotations
 
 from typing import Any
 
-from chuk_virtual_expert_arithmetic.core.contracts import ContractValidator
+from chuk_virtual_expert_arithmetic.core.contracts import ContractValidator, get_contract_validator
 from chuk_virtual_expert_arithmetic.models.schema_spec import SchemaSpec, VariableSpec, VocabSpec
 
 
+def _flatten(data: dict[str, Any], prefix: str, out: dict[str, Any]) -> None:
+    """Index every nested value in data under its dotted path."""
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+
+
 class MockVocab:
     """Mock Vocab for testing ContractValidator."""
 
     def __init__(self, data: dict[str, Any] | None = None) -> None:
         self._data = data or {}
+        self._flat: dict[str, Any] = {}
+        _flatten(self._data, "", self._flat)
 
     def get(self, path: str) -> Any:
-        parts = path.split(".")
-        current = self._data
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
-                return None
-        return current
+        return self._flat.get(path)
 
 
 class TestValidateSchemaNoPattern:
@@ -323,6 +327,19 @@ class TestGetProvidedVars:
         assert "subj1" in provided
         assert "his_her1" in provided
 
+    def test_from_person_uncommon_suffix_vocab(self) -> None:
+        """Test suffixes outside the precomputed table are still derived."""
+        vocab = MockVocab()
+        validator = ContractValidator(vocab)
+        schema = SchemaSpec(
+            name="test",
+            answer="x",
+            vocab={"person_b": VocabSpec(type="person_with_pronouns")},
+        )
+        provided = validator._get_provided_vars(schema)
+        assert "name_b" in provided
+        assert "was_were_b" in provided
+
     def test_from_path_vocab(self) -> None:
         """Test vars from path-based vocab."""
         vocab = MockVocab()
@@ -362,6 +379,53 @@ class TestGetProvidedVars:
         assert "mult_word" in provided
         assert "growth_word" in provided
 
+    def test_validate_all_resolves_shared_pattern_once(self) -> None:
+        """Test schemas sharing a pattern only look it up once per sweep."""
+        vocab = MockVocab({"patterns": {"needs_name": {"templates": ["${name} runs"]}}})
+        lookups: list[str] = []
+        original_get = vocab.get
+
+        def counting_get(path: str) -> Any:
+            lookups.append(path)
+            return original_get(path)
+
+        vocab.get = counting_get  # type: ignore[method-assign]
+        validator = ContractValidator(vocab)
+        schemas = {
+            name: SchemaSpec(name=name, pattern="needs_name", answer="x")
+            for name in ("a", "b", "c")
+        }
+        errors = validator.validate_all(schemas)
+        assert set(errors) == {"a", "b", "c"}
+        assert lookups == ["patterns.needs_name"]
+
+        # A new sweep starts from a fresh cache
+        validator.validate_all(schemas)
+        assert lookups == ["patterns.needs_name", "patterns.needs_name"]
+
+    def test_provided_vars_cached_per_schema(self) -> None:
+        """Test provided vars are computed once per schema until validate_all."""
+        validator = ContractValidator(MockVocab())
+        schema = SchemaSpec(
+            name="test",
+            answer="x",
+            variables={"count": VariableSpec(type="int")},
+            vocab={"person": VocabSpec(type="person_with_pronouns")},
+        )
+        provided = validator._get_provided_vars(schema)
+        assert isinstance(provided, frozenset)
+        assert {"count", "name", "his_her"} <= provided
+        assert validator._get_provided_vars(schema) is provided
+
+        # An equal but distinct schema gets its own entry
+        twin = schema.model_copy()
+        assert validator._get_provided_vars(twin) == provided
+
+        # validate_all starts a fresh sweep and sees edits made since
+        schema.variables["extra"] = VariableSpec(type="int")
+        validator.validate_all({})
+        assert "extra" in validator._get_provided_vars(schema)
+
 
 class TestGetPatternRequirements:
     """Tests for get_pattern_requirements method."""
@@ -397,3 +461,63 @@ class TestGetPatternRequirements:
         validator = ContractValidator(vocab)
         reqs = validator.get_pattern_requirements("test", "variant1")
         assert reqs == {"y", "z"}
+
+    def test_requirements_are_frozen_and_shared(self) -> None:
+        """Test cached requirements are immutable and reused."""
+        vocab = MockVocab({"patterns": {"test": {"templates": ["${a}"]}}})
+        validator = ContractValidator(vocab)
+        first = validator.get_pattern_requirements("test")
+        assert isinstance(first, frozenset)
+        assert validator.get_pattern_requirements("test") is first
+
+    def test_default_requirements_weighted_and_list_forms(self) -> None:
+        """Test the no-variant path handles weighted dicts and list patterns."""
+        vocab = MockVocab(
+            {
+                "patterns": {
+                    "weighted": {"templates": [{"text": "${a}", "weight": 2}, "${b}"]},
+                    "listed": ["${c}", 7],
+                    "variants_only": {"default": ["${d}"]},
+                }
+            }
+        )
+        validator = ContractValidator(vocab)
+        assert validator.get_pattern_requirements("weighted") == {"a", "b"}
+        assert validator.get_pattern_requirements("listed") == {"c"}
+        assert validator.get_pattern_requirements("variants_only") == frozenset()
+
+    def test_missing_lookups_do_not_hide_validation_errors(self) -> None:
+        """Test empty requirements from failed lookups are not cached for validate_schema."""
+        vocab = MockVocab({"patterns": {"p": {"default": ["${x}"]}}})
+        validator = ContractValidator(vocab)
+        assert validator.get_pattern_requirements("p", "nope") == frozenset()
+        assert validator.get_pattern_requirements("p") == frozenset()
+
+        errors = validator.validate_schema(
+            SchemaSpec(name="t", pattern="p", variant="nope", answer="x")
+        )
+        assert errors == ["Variant 'nope' not found in pattern 'p'"]
+        errors = validator.validate_schema(SchemaSpec(name="t", pattern="p", answer="x"))
+        assert errors == ["No templates found in pattern 'p'"]
+
+
+class TestGetContractValidator:
+    """Tests for the shared validator accessor."""
+
+    def test_same_vocab_same_validator(self) -> None:
+        """Test one validator is shared per vocab object."""
+        vocab = MockVocab()
+        validator = get_contract_validator(vocab)
+        assert get_contract_validator(vocab) is validator
+        assert validator._vocab is vocab
+
+    def test_distinct_vocabs_get_distinct_validators(self) -> None:
+        """Test different vocab objects never share a validator."""
+        assert get_contract_validator(MockVocab()) is not get_contract_validator(MockVocab())
+
+    def test_default_vocab(self) -> None:
+        """Test the default validator wraps the global vocab."""
+        from chuk_virtual_expert_arithmetic.vocab import get_vocab
+
+        assert get_contract_validator()._vocab is get_vocab()
+        assert get_contract_validator() is get_contract_validator(get_vocab())
@@ -1,5 +1,10 @@
 """Tests for core components."""
 
+import random
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
 import pytest
 
 from chuk_virtual_expert_arithmetic.core import (
@@ -15,15 +20,20 @@ from chuk_virtual_expert_arithmetic.core import (
     VariableGenerator,
 )
 from chuk_virtual_expert_arithmetic.models import SchemaSpec, VariableSpec, VocabSpec
-from chuk_virtual_expert_arithmetic.vocab import get_vocab
+from chuk_virtual_expert_arithmetic.vocab import Vocab
 
 
 class TestSchemaLoader:
     """Tests for SchemaLoader."""
 
     @pytest.fixture
-    def loader(self) -> SchemaLoader:
-        """Create a loader instance."""
+    def loader(self, shared_loader: SchemaLoader) -> SchemaLoader:
+        """Use the shared loader; its schemas are parsed once per session."""
+        return shared_loader
+
+    @pytest.fixture
+    def fresh_loader(self, in_memory_schemas: None) -> SchemaLoader:
+        """Create a private loader for tests that mutate its cache."""
         return SchemaLoader()
 
     def test_load_existing_schema(self, loader: SchemaLoader) -> None:
@@ -60,11 +70,22 @@ class TestSchemaLoader:
         schema2 = loader.load("multiply_add")
         assert schema1 is schema2  # Same object from cache
 
-    def test_clear_cache(self, loader: SchemaLoader) -> None:
+    def test_clear_cache(self, fresh_loader: SchemaLoader) -> None:
         """Test cache clearing."""
-        loader.load("multiply_add")
-        loader.clear_cache()
-        assert len(loader._cache) == 0
+        fresh_loader.load("multiply_add")
+        fresh_loader.clear_cache()
+        assert len(fresh_loader._cache) == 0
+
+    def test_fresh_loader_reads_from_memory(
+        self, fresh_loader: SchemaLoader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the in-memory fixture serves schemas without touching disk."""
+
+        def fail_read(self: SchemaLoader, path: object) -> dict[str, Any]:
+            raise AssertionError(f"unexpected read of {path}")
+
+        monkeypatch.setattr(SchemaLoader, "_read_json", fail_read)
+        assert fresh_loader.load("multiply_add").name == "multiply_add"
 
 
 class TestVariableGenerator:
@@ -131,14 +152,13 @@ class TestVariableGenerator:
         """Test avoid_round constraint generates non-round numbers."""
         spec = VariableSpec(type="int", min=1, max=100, avoid_round=True)
         # Generate multiple values to verify pattern
-        for _ in range(20):
-            value = generator.generate_one(spec)
+        for value in generator.generate_batch(spec, 20):
             assert value % 10 != 0, f"Expected non-round number, got {value}"
 
     def test_difficulty_easy(self, generator: VariableGenerator) -> None:
         """Test easy difficulty generates small, round numbers."""
         spec = VariableSpec(type="int", min=1, max=100, difficulty="easy")
-        values = [generator.generate_one(spec) for _ in range(20)]
+        values = generator.generate_batch(spec, 20)
         # Easy should produce small, round numbers (multiples of 5)
         for v in values:
             assert v <= 30, f"Easy mode should produce small numbers, got {v}"
@@ -147,18 +167,14 @@ class TestVariableGenerator:
     def test_difficulty_hard(self, generator: VariableGenerator) -> None:
         """Test hard difficulty generates larger, non-round numbers."""
         spec = VariableSpec(type="int", min=1, max=100, difficulty="hard")
-        non_round_count = 0
-        for _ in range(20):
-            value = generator.generate_one(spec)
-            if value % 10 != 0:
-                non_round_count += 1
+        counts = Counter(v % 10 == 0 for v in generator.generate_batch(spec, 1000))
         # Most should be non-round
-        assert non_round_count > 10, "Hard mode should mostly produce non-round numbers"
+        assert counts[True] < 50, f"Hard mode should mostly produce non-round numbers: {counts}"
 
     def test_difficulty_medium(self, generator: VariableGenerator) -> None:
         """Test medium difficulty generates standard range."""
         spec = VariableSpec(type="int", min=1, max=100, difficulty="medium")
-        values = [generator.generate_one(spec) for _ in range(20)]
+        values = generator.generate_batch(spec, 20)
         # Medium should produce values in the specified range
         for v in values:
             assert 1 <= v <= 100
@@ -213,35 +229,29 @@ class TestConstraintValidator:
 class TestTransformRegistry:
     """Tests for TransformRegistry."""
 
-    def test_pluralize(self) -> None:
-        """Test pluralize transform."""
-        assert TransformRegistry.apply("apple", "pluralize") == "apples"
-        assert TransformRegistry.apply("box", "pluralize") == "boxes"
-        assert TransformRegistry.apply("baby", "pluralize") == "babies"
-
-    def test_singularize(self) -> None:
-        """Test singularize transform."""
-        assert TransformRegistry.apply("apples", "singularize") == "apple"
-        assert TransformRegistry.apply("boxes", "singularize") == "box"
-        assert TransformRegistry.apply("babies", "singularize") == "baby"
-
-    def test_capitalize(self) -> None:
-        """Test capitalize transform."""
-        assert TransformRegistry.apply("hello", "capitalize") == "Hello"
-        assert TransformRegistry.apply("HELLO", "capitalize") == "Hello"
-
-    def test_with_article(self) -> None:
-        """Test with_article transform."""
-        assert TransformRegistry.apply("apple", "with_article") == "an apple"
-        assert TransformRegistry.apply("banana", "with_article") == "a banana"
-
-    def test_ordinal(self) -> None:
-        """Test ordinal transform."""
-        assert TransformRegistry.apply(1, "ordinal") == "1st"
-        assert TransformRegistry.apply(2, "ordinal") == "2nd"
-        assert TransformRegistry.apply(3, "ordinal") == "3rd"
-        assert TransformRegistry.apply(11, "ordinal") == "11th"
-        assert TransformRegistry.apply(21, "ordinal") == "21st"
+    @pytest.mark.parametrize(
+        ("value", "transform", "expected"),
+        [
+            ("apple", "pluralize", "apples"),
+            ("box", "pluralize", "boxes"),
+            ("baby", "pluralize", "babies"),
+            ("apples", "singularize", "apple"),
+            ("boxes", "singularize", "box"),
+            ("babies", "singularize", "baby"),
+            ("hello", "capitalize", "Hello"),
+            ("HELLO", "capitalize", "Hello"),
+            ("apple", "with_article", "an apple"),
+            ("banana", "with_article", "a banana"),
+            (1, "ordinal", "1st"),
+            (2, "ordinal", "2nd"),
+            (3, "ordinal", "3rd"),
+            (11, "ordinal", "11th"),
+            (21, "ordinal", "21st"),
+        ],
+    )
+    def test_builtin_transforms(self, value: object, transform: str, expected: str) -> None:
+        """Test the built-in transforms."""
+        assert TransformRegistry.apply(value, transform) == expected
 
     def test_custom_transform(self) -> None:
         """Test registering a custom transform."""
@@ -256,40 +266,32 @@ class TestTemplateResolver:
     """Tests for TemplateResolver."""
 
     @pytest.fixture
-    def resolver(self) -> TemplateResolver:
-        """Create a resolver instance."""
-        return TemplateResolver()
-
-    def test_resolve_literal(self, resolver: TemplateResolver) -> None:
-        """Test resolving literal values."""
-        result = resolver.resolve("hello", {}, {})
-        assert result == "hello"
-
-    def test_resolve_variable(self, resolver: TemplateResolver) -> None:
-        """Test resolving variable references."""
-        result = resolver.resolve("count", {"count": 42}, {})
-        assert result == 42
-
-    def test_resolve_vocab_item(self, resolver: TemplateResolver) -> None:
-        """Test resolving vocab items."""
-        result = resolver.resolve("item", {}, {"item": "apple"})
-        assert result == "apple"
-
-    def test_resolve_dot_notation(self, resolver: TemplateResolver) -> None:
-        """Test resolving dot notation."""
-        vocab = {"person": {"name": "Alice", "subject": "she"}}
-        result = resolver.resolve("person.name", {}, vocab)
-        assert result == "Alice"
-
-    def test_resolve_with_transform(self, resolver: TemplateResolver) -> None:
-        """Test resolving with transforms."""
-        result = resolver.resolve("item|pluralize", {}, {"item": "apple"})
-        assert result == "apples"
-
-    def test_resolve_chained_transforms(self, resolver: TemplateResolver) -> None:
-        """Test resolving chained transforms."""
-        result = resolver.resolve("item|singularize|capitalize", {}, {"item": "apples"})
-        assert result == "Apple"
+    def resolver(self, shared_resolver: TemplateResolver) -> TemplateResolver:
+        """Use the shared resolver; it holds no per-test state."""
+        return shared_resolver
+
+    @pytest.mark.parametrize(
+        ("spec", "variables", "vocab", "expected"),
+        [
+            ("hello", {}, {}, "hello"),
+            ("count", {"count": 42}, {}, 42),
+            ("item", {}, {"item": "apple"}, "apple"),
+            ("person.name", {}, {"person": {"name": "Alice", "subject": "she"}}, "Alice"),
+            ("item|pluralize", {}, {"item": "apple"}, "apples"),
+            ("item|singularize|capitalize", {}, {"item": "apples"}, "Apple"),
+        ],
+        ids=["literal", "variable", "vocab_item", "dot_notation", "transform", "chained"],
+    )
+    def test_resolve(
+        self,
+        resolver: TemplateResolver,
+        spec: str,
+        variables: dict[str, object],
+        vocab: dict[str, object],
+        expected: object,
+    ) -> None:
+        """Test resolving literals, variables, vocab paths and transforms."""
+        assert resolver.resolve(spec, variables, vocab) == expected
 
     def test_build_template_vars(self, resolver: TemplateResolver) -> None:
         """Test building complete template vars."""
@@ -339,15 +341,16 @@ class TestContractValidator:
     """Tests for ContractValidator."""
 
     @pytest.fixture
-    def validator(self) -> ContractValidator:
-        """Create a validator instance."""
-        return ContractValidator(get_vocab())
+    def validator(self, shared_validator: ContractValidator) -> ContractValidator:
+        """Use the shared validator."""
+        return shared_validator
 
-    def test_validate_valid_schema(self, validator: ContractValidator) -> None:
+    def test_validate_valid_schema(
+        self, validator: ContractValidator, shared_loader: SchemaLoader
+    ) -> None:
         """Test validating a schema with all required vars."""
         # Load an actual schema that should be valid
-        loader = SchemaLoader()
-        schema = loader.load("multiply_add")
+        schema = shared_loader.load("multiply_add")
         errors = validator.validate_schema(schema)
         assert errors == []
 
@@ -379,10 +382,11 @@ class TestContractValidator:
         errors = validator.validate_schema(schema)
         assert len(errors) >= 1
 
-    def test_validate_all_schemas(self, validator: ContractValidator) -> None:
+    def test_validate_all_schemas(
+        self, validator: ContractValidator, shared_loader: SchemaLoader
+    ) -> None:
         """Test validating all loaded schemas."""
-        loader = SchemaLoader()
-        schemas = loader.get_all()
+        schemas = shared_loader.get_all()
         errors = validator.validate_all(schemas)
 
         # Most schemas should be valid (we fixed them earlier)
@@ -393,7 +397,7 @@ class TestContractValidator:
         """Test extracting required variables from a pattern."""
         # This depends on actual patterns existing
         reqs = validator.get_pattern_requirements("multiply_add", "default")
-        assert isinstance(reqs, set)
+        assert isinstance(reqs, frozenset)
 
     def test_provided_vars_from_person_vocab(self, validator: ContractValidator) -> None:
         """Test that person vocab auto-generates expected vars."""
@@ -422,34 +426,40 @@ class TestContractValidator:
 class TestWeightedTemplates:
     """Tests for weighted template selection."""
 
-    def test_weighted_template_selection(self) -> None:
+    def test_weighted_template_selection(self, shared_vocab: Vocab) -> None:
         """Test that weighted templates are selected correctly."""
-        vocab = get_vocab()
+        vocab = shared_vocab
 
         # Test with simple string templates (should work as before)
         simple_templates = ["Template A", "Template B", "Template C"]
         result = vocab._select_weighted_template(simple_templates)
         assert result in simple_templates
 
-    def test_weighted_dict_templates(self) -> None:
+    @pytest.fixture
+    def seeded_random(self) -> Iterator[None]:
+        """Seed the global random module Vocab draws from, restoring it afterwards."""
+        state = random.getstate()
+        random.seed(0)
+        yield
+        random.setstate(state)
+
+    def test_weighted_dict_templates(self, shared_vocab: Vocab, seeded_random: None) -> None:
         """Test selection from weighted dict templates."""
-        vocab = get_vocab()
-
         weighted_templates = [
             {"text": "Common template", "weight": 100},
             {"text": "Rare template", "weight": 1},
         ]
 
-        # Run many times - common should appear much more often
-        results = [vocab._select_weighted_template(weighted_templates) for _ in range(100)]
-        common_count = sum(1 for r in results if r == "Common template")
+        # One batch draw - common should appear much more often
+        counts = Counter(shared_vocab._select_weighted_templates(weighted_templates, 1000))
 
         # With weights 100:1, common should appear ~99% of the time
-        assert common_count > 80, f"Expected >80 common, got {common_count}"
+        assert counts["Common template"] > 950, f"Expected >950 common, got {counts}"
+        assert counts["Common template"] + counts["Rare template"] == 1000
 
-    def test_mixed_templates(self) -> None:
+    def test_mixed_templates(self, shared_vocab: Vocab) -> None:
         """Test selection from mixed string and dict templates."""
-        vocab = get_vocab()
+        vocab = shared_vocab
 
         mixed_templates = [
             "Simple string template",
@@ -459,15 +469,15 @@ class TestWeightedTemplates:
         result = vocab._select_weighted_template(mixed_templates)
         assert result in ["Simple string template", "Weighted template"]
 
-    def test_empty_templates(self) -> None:
+    def test_empty_templates(self, shared_vocab: Vocab) -> None:
         """Test handling of empty template list."""
-        vocab = get_vocab()
+        vocab = shared_vocab
         result = vocab._select_weighted_template([])
         assert result == ""
 
-    def test_non_list_template(self) -> None:
+    def test_non_list_template(self, shared_vocab: Vocab) -> None:
         """Test handling of non-list template."""
-        vocab = get_vocab()
+        vocab = shared_vocab
         result = vocab._select_weighted_template("single template")
         assert result == "single template"
 
@@ -476,9 +486,9 @@ class TestSchemaComposer:
     """Tests for SchemaComposer."""
 
     @pytest.fixture
-    def composer(self) -> SchemaComposer:
-        """Create a composer instance."""
-        return SchemaComposer()
+    def composer(self, shared_composer: SchemaComposer) -> SchemaComposer:
+        """Use the shared composer; mixins are read once per session."""
+        return shared_composer
 
     def test_list_mixins(self, composer: SchemaComposer) -> None:
         """Test listing available mixins."""
@@ -562,7 +572,7 @@ class TestSchemaComposer:
         assert result["b"] == 3  # Kept from base
         assert result["c"] == 4  # Added from override
 
-    def test_loader_with_composition(self) -> None:
+    def test_loader_with_composition(self, in_memory_schemas: None) -> None:
         """Test that loader applies composition."""
         loader = SchemaLoader(compose=True)
 
@@ -570,7 +580,7 @@ class TestSchemaComposer:
         schema = loader.load("multiply_add")
         assert schema.name == "multiply_add"
 
-    def test_loader_without_composition(self) -> None:
+    def test_loader_without_composition(self, in_memory_schemas: None) -> None:
         """Test loader with composition disabled."""
         loader = SchemaLoader(compose=False)
 
@@ -583,9 +593,9 @@ class TestDomainSampler:
     """Tests for DomainSampler."""
 
     @pytest.fixture
-    def sampler(self) -> DomainSampler:
-        """Create a sampler instance."""
-        return DomainSampler(get_vocab(), seed=42)
+    def sampler(self, shared_vocab: Vocab) -> DomainSampler:
+        """Create a freshly seeded sampler over the shared vocab."""
+        return DomainSampler(shared_vocab, seed=42)
 
     def test_list_domains(self, sampler: DomainSampler) -> None:
         """Test listing available domains."""
@@ -629,10 +639,10 @@ class TestDomainSampler:
         domain = sampler.random_domain()
         assert domain in sampler.list_domains()
 
-    def test_reproducible_with_seed(self) -> None:
+    def test_reproducible_with_seed(self, shared_vocab: Vocab) -> None:
         """Test that same seed gives same results."""
-        sampler1 = DomainSampler(get_vocab(), seed=123)
-        sampler2 = DomainSampler(get_vocab(), seed=123)
+        sampler1 = DomainSampler(shared_vocab, seed=123)
+        sampler2 = DomainSampler(shared_vocab, seed=123)
 
         context1 = sampler1.sample("kitchen")
         context2 = sampler2.sample("kitchen")
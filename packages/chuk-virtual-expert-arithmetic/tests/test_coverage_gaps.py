@@ -4,6 +4,27 @@ from __future__ import annotations
 
 import pytest
 
+from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
+
+
+@pytest.fixture(scope="module")
+def gen() -> SchemaGenerator:
+    """One SchemaGenerator shared by the read-only generator tests."""
+    return SchemaGenerator()
+
+
+@pytest.fixture(scope="module")
+def gen_words_on() -> SchemaGenerator:
+    """SchemaGenerator that always converts numbers to words."""
+    return SchemaGenerator(word_number_prob=1.0)
+
+
+@pytest.fixture(scope="module")
+def gen_words_off() -> SchemaGenerator:
+    """SchemaGenerator that never converts numbers to words."""
+    return SchemaGenerator(word_number_prob=0.0)
+
+
 # =============================================================================
 # SCHEMAS MODULE TESTS
 # =============================================================================
@@ -536,6 +557,21 @@ class TestCompositionModule:
             assert "query" in result
             assert "answer" in result
 
+    def test_generate_function_seeded(self):
+        import random
+
+        from chuk_virtual_expert_arithmetic.generators.composition import generate
+
+        state = random.getstate()
+        try:
+            random.seed(7)
+            first = [r["query"] for r in generate(n=10)]
+            random.seed(7)
+            assert [r["query"] for r in generate(n=10)] == first
+            assert generate(n=0) == []
+        finally:
+            random.setstate(state)
+
     def test_generators_list_complete(self):
         from chuk_virtual_expert_arithmetic.generators.composition import GENERATORS
 
@@ -602,6 +638,22 @@ class TestGeneratorsInit:
         for ex in examples:
             assert ex["composed"] is True
 
+    def test_generate_composition_seeded_and_restores_random(self):
+        import random
+
+        from chuk_virtual_expert_arithmetic.generators import TraceGenerator
+
+        original = random.getstate()
+        try:
+            random.seed(3)
+            state = random.getstate()
+            first = [ex["query"] for ex in TraceGenerator(seed=42).generate_composition(n=5)]
+            assert random.getstate() == state
+            second = [ex["query"] for ex in TraceGenerator(seed=42).generate_composition(n=5)]
+            assert first == second
+        finally:
+            random.setstate(original)
+
 
 # =============================================================================
 # SCHEMA_GENERATOR ADDITIONAL TESTS
@@ -611,99 +663,63 @@ class TestGeneratorsInit:
 class TestSchemaGeneratorCoverage:
     """Additional tests for schema_generator.py edge cases."""
 
-    def test_generate_batch_empty_schemas(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        # Empty schema list raises IndexError from random.choice
-        with pytest.raises(IndexError):
+    def test_generate_batch_empty_schemas(self, gen):
+        with pytest.raises(IndexError, match="at least one schema"):
             gen.generate_batch([], n=5)
+        assert gen.generate_batch([], n=0) == []
 
-    def test_schema_names_property(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_schema_names_property(self, gen):
         names = gen.schema_names
         assert isinstance(names, list)
         assert len(names) > 0
 
-    def test_generate_single_schema(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_single_schema(self, gen):
         example = gen.generate("price_chain")
         assert example is not None
         assert example.expert == "arithmetic"
 
-    def test_generate_invalid_schema(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_invalid_schema(self, gen):
         # Invalid schema raises ValueError
         with pytest.raises(ValueError, match="Unknown schema"):
             gen.generate("nonexistent_schema_xyz")
 
-    def test_generate_batch_default(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_batch_default(self, gen):
         # Generate batch with default (all schemas)
         examples = gen.generate_batch(n=5)
         assert len(examples) == 5
 
-    def test_word_number_conversion(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator(word_number_prob=1.0)  # 100% conversion
+    def test_word_number_conversion(self, gen_words_on):
         # Generate a lot to exercise word number conversion
         for _ in range(20):
-            ex = gen.generate("price_chain")
+            ex = gen_words_on.generate("price_chain")
             assert ex.query  # Just ensure no errors
 
-    def test_word_number_disabled(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator(word_number_prob=0.0)  # No conversion
+    def test_word_number_disabled(self, gen_words_off):
         for _ in range(10):
-            ex = gen.generate("price_chain")
+            ex = gen_words_off.generate("price_chain")
             assert ex.query
 
-    def test_generate_with_float_variable(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_with_float_variable(self, gen):
         # price_chain has float tax
         ex = gen.generate("price_chain")
         assert ex.answer is not None
 
-    def test_generate_with_choice_variable(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_with_choice_variable(self, gen):
         # percent_off has choice type for percent
         ex = gen.generate("percent_off")
         assert ex.answer is not None
 
-    def test_generate_with_derived_variables(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_with_derived_variables(self, gen):
         # comparison_sum_diff has derived variables
         ex = gen.generate("comparison_sum_diff")
         assert ex.answer is not None
 
-    def test_generate_with_constraints(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_with_constraints(self, gen):
         # entity_simple_transfer has constraints
         ex = gen.generate("entity_simple_transfer")
         assert ex.answer is not None
 
-    def test_generate_entity_track_schemas(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_entity_track_schemas(self, gen):
         for schema in [
             "entity_simple_transfer",
             "entity_consume_sequence",
@@ -712,26 +728,17 @@ class TestSchemaGeneratorCoverage:
             ex = gen.generate(schema)
             assert ex.expert == "entity_track"
 
-    def test_generate_rate_equation_schemas(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_rate_equation_schemas(self, gen):
         for schema in ["rate_distance", "rate_earning"]:
             ex = gen.generate(schema)
             assert ex.expert == "rate_equation"
 
-    def test_generate_comparison_schemas(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_comparison_schemas(self, gen):
         for schema in ["comparison_times_more", "comparison_sum_diff"]:
             ex = gen.generate(schema)
             assert ex.expert == "comparison"
 
-    def test_generate_percentage_schemas(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_percentage_schemas(self, gen):
         for schema in ["percent_off", "percent_increase", "percent_simple"]:
             ex = gen.generate(schema)
             assert ex.expert == "percentage"
@@ -759,84 +766,43 @@ class TestSchemaGeneratorConvenienceFunctions:
 class TestSchemaGeneratorTransforms:
     """Test transform operations in schema_generator."""
 
-    def test_pluralize_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        # Test pluralize via _apply_transform
-        assert gen._apply_transform("dog", "pluralize") == "dogs"
-        assert gen._apply_transform("box", "pluralize") == "boxes"
-        assert gen._apply_transform("match", "pluralize") == "matches"
-        assert gen._apply_transform("dish", "pluralize") == "dishes"
-        assert gen._apply_transform("baby", "pluralize") == "babies"
-        assert gen._apply_transform("key", "pluralize") == "keys"
-
-    def test_singularize_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        assert gen._apply_transform("babies", "singularize") == "baby"
-        assert gen._apply_transform("boxes", "singularize") == "box"
-        assert gen._apply_transform("dogs", "singularize") == "dog"
-
-    def test_capitalize_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        assert gen._apply_transform("hello", "capitalize") == "Hello"
-
-    def test_with_article_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        result = gen._apply_transform("apple", "with_article")
-        assert result == "an apple"
-        result = gen._apply_transform("book", "with_article")
-        assert result == "a book"
-
-    def test_has_have_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        assert gen._apply_transform("s", "has_have") == "has"
-        assert gen._apply_transform("", "has_have") == "have"
-
-    def test_does_do_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        assert gen._apply_transform("s", "does_do") == "does"
-        assert gen._apply_transform("", "does_do") == "do"
-
-    def test_none_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        assert gen._apply_transform(None, "pluralize") is None
-
-    def test_unknown_transform(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
-        # Unknown transform returns value unchanged
-        assert gen._apply_transform("test", "unknown_transform") == "test"
+    @pytest.mark.parametrize(
+        ("value", "transform", "expected"),
+        [
+            ("dog", "pluralize", "dogs"),
+            ("box", "pluralize", "boxes"),
+            ("match", "pluralize", "matches"),
+            ("dish", "pluralize", "dishes"),
+            ("baby", "pluralize", "babies"),
+            ("key", "pluralize", "keys"),
+            ("babies", "singularize", "baby"),
+            ("boxes", "singularize", "box"),
+            ("dogs", "singularize", "dog"),
+            ("hello", "capitalize", "Hello"),
+            ("apple", "with_article", "an apple"),
+            ("book", "with_article", "a book"),
+            ("s", "has_have", "has"),
+            ("", "has_have", "have"),
+            ("s", "does_do", "does"),
+            ("", "does_do", "do"),
+            (None, "pluralize", None),
+            # Unknown transform returns value unchanged
+            ("test", "unknown_transform", "test"),
+        ],
+    )
+    def test_apply_transform(self, gen, value, transform, expected):
+        assert gen._apply_transform(value, transform) == expected
 
 
 class TestSchemaGeneratorInternals:
     """Test internal methods of SchemaGenerator."""
 
-    def test_compute_derived_with_exception(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_compute_derived_with_exception(self, gen):
         # Test derived with expression that causes exception
         derived = gen._compute_derived({"bad": "undefined_var + 1"}, {"x": 10})
         assert derived["bad"] == 0  # Falls back to 0
 
-    def test_generate_variables_multiple_of(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_generate_variables_multiple_of(self, gen):
         # Test variable with multiple_of constraint
         for _ in range(10):
             vars = gen._generate_variables(
@@ -844,40 +810,25 @@ class TestSchemaGeneratorInternals:
             )
             assert vars["n"] % 5 == 0
 
-    def test_sample_vocab_choice_type(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_sample_vocab_choice_type(self, gen):
         # Test vocab with choice type
         items = gen._sample_vocab({"word": {"type": "choice", "values": ["one", "two", "three"]}})
         assert items["word"] in ["one", "two", "three"]
 
-    def test_sample_vocab_empty_choice(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_sample_vocab_empty_choice(self, gen):
         items = gen._sample_vocab({"word": {"type": "choice", "values": []}})
         assert items["word"] == ""
 
-    def test_build_template_vars_list_index(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_build_template_vars_list_index(self, gen):
         # Test resolving list index in template spec
         result = gen._resolve_template_spec("items.0", {}, {"items": ["first", "second", "third"]})
         assert result == "first"
 
-    def test_build_template_vars_invalid_list_index(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_build_template_vars_invalid_list_index(self, gen):
         # Test resolving invalid list index
         result = gen._resolve_template_spec("items.99", {}, {"items": ["first", "second"]})
         assert result is None
 
-    def test_resolve_template_spec_with_pipe(self):
-        from chuk_virtual_expert_arithmetic.generators import SchemaGenerator
-
-        gen = SchemaGenerator()
+    def test_resolve_template_spec_with_pipe(self, gen):
         result = gen._resolve_template_spec("word|capitalize", {"word": "hello"}, {})
         assert result == "Hello"
@@ -2,49 +2,107 @@
 
 from __future__ import annotations
 
-from typing import Any
-from unittest.mock import MagicMock
+from typing import Any, Final
+
+import pytest
 
 from chuk_virtual_expert_arithmetic.core.domains import DomainSampler
 
+# Domain names with empty bodies, shared read-only by the list/random tests
+_NAMED_DOMAINS: Final[dict[str, Any]] = {"domains": {"kitchen": {}, "farm": {}, "school": {}}}
+
+# What _NamesVocab.random() returns for every source
+_MALE_NAME: Final = "Random_names.male"
+
 
 class MockVocab:
     """Mock Vocab for testing DomainSampler."""
 
+    __slots__ = ("_data", "_person")
+
+    # Dotted path -> split parts, shared by all instances
+    _split_cache: dict[str, tuple[str, ...]] = {}
+
     def __init__(self, data: dict[str, Any] | None = None) -> None:
         self._data = data or {}
+        # DomainSampler only reads the person, so one dict is handed out
+        self._person = {
+            "name": "Test Person",
+            "subject": "they",
+            "object": "them",
+            "possessive": "their",
+            "reflexive": "themselves",
+        }
 
     def get(self, path: str) -> Any:
-        parts = path.split(".")
-        current = self._data
+        if not self._data:
+            return None
+        parts = self._split_cache.get(path)
+        if parts is None:
+            parts = self._split_cache[path] = tuple(path.split("."))
+        current: Any = self._data
         for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            else:
+            if not isinstance(current, dict):
                 return None
+            current = current.get(part)
         return current
 
     def person_with_pronouns(self) -> dict[str, str]:
-        return {
-            "name": "Test Person",
-            "subject": "they",
-            "object": "them",
-            "possessive": "their",
-            "reflexive": "themselves",
-        }
+        return self._person
 
     def random(self, source: str) -> str | None:
         return f"Random_{source}"
 
 
+class _NamesVocab(MockVocab):
+    """MockVocab with a fixed random() result that records requested sources."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sources: list[str] = []
+
+    def random(self, source: str) -> str | None:
+        self.sources.append(source)
+        return _MALE_NAME
+
+
+class _CountingVocab(MockVocab):
+    """MockVocab that records every path passed to get()."""
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        super().__init__(data)
+        self.lookups: list[str] = []
+
+    def get(self, path: str) -> Any:
+        self.lookups.append(path)
+        return super().get(path)
+
+
+class _NoneVocab(MockVocab):
+    """MockVocab whose random() finds nothing."""
+
+    def random(self, source: str) -> str | None:
+        return None
+
+
+@pytest.fixture(scope="module")
+def empty_vocab() -> MockVocab:
+    """A MockVocab with no data; shared read-only by the module."""
+    return MockVocab()
+
+
+@pytest.fixture
+def sampler(empty_vocab: MockVocab) -> DomainSampler:
+    """A freshly seeded sampler over the empty vocab."""
+    return DomainSampler(empty_vocab, seed=42)
+
+
 class TestDomainSamplerInit:
     """Tests for DomainSampler initialization."""
 
-    def test_init_with_seed(self) -> None:
+    def test_init_with_seed(self, empty_vocab: MockVocab, sampler: DomainSampler) -> None:
         """Test initialization with seed."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
-        assert sampler._vocab is vocab
+        assert sampler._vocab is empty_vocab
 
     def test_init_without_seed(self) -> None:
         """Test initialization without seed."""
@@ -56,13 +114,11 @@ class TestDomainSamplerInit:
 class TestDomainSamplerSample:
     """Tests for sample method."""
 
-    def test_sample_unknown_domain(self) -> None:
+    def test_sample_unknown_domain(self, sampler: DomainSampler) -> None:
         """Test sampling unknown domain returns default context."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         context = sampler.sample("nonexistent_domain")
+        assert context == sampler._default_context()
         assert context["domain"] == "default"
-        assert context["agent_type"] == "person"
 
     def test_sample_domain_with_agent_templates(self) -> None:
         """Test sampling domain with agent templates."""
@@ -99,49 +155,32 @@ class TestDomainSamplerSample:
         assert context["agent"] == "Test Person"
         assert context["agent2"] == "Test Person"
 
-    def test_sample_domain_with_dict_items(self) -> None:
-        """Test sampling with dict-format items."""
-        vocab = MockVocab({
-            "domains": {
-                "test": {
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            # Dict-format items keep their declared forms
+            (
+                {
                     "items": [{"singular": "cookie", "plural": "cookies"}],
                     "verbs": {"singular": "eats", "plural": "eat"},
-                }
-            }
-        })
-        sampler = DomainSampler(vocab, seed=42)
+                },
+                ("cookie", "cookies"),
+            ),
+            # Legacy string items are plural and get singularized
+            (
+                {"items": ["apples"], "verbs": {"singular": "collects", "plural": "collect"}},
+                ("apple", "apples"),
+            ),
+            # No items falls back to the generic item
+            ({"verbs": {"singular": "does", "plural": "do"}}, ("item", "items")),
+        ],
+        ids=["dict_items", "string_items", "without_items"],
+    )
+    def test_sample_domain_items(self, domain: dict[str, Any], expected: tuple[str, str]) -> None:
+        """Test the sampled item and its plural for each item format."""
+        sampler = DomainSampler(MockVocab({"domains": {"test": domain}}), seed=42)
         context = sampler.sample("test")
-        assert context["item"] == "cookie"
-        assert context["item_plural"] == "cookies"
-
-    def test_sample_domain_with_string_items(self) -> None:
-        """Test sampling with string-format items (legacy)."""
-        vocab = MockVocab({
-            "domains": {
-                "test": {
-                    "items": ["apples"],  # plural string
-                    "verbs": {"singular": "collects", "plural": "collect"},
-                }
-            }
-        })
-        sampler = DomainSampler(vocab, seed=42)
-        context = sampler.sample("test")
-        assert context["item"] == "apple"  # singularized
-        assert context["item_plural"] == "apples"
-
-    def test_sample_domain_without_items(self) -> None:
-        """Test sampling domain without items."""
-        vocab = MockVocab({
-            "domains": {
-                "empty": {
-                    "verbs": {"singular": "does", "plural": "do"},
-                }
-            }
-        })
-        sampler = DomainSampler(vocab, seed=42)
-        context = sampler.sample("empty")
-        assert context["item"] == "item"
-        assert context["item_plural"] == "items"
+        assert (context["item"], context["item_plural"]) == expected
 
     def test_sample_domain_with_time_units(self) -> None:
         """Test sampling domain with time units."""
@@ -182,62 +221,112 @@ class TestDomainSamplerSample:
         assert "agent" in context
         assert "agent2" in context
 
+    def test_domain_table_built_once(self) -> None:
+        """Test a domain is looked up and resolved once across samples."""
+        vocab = _CountingVocab(
+            {
+                "domains": {
+                    "bakery": {
+                        "items": [{"singular": "loaf", "plural": "loaves"}, "cakes"],
+                        "verbs": {"singular": "bakes", "plural": "bake"},
+                    }
+                }
+            }
+        )
+        sampler = DomainSampler(vocab, seed=1)
+        contexts = [sampler.sample("bakery") for _ in range(20)]
+
+        assert vocab.lookups == ["domains.bakery"]
+        pairs = {(c["item"], c["item_plural"]) for c in contexts}
+        assert pairs <= {("loaf", "loaves"), ("cake", "cakes")}
+
+    def test_unknown_domain_remembered(self) -> None:
+        """Test a missing domain is cached as missing and keeps the default context."""
+        sampler = DomainSampler(MockVocab(), seed=1)
+        assert sampler.sample("nowhere")["domain"] == "default"
+        assert sampler._tables == {"nowhere": None}
+        assert sampler.sample("nowhere")["domain"] == "default"
+
 
 class TestSampleAgent:
     """Tests for _sample_agent method."""
 
-    def test_sample_agent_with_numbers(self) -> None:
+    def test_sample_agent_with_numbers(self, sampler: DomainSampler) -> None:
         """Test agent sampling with numbers."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
-        template = {"pattern": "Machine ${number}", "numbers": [1, 2, 3]}
+        template = {"pattern": "Machine ${number}", "numbers": (1, 2, 3)}
         agent = sampler._sample_agent(template)
-        assert "Machine" in agent
-        assert any(str(n) in agent for n in [1, 2, 3])
+        assert agent in {"Machine 1", "Machine 2", "Machine 3"}
 
-    def test_sample_agent_with_letters(self) -> None:
+    def test_sample_agent_with_letters(self, sampler: DomainSampler) -> None:
         """Test agent sampling with letters."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
-        template = {"pattern": "Robot ${letter}", "letters": ["X", "Y", "Z"]}
+        template = {"pattern": "Robot ${letter}", "letters": ("X", "Y", "Z")}
         agent = sampler._sample_agent(template)
-        assert "Robot" in agent
-        assert any(letter in agent for letter in ["X", "Y", "Z"])
+        assert agent in {"Robot X", "Robot Y", "Robot Z"}
 
     def test_sample_agent_with_source(self) -> None:
         """Test agent sampling with vocab source."""
-        vocab = MockVocab()
+        vocab = _NamesVocab()
         sampler = DomainSampler(vocab, seed=42)
         template = {"pattern": "${name}", "source": "names.male"}
         agent = sampler._sample_agent(template)
-        assert agent == "Random_names.male"
+        assert agent == _MALE_NAME
+        assert vocab.sources == ["names.male"]
 
     def test_sample_agent_with_source_no_value(self) -> None:
         """Test agent sampling when source returns None."""
-        vocab = MagicMock()
-        vocab.random.return_value = None
-        sampler = DomainSampler(vocab, seed=42)
+        sampler = DomainSampler(_NoneVocab(), seed=42)
         template = {"pattern": "Worker ${name}", "source": "empty_source"}
         agent = sampler._sample_agent(template)
         # Pattern is returned without substitution when value is None
         assert agent == "Worker ${name}"
 
-    def test_sample_agent_pattern_only(self) -> None:
+    def test_sample_agent_pattern_only(self, sampler: DomainSampler) -> None:
         """Test agent with just pattern (no numbers/letters/source)."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         template = {"pattern": "Generic Agent"}
         agent = sampler._sample_agent(template)
         assert agent == "Generic Agent"
 
 
+class TestSampleAgentPair:
+    """Tests for _sample_agent_pair method."""
+
+    def test_pair_is_distinct(self, sampler: DomainSampler) -> None:
+        """Test both agents come from the pool and differ."""
+        template = {"pattern": "Machine ${number}", "numbers": [0, 1]}
+        for _ in range(20):
+            pair = sampler._sample_agent_pair(template)
+            assert pair is not None
+            assert set(pair) == {"Machine 0", "Machine 1"}
+
+    def test_pair_from_tuple_pool(self, sampler: DomainSampler) -> None:
+        """Test tuple pools take the one-call pair draw like lists."""
+        template = {"pattern": "Robot ${letter}", "letters": ("A", "B")}
+        pair = sampler._sample_agent_pair(template)
+        assert pair is not None
+        assert set(pair) == {"Robot A", "Robot B"}
+
+    def test_pair_from_source(self) -> None:
+        """Test source templates draw the pair from the vocab list."""
+        vocab = MockVocab({"names": {"male": ["Al", "Bo", "Cy"]}})
+        sampler = DomainSampler(vocab, seed=42)
+        pair = sampler._sample_agent_pair({"pattern": "Mr ${name}", "source": "names.male"})
+        assert pair is not None
+        assert pair[0] != pair[1]
+        assert set(pair) <= {"Mr Al", "Mr Bo", "Mr Cy"}
+
+    def test_pair_unavailable(self, sampler: DomainSampler) -> None:
+        """Test templates that cannot supply two distinct agents return None."""
+        assert sampler._sample_agent_pair({"pattern": "Robot ${letter}", "letters": ["X"]}) is None
+        assert sampler._sample_agent_pair({"pattern": "Generic Agent"}) is None
+        assert sampler._sample_agent_pair({"pattern": "${name}", "source": "missing"}) is None
+        assert sampler._sample_agent_pair({"letters": ["Q", "Q"]}) is None
+
+
 class TestDefaultContext:
     """Tests for _default_context method."""
 
-    def test_default_context_structure(self) -> None:
+    def test_default_context_structure(self, sampler: DomainSampler) -> None:
         """Test default context has all required keys."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         context = sampler._default_context()
         assert context["domain"] == "default"
         assert context["agent"] == "Test Person"
@@ -253,23 +342,14 @@ class TestListDomains:
 
     def test_list_domains_with_domains(self) -> None:
         """Test listing domains when they exist."""
-        vocab = MockVocab({
-            "domains": {
-                "kitchen": {},
-                "farm": {},
-                "school": {},
-            }
-        })
-        sampler = DomainSampler(vocab, seed=42)
+        sampler = DomainSampler(MockVocab(_NAMED_DOMAINS), seed=42)
         domains = sampler.list_domains()
         assert "kitchen" in domains
         assert "farm" in domains
         assert "school" in domains
 
-    def test_list_domains_empty(self) -> None:
+    def test_list_domains_empty(self, sampler: DomainSampler) -> None:
         """Test listing domains when none exist."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         domains = sampler.list_domains()
         assert domains == []
 
@@ -286,20 +366,12 @@ class TestRandomDomain:
 
     def test_random_domain_with_domains(self) -> None:
         """Test random domain selection."""
-        vocab = MockVocab({
-            "domains": {
-                "kitchen": {},
-                "farm": {},
-            }
-        })
-        sampler = DomainSampler(vocab, seed=42)
+        sampler = DomainSampler(MockVocab(_NAMED_DOMAINS), seed=42)
         domain = sampler.random_domain()
-        assert domain in ["kitchen", "farm"]
+        assert domain in ["kitchen", "farm", "school"]
 
-    def test_random_domain_no_domains(self) -> None:
+    def test_random_domain_no_domains(self, sampler: DomainSampler) -> None:
         """Test random domain when none exist."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         domain = sampler.random_domain()
         assert domain == "default"
 
@@ -325,10 +397,8 @@ class TestReseed:
 
         assert context1["item"] == context2["item"]
 
-    def test_reseed_with_none(self) -> None:
+    def test_reseed_with_none(self, sampler: DomainSampler) -> None:
         """Test reseeding with None."""
-        vocab = MockVocab()
-        sampler = DomainSampler(vocab, seed=42)
         sampler.reseed(None)
         # Should still work
         assert sampler._rng is not None
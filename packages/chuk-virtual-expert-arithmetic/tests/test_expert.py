@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections import Counter
+
 import pytest
-from chuk_virtual_expert.registry_v2 import ExpertRegistry
+import yaml
 from chuk_virtual_expert.trace_models import (
     InitStep,
     QueryStep,
@@ -19,6 +21,11 @@ from chuk_virtual_expert_arithmetic import (
 )
 from chuk_virtual_expert_arithmetic.generators import TraceGenerator
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+
 # --- EntityTrackExpert ---
 
 
@@ -441,14 +448,8 @@ class TestComparisonExpert:
 
 class TestTraceVerifierIntegration:
     @pytest.fixture(autouse=True)
-    def _setup_verifier(self) -> None:
-        registry = ExpertRegistry()
-        registry.register(EntityTrackExpert())
-        registry.register(ArithmeticExpert())
-        registry.register(PercentageExpert())
-        registry.register(RateEquationExpert())
-        registry.register(ComparisonExpert())
-        self.verifier = TraceVerifier(registry)
+    def _setup_verifier(self, shared_verifier: TraceVerifier) -> None:
+        self.verifier = shared_verifier
 
     @pytest.mark.asyncio
     async def test_entity_track_full(self) -> None:
@@ -605,6 +606,11 @@ class TestTraceGenerator:
         examples = self.gen.generate_all(n_per_type=3)
         assert len(examples) == 15
 
+    def test_generate_all_balanced_per_type(self) -> None:
+        counts = Counter(ex.expert for ex in self.gen.generate_all(n_per_type=10))
+        assert set(counts.values()) == {10}
+        assert len(counts) == 5
+
     def test_model_dump_produces_valid_format(self) -> None:
         examples = self.gen.generate_arithmetic(1)
         data = examples[0].model_dump(mode="json")
@@ -621,24 +627,14 @@ class TestTraceGenerator:
             assert isinstance(ex.trace[0], InitStep)
 
     @pytest.mark.asyncio
-    async def test_generated_traces_execute_correctly(self) -> None:
+    async def test_generated_traces_execute_correctly(self, shared_verifier: TraceVerifier) -> None:
         """Verify that generated traces produce correct answers."""
-        registry = ExpertRegistry()
-        registry.register(EntityTrackExpert())
-        registry.register(ArithmeticExpert())
-        registry.register(PercentageExpert())
-        registry.register(RateEquationExpert())
-        registry.register(ComparisonExpert())
-        verifier = TraceVerifier(registry)
-
         examples = self.gen.generate_all(n_per_type=5)
         for ex in examples:
             # Use model_dump(mode="json") for clean YAML serialization
             data = ex.model_dump(mode="json")
-            import yaml
-
-            yaml_str = yaml.dump({"expert": data["expert"], "trace": data["trace"]})
-            result = await verifier.verify(yaml_str, expected_answer=data["answer"])
+            yaml_str = yaml.dump({"expert": data["expert"], "trace": data["trace"]}, Dumper=_Dumper)
+            result = await shared_verifier.verify(yaml_str, expected_answer=data["answer"])
             assert result.answer_correct, (
                 f"Failed for {data['expert']}: expected {data['answer']}, got {result.computed_answer}"
             )
@@ -689,25 +685,15 @@ class TestTraceGeneratorPerturbation:
         assert modified_count >= 0  # Just verify it runs without error
 
     @pytest.mark.asyncio
-    async def test_perturbed_traces_still_valid(self) -> None:
+    async def test_perturbed_traces_still_valid(self, shared_verifier: TraceVerifier) -> None:
         """Verify that perturbed traces still produce correct answers."""
-        registry = ExpertRegistry()
-        registry.register(EntityTrackExpert())
-        registry.register(ArithmeticExpert())
-        registry.register(PercentageExpert())
-        registry.register(RateEquationExpert())
-        registry.register(ComparisonExpert())
-        verifier = TraceVerifier(registry)
-
         gen = TraceGenerator(seed=42, perturbation_level=0.5)
         examples = gen.generate_all(n_per_type=3)
 
         for ex in examples:
             data = ex.model_dump(mode="json")
-            import yaml
-
-            yaml_str = yaml.dump({"expert": data["expert"], "trace": data["trace"]})
-            result = await verifier.verify(yaml_str, expected_answer=data["answer"])
+            yaml_str = yaml.dump({"expert": data["expert"], "trace": data["trace"]}, Dumper=_Dumper)
+            result = await shared_verifier.verify(yaml_str, expected_answer=data["answer"])
             assert result.answer_correct, (
                 f"Failed for {data['expert']}: expected {data['answer']}, "
                 f"got {result.computed_answer}"
@@ -0,0 +1,51 @@
+"""Tests for the shared expression parse cache."""
+
+import ast
+
+import pytest
+
+from chuk_virtual_expert_arithmetic.core.constraints import ConstraintValidator
+from chuk_virtual_expert_arithmetic.core.expr_cache import ExprInfo, analyze, collect_variables
+from chuk_virtual_expert_arithmetic.core.expression import SafeEvaluator
+
+
+class TestAnalyze:
+    """Tests for analyze()."""
+
+    def test_returns_node_and_free_vars(self) -> None:
+        """Test analyze parses the body and collects referenced names."""
+        info = analyze("a + b * 2 > c")
+        assert isinstance(info, ExprInfo)
+        assert isinstance(info.node, ast.Compare)
+        assert info.free_vars == frozenset({"a", "b", "c"})
+
+    def test_results_are_cached(self) -> None:
+        """Test repeated sources share one parse result."""
+        assert analyze("x - y") is analyze("x - y")
+
+    def test_syntax_error_propagates(self) -> None:
+        """Test invalid sources raise SyntaxError."""
+        with pytest.raises(SyntaxError):
+            analyze("a + * b")
+
+    def test_collect_variables_ignores_calls(self) -> None:
+        """Test only arithmetic nodes are searched for names."""
+        node = ast.parse("f(a) + b", mode="eval").body
+        assert collect_variables(node) == {"b"}
+
+
+class TestSharedParse:
+    """Tests that evaluator and validators share parse results."""
+
+    def test_evaluator_and_constraints_share_parse(self) -> None:
+        """Test compile, validate and constraint lowering hit one cache entry."""
+        source = "left_over_total - spent_total"
+        evaluator = SafeEvaluator()
+        node = evaluator.compile(source)
+
+        assert node is analyze(source).node
+        assert evaluator.validate(source, {"left_over_total"}) == ["Unknown variables: spent_total"]
+
+        validator = ConstraintValidator(evaluator=evaluator)
+        plan = validator._lower({source: {"min": 0}})
+        assert plan[0][1] is evaluator.compile_function(source)
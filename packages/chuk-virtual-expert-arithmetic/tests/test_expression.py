@@ -135,6 +135,24 @@ class TestSafeEvaluator:
         with pytest.raises(ExpressionError, match="Invalid expression syntax"):
             evaluator.evaluate("a + * b", {"a": 1, "b": 2})
 
+    # Compiled evaluation
+    def test_compile_and_evaluate_compiled(self, evaluator: SafeEvaluator) -> None:
+        """Test a parsed expression can be evaluated against many contexts."""
+        node = evaluator.compile("a * b + 1")
+        assert evaluator.evaluate_compiled(node, {"a": 2, "b": 3}) == 7
+        assert evaluator.evaluate_compiled(node, {"a": 4, "b": 5}) == 21
+
+    def test_compile_syntax_error(self, evaluator: SafeEvaluator) -> None:
+        """Test compile reports syntax errors."""
+        with pytest.raises(ExpressionError, match="Invalid expression syntax"):
+            evaluator.compile("a + * b")
+
+    def test_evaluate_compiled_error_includes_source(self, evaluator: SafeEvaluator) -> None:
+        """Test evaluate_compiled wraps runtime errors with the source expression."""
+        node = evaluator.compile("a + b")
+        with pytest.raises(ExpressionError, match="Error evaluating expression 'a \\+ b'"):
+            evaluator.evaluate_compiled(node, {"a": 1, "b": "x"}, "a + b")
+
     def test_unsupported_function_call(self, evaluator: SafeEvaluator) -> None:
         """Test that function calls are blocked."""
         with pytest.raises(ExpressionError, match="Unsupported expression type"):
@@ -175,6 +193,79 @@ class TestSafeEvaluator:
         assert "x" in errors[0] and "y" in errors[0] and "z" in errors[0]
 
 
+class TestCompileFunction:
+    """Tests for SafeEvaluator.compile_function."""
+
+    CONTEXT = {"a": 7, "b": 2, "c": 0, "x": 1.5}
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "42",
+            "a",
+            "a + b * 2",
+            "(a - b) // b % 3",
+            "a / b",
+            "a ** b",
+            "-a + +b",
+            "a > b",
+            "b < a <= 7 != c",
+            "a < b < 100",
+            "a > 0 and b > 0",
+            "c > 0 or x > 1",
+            "c and a",
+            "x * 2 - a",
+        ],
+    )
+    def test_matches_evaluate(self, expr: str) -> None:
+        """Test compiled functions return what evaluate() returns."""
+        evaluator = SafeEvaluator()
+        assert evaluator.compile_function(expr)(self.CONTEXT) == evaluator.evaluate(
+            expr, self.CONTEXT
+        )
+
+    @pytest.mark.parametrize(
+        ("expr", "context", "match"),
+        [
+            ("a / c", {"a": 1, "c": 0}, "Division by zero"),
+            ("missing + 1", {}, "Unknown variable: missing"),
+            ("f(a)", {"a": 1}, "Unsupported expression type"),
+            ("a + 'x'", {"a": 1}, "Unsupported constant type"),
+            ("a + b", {"a": 1, "b": "x"}, "Error evaluating expression 'a \\+ b'"),
+            ("a in b", {"a": 1, "b": 2}, "Unsupported comparison"),
+        ],
+    )
+    def test_errors_match_evaluate(self, expr: str, context: dict, match: str) -> None:
+        """Test compiled functions raise the same ExpressionError as evaluate()."""
+        evaluator = SafeEvaluator()
+        function = evaluator.compile_function(expr)
+        with pytest.raises(ExpressionError, match=match):
+            function(context)
+        with pytest.raises(ExpressionError, match=match):
+            evaluator.evaluate(expr, context)
+
+    def test_unsupported_nodes_fail_only_when_reached(self) -> None:
+        """Test short-circuiting skips unsupported nodes, as evaluate() does."""
+        evaluator = SafeEvaluator()
+        assert evaluator.compile_function("c and f(a)")({"a": 1, "c": 0}) is False
+
+    def test_comparisons_disallowed(self) -> None:
+        """Test allow_comparisons=False is honoured by compiled functions."""
+        function = SafeEvaluator(allow_comparisons=False).compile_function("a > 1")
+        with pytest.raises(ExpressionError, match="Comparisons not allowed"):
+            function({"a": 2})
+
+    def test_functions_are_cached(self) -> None:
+        """Test the same expression compiles to the same function."""
+        evaluator = SafeEvaluator()
+        assert evaluator.compile_function("a + 1") is evaluator.compile_function("a + 1")
+
+    def test_syntax_error(self) -> None:
+        """Test compile_function reports syntax errors up front."""
+        with pytest.raises(ExpressionError, match="Invalid expression syntax"):
+            SafeEvaluator().compile_function("a + * b")
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
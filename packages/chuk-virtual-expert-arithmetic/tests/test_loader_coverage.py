@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -92,16 +93,16 @@ class TestSchemaLoaderComposition:
 class TestSchemaLoaderRaw:
     """Tests for raw schema loading."""
 
-    def test_load_raw(self) -> None:
+    def test_load_raw(self, shared_loader: SchemaLoader) -> None:
         """Test loading raw schema dict."""
-        loader = SchemaLoader()
+        loader = shared_loader
         raw = loader.load_raw("multiply_add")
         assert isinstance(raw, dict)
         assert "name" in raw
 
-    def test_load_raw_caching(self) -> None:
+    def test_load_raw_caching(self, shared_loader: SchemaLoader) -> None:
         """Test that raw schemas are cached."""
-        loader = SchemaLoader()
+        loader = shared_loader
         raw1 = loader.load_raw("multiply_add")
         raw2 = loader.load_raw("multiply_add")
         # Should be same dict from cache
@@ -111,9 +112,9 @@ class TestSchemaLoaderRaw:
 class TestSchemaLoaderGetAll:
     """Tests for get_all methods."""
 
-    def test_get_all(self) -> None:
+    def test_get_all(self, shared_loader: SchemaLoader) -> None:
         """Test loading all schemas."""
-        loader = SchemaLoader()
+        loader = shared_loader
         schemas = loader.get_all()
         assert len(schemas) > 0
         assert "multiply_add" in schemas
@@ -172,16 +173,16 @@ class TestSchemaLoaderSubdirectories:
             loaded = loader.load("test_schema")
             assert loaded.name == "test_schema"
 
-    def test_skip_mixins_directory(self) -> None:
+    def test_skip_mixins_directory(self, shared_loader: SchemaLoader) -> None:
         """Test that mixins directory is skipped in get_all."""
-        loader = SchemaLoader()
+        loader = shared_loader
         schemas = loader.get_all()
         # No schemas should have names like mixin files
         assert "person_vocab" not in schemas
 
-    def test_skip_bases_directory(self) -> None:
+    def test_skip_bases_directory(self, shared_loader: SchemaLoader) -> None:
         """Test that bases directory is skipped in get_all."""
-        loader = SchemaLoader()
+        loader = shared_loader
         schemas = loader.get_all()
         # Bases shouldn't be loaded as regular schemas
         assert all(not s.abstract for s in schemas.values() if hasattr(s, "abstract"))
@@ -304,14 +305,14 @@ class TestSchemaLoaderGetAllRawErrors:
 class TestSchemaLoaderExists:
     """Tests for exists method."""
 
-    def test_exists_true(self) -> None:
+    def test_exists_true(self, shared_loader: SchemaLoader) -> None:
         """Test exists returns True for existing schema."""
-        loader = SchemaLoader()
+        loader = shared_loader
         assert loader.exists("multiply_add") is True
 
-    def test_exists_false(self) -> None:
+    def test_exists_false(self, shared_loader: SchemaLoader) -> None:
         """Test exists returns False for non-existing schema."""
-        loader = SchemaLoader()
+        loader = shared_loader
         assert loader.exists("nonexistent_schema_xyz") is False
 
 
@@ -345,9 +346,9 @@ class TestSchemaLoaderEdgeCases:
             # Should have vocab from mixin
             assert loaded.vocab is not None
 
-    def test_schema_names_property(self) -> None:
+    def test_schema_names_property(self, shared_loader: SchemaLoader) -> None:
         """Test schema_names property."""
-        loader = SchemaLoader()
+        loader = shared_loader
         names = loader.schema_names
         assert isinstance(names, list)
         assert "multiply_add" in names
@@ -365,3 +366,23 @@ class TestSchemaLoaderEdgeCases:
 
         assert len(loader._cache) == 0
         assert len(loader._raw_cache) == 0
+
+    def test_get_all_is_cached_until_cleared(self) -> None:
+        """Test get_all and schema_names scan the directory only once."""
+        loader = SchemaLoader()
+        first = loader.get_all()
+        names = loader.schema_names
+
+        with patch.object(loader, "_read_json", side_effect=AssertionError("re-read")):
+            assert loader.get_all() == first
+            assert loader.schema_names == names
+
+        # Returned containers are copies, so callers cannot corrupt the cache
+        first.clear()
+        names.clear()
+        assert loader.get_all()
+        assert loader.schema_names
+
+        loader.clear_cache()
+        assert loader._all_cache == {}
+        assert loader._names_cache is None
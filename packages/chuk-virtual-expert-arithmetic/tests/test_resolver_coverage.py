@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from typing import Any
 
-from chuk_virtual_expert_arithmetic.core.resolver import TemplateResolver
+from chuk_virtual_expert_arithmetic.core.resolver import (
+    TemplateResolver,
+    _parse_spec,
+    _person_shortcuts,
+)
 
 
 class TestResolveAll:
@@ -136,6 +140,28 @@ class TestResolveLiterals:
         assert result == 5
 
 
+class TestParseSpec:
+    """Tests for the cached spec parser."""
+
+    def test_splits_path_and_transforms(self) -> None:
+        """Test a spec splits into its dot path and transform chain."""
+        assert _parse_spec("person.name|singularize|capitalize") == (
+            ("person", "name"),
+            ("singularize", "capitalize"),
+        )
+        assert _parse_spec("item") == (("item",), ())
+
+    def test_parse_is_cached(self) -> None:
+        """Test repeated specs reuse one parse result."""
+        assert _parse_spec("item|pluralize") is _parse_spec("item|pluralize")
+
+    def test_transform_applies_to_dot_path(self) -> None:
+        """Test transforms apply to a resolved dot path."""
+        resolver = TemplateResolver()
+        vocab = {"person": {"name": "alice"}}
+        assert resolver.resolve("person.name|capitalize", {}, vocab) == "Alice"
+
+
 class TestBuildTemplateVars:
     """Tests for build_template_vars method."""
 
@@ -271,6 +297,32 @@ class TestExpandVocabItems:
         assert result["subj2"] == "She"
         assert result["his_her2"] == "her"
 
+    def test_person_shortcut_tables(self) -> None:
+        """Test shortcut tables are suffixed once per person key and reused."""
+        assert [var for var, *_ in _person_shortcuts("person")] == [
+            "name",
+            "subject",
+            "subj",
+            "his_her",
+            "him_her",
+            "reflexive",
+            "verb_s",
+        ]
+        assert [var for var, *_ in _person_shortcuts("person3")] == [
+            "name3",
+            "subject3",
+            "subj3",
+            "his_her3",
+        ]
+        assert _person_shortcuts("person3") is _person_shortcuts("person3")
+
+    def test_expand_non_person_key_with_person_fields(self) -> None:
+        """Test a name/subject dict under a non-person key gets no shortcuts."""
+        resolver = TemplateResolver()
+        result: dict[str, Any] = {}
+        resolver._expand_vocab_items(result, {"pet": {"name": "Rex", "subject": "it"}})
+        assert result == {"pet_name": "Rex", "pet_subject": "it"}
+
     def test_expand_list_vocab(self) -> None:
         """Test expanding list-type vocab."""
         resolver = TemplateResolver()
@@ -222,6 +222,11 @@ class TestVocabSamplerSampleWithExclusion:
         result = sampler._sample_with_exclusion("names.male", {"John", "Bob", "Alice"})
         assert result == "Charlie"
 
+    def test_sample_with_exclusion_covers_remaining(self, sampler: VocabSampler) -> None:
+        """Test exclusion still draws every non-excluded item and nothing else."""
+        results = {sampler._sample_with_exclusion("names.male", {"Bob"}) for _ in range(200)}
+        assert results == {"John", "Alice", "Charlie"}
+
     def test_sample_all_excluded_falls_back(self, sampler: VocabSampler) -> None:
         """Test when all items excluded, falls back to random."""
         result = sampler._sample_with_exclusion("names.male", {"John", "Bob", "Alice", "Charlie"})
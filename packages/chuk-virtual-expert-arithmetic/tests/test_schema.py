@@ -320,6 +320,11 @@ class TestState:
         assert s1.get("x") == Decimal(10)
         assert s2.get("x") == Decimal(20)
 
+    def test_slotted(self):
+        for cls in (State, Step, Trace):
+            assert "__slots__" in vars(cls)
+        assert not hasattr(State(), "__dict__")
+
     def test_copy(self):
         s = State().set("a", 1).set("b", 2)
         s2 = s.copy()
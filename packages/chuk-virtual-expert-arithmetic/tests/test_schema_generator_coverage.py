@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from collections import Counter
+
 import pytest
 
 from chuk_virtual_expert_arithmetic.generators.schema_generator import (
     SchemaGenerator,
+    _compile_template_spec,
     generate_batch_from_schemas,
     generate_from_schema,
 )
@@ -49,6 +53,14 @@ class TestSchemaGeneratorProperties:
         assert isinstance(names, list)
         assert len(names) > 0
 
+    def test_schema_names_returns_copy(self) -> None:
+        """Test mutating the returned list does not affect the generator."""
+        gen = SchemaGenerator(seed=42)
+        names = gen.schema_names
+        names.clear()
+        assert gen.schema_names
+        assert len(gen.generate_batch(n=3)) == 3
+
     def test_perturbation_level_getter(self) -> None:
         """Test perturbation_level getter."""
         gen = SchemaGenerator(perturbation_level=0.5)
@@ -160,6 +172,23 @@ class TestGenerateBatchGsm8kDistribution:
             assert ex is not None
 
 
+class TestGenerateBatch:
+    """Tests for generate_batch method."""
+
+    def test_generate_batch_named_schemas(self) -> None:
+        """Test every problem comes from the given schemas."""
+        gen = SchemaGenerator(seed=42)
+        examples = gen.generate_batch(["percent_off", "percent_tip"], 6)
+        assert len(examples) == 6
+        assert {ex.expert for ex in examples} == {"percentage"}
+
+    def test_generate_batch_default_and_empty(self) -> None:
+        """Test the default schema pool and a zero-sized batch."""
+        gen = SchemaGenerator(seed=42)
+        assert len(gen.generate_batch(n=3)) == 3
+        assert gen.generate_batch(["price_chain"], 0) == []
+
+
 class TestGenerateVariables:
     """Tests for variable generation."""
 
@@ -193,6 +222,30 @@ class TestGenerateVariables:
         variables = gen._generate_variables(var_specs)
         assert variables["option"] == 0
 
+    def test_multiple_of_covers_range(self) -> None:
+        """Test multiple_of draws every multiple within [min, max]."""
+        gen = SchemaGenerator(seed=42)
+        var_specs = {"n": {"type": "int", "min": 12, "max": 40, "multiple_of": 5}}
+        seen = {gen._generate_variables(var_specs)["n"] for _ in range(200)}
+        assert seen == {15, 20, 25, 30, 35, 40}
+
+    def test_multiple_of_without_multiple_in_range(self) -> None:
+        """Test multiple_of falls back to the first multiple above min."""
+        gen = SchemaGenerator(seed=42)
+        var_specs = {"n": {"type": "int", "min": 5, "max": 7, "multiple_of": 10}}
+        assert gen._generate_variables(var_specs)["n"] == 10
+
+    def test_seeded_variables_reproducible(self) -> None:
+        """Test variables are drawn from the generator's own seeded RNG."""
+        var_specs = {
+            "a": {"type": "int", "min": 1, "max": 1000},
+            "b": {"type": "float", "min": 0.0, "max": 5.0},
+            "c": {"type": "bool"},
+        }
+        first = SchemaGenerator(seed=7)._generate_variables(var_specs)
+        second = SchemaGenerator(seed=7)._generate_variables(var_specs)
+        assert first == second
+
 
 class TestApplyConstraints:
     """Tests for constraint application."""
@@ -247,6 +300,19 @@ class TestSampleVocab:
         assert "name2" in items
         # They should ideally be different (though with small list might be same)
 
+    def test_choice_distinct_from(self) -> None:
+        """Test choice vocab never repeats a value it must differ from."""
+        gen = SchemaGenerator(seed=42)
+        vocab_specs = {
+            "first": {"type": "choice", "values": ["a", "b"]},
+            "second": {"type": "choice", "values": ["a", "b"], "distinct_from": ["first"]},
+            "third": {"type": "choice", "values": ["a"], "distinct_from": ["first", "second"]},
+        }
+        for _ in range(20):
+            items = gen._sample_vocab(vocab_specs)
+            assert {items["first"], items["second"]} == {"a", "b"}
+            assert items["third"] == ""
+
     def test_sample_diverse_person(self) -> None:
         """Test sampling diverse person."""
         gen = SchemaGenerator(seed=42, messy_vocab_prob=1.0)  # Always use messy
@@ -292,6 +358,28 @@ class TestResolveTemplateSpec:
         result = gen._resolve_template_spec("value.something", {}, vocab_items)
         assert result is None
 
+    def test_resolve_digit_key_in_dict(self) -> None:
+        """Test a numeric segment still looks up dict keys."""
+        gen = SchemaGenerator(seed=42)
+        vocab_items = {"scores": {"0": "zero"}}
+        assert gen._resolve_template_spec("scores.0", {}, vocab_items) == "zero"
+
+    def test_resolve_path_with_transforms(self) -> None:
+        """Test dotted lookups followed by chained transforms."""
+        gen = SchemaGenerator(seed=42)
+        vocab_items = {"person": {"name": "alex"}}
+        result = gen._resolve_template_spec("person.name|capitalize|pluralize", {}, vocab_items)
+        assert result == "Alexes"
+
+    def test_compiled_spec_is_cached(self) -> None:
+        """Test each spec string is parsed once."""
+        first = _compile_template_spec("items.1|pluralize")
+        assert _compile_template_spec("items.1|pluralize") is first
+        assert first.key == "items"
+        assert first.path == (("1", 1),)
+        assert first.transforms == ("pluralize",)
+        assert first.transforms[0] is sys.intern("pluralize")
+
 
 class TestApplyTransform:
     """Tests for _apply_transform method."""
@@ -332,6 +420,17 @@ class TestComputeAnswer:
         result = gen._compute_answer("(x + y", {"x": 5, "y": 10})
         assert result == 0.0
 
+    def test_expressions_compiled_once(self) -> None:
+        """Test derived and answer expressions reuse compiled functions."""
+        gen = SchemaGenerator(seed=42)
+        derived = gen._compute_derived({"total": "x * y", "half": "total / 2"}, {"x": 4, "y": 5})
+        assert derived == {"total": 20, "half": 10}
+        assert gen._compute_answer("x * y", {"x": 2, "y": 3}) == 6.0
+
+        function = gen._evaluator.compile_function("x * y")
+        gen._compute_derived({"total": "x * y"}, {"x": 1, "y": 1})
+        assert gen._evaluator.compile_function("x * y") is function
+
 
 class TestApplyWordNumbers:
     """Tests for _apply_word_numbers method."""
@@ -395,6 +494,21 @@ class TestAsyncMethods:
         examples = await gen.generate_balanced_async(n=6, concurrency=2)
         assert len(examples) > 0
 
+    @pytest.mark.asyncio
+    async def test_generate_batch_async_named_schemas(self) -> None:
+        """Test async batch generation only draws from the given schemas."""
+        gen = SchemaGenerator(seed=42)
+        examples = await gen.generate_batch_async(n=4, schema_names=["percent_tip"])
+        assert [ex.expert for ex in examples] == ["percentage"] * 4
+
+    @pytest.mark.asyncio
+    async def test_generate_balanced_async_equal_per_expert(self) -> None:
+        """Test async balanced generation gives each expert the same count."""
+        gen = SchemaGenerator(seed=42)
+        examples = await gen.generate_balanced_async(n=10)
+        counts = Counter(ex.expert for ex in examples)
+        assert len(set(counts.values())) == 1
+
     @pytest.mark.asyncio
     async def test_generate_stream_async(self) -> None:
         """Test async stream generation."""
@@ -413,6 +527,13 @@ class TestAsyncMethods:
             count += 1
         assert count == 2
 
+    @pytest.mark.asyncio
+    async def test_generate_stream_async_named_schemas(self) -> None:
+        """Test async stream generation only draws from the given schemas."""
+        gen = SchemaGenerator(seed=42)
+        experts = [ex.expert async for ex in gen.generate_stream_async(3, ["percent_off"])]
+        assert experts == ["percentage"] * 3
+
 
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
@@ -471,3 +592,11 @@ class TestLoadSchemasComposition:
         # even if some schema composition might fail
         gen = SchemaGenerator()
         assert len(gen.schema_names) > 0
+
+    def test_schemas_shared_across_instances(self) -> None:
+        """Test that generators reuse the loaded schema dicts."""
+        first = SchemaGenerator()
+        second = SchemaGenerator()
+        assert first._schemas is not second._schemas
+        name = first.schema_names[0]
+        assert first._schemas[name] is second._schemas[name]
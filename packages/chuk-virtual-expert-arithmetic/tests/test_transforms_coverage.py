@@ -226,6 +226,15 @@ class TestOrdinalFunction:
         assert ordinal(112) == "112th"
         assert ordinal(121) == "121st"
 
+    def test_suffix_table_matches_rule(self) -> None:
+        """Test the suffix table agrees with the teens/last-digit rule."""
+        for n in range(-150, 1250):
+            if 10 <= n % 100 <= 20:
+                suffix = "th"
+            else:
+                suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+            assert ordinal(n) == f"{n}{suffix}"
+
     def test_none_input(self) -> None:
         """Test with None input."""
         # ordinal returns string when can't convert to int
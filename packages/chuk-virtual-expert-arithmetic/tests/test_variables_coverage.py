@@ -5,6 +5,7 @@ from __future__ import annotations
 from chuk_virtual_expert_arithmetic.core.variables import (
     DifficultyProfile,
     VariableGenerator,
+    _NonRoundRange,
 )
 from chuk_virtual_expert_arithmetic.models.schema_spec import VariableSpec
 
@@ -39,6 +40,17 @@ class TestGenerateMethod:
         assert 1 <= result["a"] <= 10
         assert 1 <= result["b"] <= 10
 
+    def test_generate_only_subset(self) -> None:
+        """Test generating a subset of variables in spec order."""
+        specs = {
+            "a": VariableSpec(type="int", min=1, max=10),
+            "b": VariableSpec(type="int", min=1, max=10),
+            "c": VariableSpec(type="int", min=1, max=10),
+        }
+        result = VariableGenerator(seed=3).generate(specs, only={"c", "a", "missing"})
+        assert list(result) == ["a", "c"]
+        assert result == VariableGenerator(seed=3).generate(specs, only=["a", "c"])
+
 
 class TestGenerateOneMethod:
     """Tests for generate_one method."""
@@ -66,6 +78,20 @@ class TestGenerateOneMethod:
         result = gen.generate_one(spec)
         assert isinstance(result, bool)
 
+    def test_generate_bool_is_seeded(self) -> None:
+        """Test boolean draws are reproducible and leave global random untouched."""
+        import random
+
+        spec = VariableSpec(type="bool")
+        state = random.getstate()
+        a = VariableGenerator(seed=7)
+        b = VariableGenerator(seed=7)
+        draws_a = [a.generate_one(spec) for _ in range(50)]
+        draws_b = [b.generate_one(spec) for _ in range(50)]
+        assert draws_a == draws_b
+        assert set(draws_a) == {True, False}
+        assert random.getstate() == state
+
     def test_generate_choice(self) -> None:
         """Test generating choice."""
         gen = VariableGenerator(seed=42)
@@ -356,3 +382,78 @@ class TestReproducibility:
 
         # Very unlikely to be the same with different seeds
         assert result1["a"] != result2["a"]
+
+
+class TestGenerateBatch:
+    """Tests for generate_batch method."""
+
+    def test_batch_int_range(self) -> None:
+        """Test plain int batches stay in range."""
+        gen = VariableGenerator(seed=42)
+        values = gen.generate_batch(VariableSpec(type="int", min=1, max=10), 200)
+        assert len(values) == 200
+        assert all(isinstance(v, int) and 1 <= v <= 10 for v in values)
+        assert len(set(values)) > 1
+
+    def test_batch_avoid_round(self) -> None:
+        """Test avoid_round batches contain no multiples of 10."""
+        gen = VariableGenerator(seed=42)
+        values = gen.generate_batch(VariableSpec(type="int", min=1, max=100, avoid_round=True), 200)
+        assert all(v % 10 != 0 for v in values)
+
+    def test_batch_multiple_of(self) -> None:
+        """Test multiple_of rounding matches generate_one."""
+        gen = VariableGenerator(seed=42)
+        spec = VariableSpec(type="int", min=3, max=20, multiple_of=5)
+        values = gen.generate_batch(spec, 200)
+        assert set(values) <= {5, 10, 15, 20}
+
+    def test_batch_difficulty(self) -> None:
+        """Test difficulty profiles in batch mode."""
+        gen = VariableGenerator(seed=42)
+        easy = gen.generate_batch(VariableSpec(type="int", min=1, max=100, difficulty="easy"), 50)
+        hard = gen.generate_batch(VariableSpec(type="int", min=1, max=100, difficulty="hard"), 50)
+        assert set(easy) <= {5, 10, 15, 20, 25, 30}
+        assert all(50 <= v <= 200 and v % 10 != 0 for v in hard)
+
+    def test_batch_bool_and_choice(self) -> None:
+        """Test bool and choice batches draw from their options."""
+        gen = VariableGenerator(seed=42)
+        assert set(gen.generate_batch(VariableSpec(type="bool"), 50)) <= {True, False}
+        choices = gen.generate_batch(VariableSpec(type="choice", options=["a", "b"]), 50)
+        assert set(choices) <= {"a", "b"}
+
+    def test_batch_fallbacks(self) -> None:
+        """Test specs without a uniform pool fall back to generate_one."""
+        gen = VariableGenerator(seed=42)
+        floats = gen.generate_batch(VariableSpec(type="float", min=0.0, max=1.0), 10)
+        assert all(isinstance(v, float) for v in floats)
+        assert gen.generate_batch(VariableSpec(type="choice"), 3) == [0, 0, 0]
+        # Only round numbers available: generate_one's adjustment path is used
+        rounds = gen.generate_batch(VariableSpec(type="int", min=10, max=10, avoid_round=True), 5)
+        assert len(rounds) == 5
+
+    def test_batch_large_ranges_use_pool(self) -> None:
+        """Test large avoid_round and multiple_of ranges never call generate_one."""
+        gen = VariableGenerator(seed=42)
+        gen.generate_one = None  # type: ignore[method-assign,assignment]
+        spec = VariableSpec(type="int", min=1, max=10**9, avoid_round=True, multiple_of=7)
+        values = gen.generate_batch(spec, 200)
+        assert all(v % 7 == 0 and 1 <= v <= 10**9 for v in values)
+        big = gen.generate_batch(VariableSpec(type="int", min=5, max=10**12, avoid_round=True), 200)
+        assert all(v % 10 != 0 and 5 <= v <= 10**12 for v in big)
+
+    def test_non_round_range_matches_filter(self) -> None:
+        """Test the arithmetic non-round view equals the filtered range."""
+        for lo, hi in [(1, 100), (-23, 17), (10, 10), (7, 61), (40, 39)]:
+            expected = [v for v in range(lo, hi + 1) if v % 10 != 0]
+            view = _NonRoundRange(lo, hi)
+            assert list(view) == expected
+            assert view[-1:] == expected[-1:]
+
+    def test_batch_reproducible(self) -> None:
+        """Test the same seed gives the same batch."""
+        spec = VariableSpec(type="int", min=1, max=1000)
+        assert VariableGenerator(seed=7).generate_batch(spec, 20) == VariableGenerator(
+            seed=7
+        ).generate_batch(spec, 20)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 from chuk_virtual_expert_arithmetic.vocab import Vocab, get_vocab
 
 
@@ -19,6 +22,23 @@ class TestVocabSingleton:
         vocab = get_vocab()
         assert vocab is Vocab()
 
+    def test_loaded_strings_are_interned(self) -> None:
+        """Test string values in loaded vocab are the interned objects."""
+        vocab = Vocab()
+        name = vocab.get("names.male")[0]
+        subject = vocab.get("names.pronouns.female")["subject"]
+        for value in (name, subject):
+            assert sys.intern(value) is value
+
+    def test_import_does_not_load_vocab(self) -> None:
+        """Test vocab files are read on first use, not at package import."""
+        code = (
+            "import chuk_virtual_expert_arithmetic\n"
+            "from chuk_virtual_expert_arithmetic.vocab import Vocab\n"
+            "assert Vocab._instance is None\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 class TestVocabGet:
     """Tests for get method."""
@@ -36,6 +56,18 @@ class TestVocabGet:
         result = vocab.get("names.male.0")  # names.male is a list
         assert result is None
 
+    def test_get_sees_in_place_updates(self) -> None:
+        """Test repeated lookups reflect mutations of the loaded data."""
+        vocab = Vocab()
+        assert vocab.get("test_live.items") is None
+        vocab._cache["test_live"] = {"items": ["a"]}
+        try:
+            assert vocab.get("test_live.items") == ["a"]
+            vocab._cache["test_live"]["items"] = ["b"]
+            assert vocab.get("test_live.items") == ["b"]
+        finally:
+            del vocab._cache["test_live"]
+
 
 class TestVocabRandom:
     """Tests for random method."""
@@ -86,6 +118,21 @@ class TestVocabSubstitute:
         result = vocab.substitute("${a} and ${b}", a="X", b="Y")
         assert result == "X and Y"
 
+    def test_substitute_leaves_unknown_placeholders(self) -> None:
+        """Test placeholders without a value and literal braces are kept."""
+        vocab = Vocab()
+        result = vocab.substitute("${a} of {b} and ${c}", a=3)
+        assert result == "3 of {b} and ${c}"
+        assert vocab.substitute("${a}", b=1) == "${a}"
+
+    def test_substitute_repeated_and_edge_placeholders(self) -> None:
+        """Test placeholders at the ends and repeated keys all get filled."""
+        vocab = Vocab()
+        template = "${n} plus ${n} is ${total}"
+        assert vocab.substitute(template, n=2, total=4) == "2 plus 2 is 4"
+        # Cached split is reused with different values
+        assert vocab.substitute(template, n=3, total=6) == "3 plus 3 is 6"
+
 
 class TestVocabPattern:
     """Tests for pattern method."""
@@ -138,6 +185,41 @@ class TestVocabSelectWeightedTemplate:
         assert result in ["template1", "template2"]
 
 
+class TestVocabSelectWeightedTemplates:
+    """Tests for _select_weighted_templates batch method."""
+
+    def test_batch_from_weighted_templates(self) -> None:
+        """Test a batch draw returns n selections from the templates."""
+        vocab = Vocab()
+        templates = ["plain", {"text": "weighted", "weight": 3}]
+        results = vocab._select_weighted_templates(templates, 50)
+        assert len(results) == 50
+        assert set(results) <= {"plain", "weighted"}
+
+    def test_batch_from_non_list_and_empty(self) -> None:
+        """Test degenerate inputs mirror _select_weighted_template."""
+        vocab = Vocab()
+        assert vocab._select_weighted_templates("single", 2) == ["single", "single"]
+        assert vocab._select_weighted_templates([], 2) == ["", ""]
+
+    def test_cumulative_weights_cached_per_list(self) -> None:
+        """Test cumulative weights are computed once per template list."""
+        vocab = Vocab()
+        templates = ["a", {"text": "b", "weight": 3}, {"text": "c"}]
+        texts, cum = vocab._template_cum_weights(templates)
+        assert texts == ["a", "b", "c"]
+        assert cum == [1, 4, 5]
+        assert vocab._template_cum_weights(templates)[1] is cum
+
+    def test_cumulative_weights_not_shared_between_lists(self) -> None:
+        """Test an equal-looking list with a different identity is recomputed."""
+        vocab = Vocab()
+        first = vocab._template_cum_weights(["a", "b"])[1]
+        second = vocab._template_cum_weights(["a", {"text": "b", "weight": 9}])[1]
+        assert first == [1, 2]
+        assert second == [1, 10]
+
+
 class TestVocabRandomPair:
     """Tests for random_pair method."""
 
@@ -196,6 +278,33 @@ class TestVocabListPaths:
         assert isinstance(paths, list)
         assert all(p.startswith("names.") for p in paths)
 
+    def test_list_paths_nested_prefix(self) -> None:
+        """Test list_paths descends into dotted prefixes."""
+        vocab = Vocab()
+        paths = vocab.list_paths("names.pronouns")
+        assert "names.pronouns.female" in paths
+        assert all(vocab.get(p) is not None for p in paths)
+        assert vocab.list_paths("names.male") == []
+
+    def test_list_paths_recursive(self) -> None:
+        """Test recursive listing reaches nested leaves without entering lists."""
+        vocab = Vocab()
+        paths = vocab.list_paths("names", recursive=True)
+        assert "names.pronouns" in paths
+        assert "names.pronouns.female.subject" in paths
+        assert "names.male" in paths
+        assert not any(p.startswith("names.male.") for p in paths)
+        assert len(paths) == len(set(paths))
+
+    def test_list_paths_recursive_root_and_leaf(self) -> None:
+        """Test recursive listing from the root and from a non-dict prefix."""
+        vocab = Vocab()
+        everything = vocab.list_paths(recursive=True)
+        assert set(vocab.all_keys()) <= set(everything)
+        assert "names.pronouns.male" in everything
+        assert vocab.list_paths("names.male", recursive=True) == []
+        assert vocab.list_paths("nonexistent", recursive=True) == []
+
     def test_list_paths_nonexistent_prefix(self) -> None:
         """Test list_paths with nonexistent prefix."""
         vocab = Vocab()
@@ -219,6 +328,26 @@ class TestVocabColoredMaterial:
         # Should fallback to "material"
         assert isinstance(result, str)
 
+    def test_colored_material_draws_from_product(self) -> None:
+        """Test phrases combine one basic color with one material of the type."""
+        vocab = Vocab()
+        colors = vocab.get("colors.basic")
+        materials = vocab.get("materials.craft")
+        expected = {f"{c} {m}" for c in colors for m in materials}
+        results = {vocab.colored_material("craft") for _ in range(50)}
+        assert results <= expected
+
+    def test_colored_material_sees_patched_colors(self) -> None:
+        """Test the phrase cache follows replaced color lists."""
+        vocab = Vocab()
+        vocab.colored_material()
+        original_colors = vocab._cache["colors"]
+        vocab._cache["colors"] = {"basic": ["teal"]}
+        try:
+            assert vocab.colored_material().startswith("teal ")
+        finally:
+            vocab._cache["colors"] = original_colors
+
 
 class TestVocabLabeledContainer:
     """Tests for labeled_container method."""
@@ -324,6 +453,38 @@ class TestVocabPersonWithPronouns:
         assert "reflexive" in result
         assert "verb_s" in result
 
+    def test_person_with_pronouns_fresh_dicts(self) -> None:
+        """Test each call returns an independent dict with matching pronouns."""
+        vocab = Vocab()
+        people = [vocab.person_with_pronouns() for _ in range(30)]
+        people[0]["name"] = "Changed"
+        assert all(p["name"] != "Changed" for p in people[1:])
+        for person in people[1:]:
+            gender = next(
+                g
+                for g in ("male", "female", "neutral")
+                if vocab.get(f"names.pronouns.{g}")["subject"] == person["subject"]
+            )
+            assert person["verb_s"] == ("" if gender == "neutral" else "s")
+
+    def test_person_with_pronouns_follows_replaced_pronouns(self) -> None:
+        """Test the pronoun prototype is rebuilt when pronoun data changes."""
+        vocab = Vocab()
+        vocab.person_with_pronouns()
+        original_names = vocab._cache["names"]
+        vocab._cache["names"] = {
+            **original_names,
+            "pronouns": {
+                g: {"subject": "xe", "object": "xem", "possessive": "xyr"}
+                for g in ("male", "female", "neutral")
+            },
+        }
+        try:
+            person = vocab.person_with_pronouns()
+            assert (person["subject"], person["reflexive"]) == ("xe", "themselves")
+        finally:
+            vocab._cache["names"] = original_names
+
 
 class TestVocabActivityContext:
     """Tests for activity_context method."""
@@ -355,6 +516,12 @@ class TestVocabArticles:
         vocab = Vocab()
         assert vocab.a_an("") == "a"
 
+    def test_a_an_uppercase(self) -> None:
+        """Test a_an ignores the case of the first letter."""
+        vocab = Vocab()
+        assert vocab.a_an("Orange") == "an"
+        assert vocab.a_an("Banana") == "a"
+
     def test_with_article(self) -> None:
         """Test with_article."""
         vocab = Vocab()